@@ -1,14 +1,21 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-from .pca import PCAshiny
-from .ca import CAshiny
-from .mca import MCAshiny
-from .famd import FAMDshiny
-from .mfa import MFAshiny
-from .mfaqual import MFAQUALshiny
-from .mfamix import MFAMIXshiny
-from .mfact import MFACTshiny
+import importlib
+
+# Apps are imported on first access : using one app does not load the modules (and dependencies) of the others
+_APPS = {"PCAshiny" : "pca","CAshiny" : "ca","MCAshiny" : "mca","FAMDshiny" : "famd","MFAshiny" : "mfa",
+         "MFAQUALshiny" : "mfaqual","MFAMIXshiny" : "mfamix","MFACTshiny" : "mfact"}
+
+__all__ = list(_APPS)
+
+def __getattr__(name):
+    if name in _APPS:
+        return getattr(importlib.import_module("."+_APPS[name],__name__),name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted([*globals(),*_APPS])
 
 __version__ = "0.0.2"
 __name__ = "scientistshiny"
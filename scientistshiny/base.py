@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 from shiny import App, run_app
-import nest_asyncio
+import asyncio
 import uvicorn
 
 class Base:
+    # No instance attributes : apps declaring __slots__ have no per-instance dict
+    __slots__ = ()
+
     def __init__(self,model=None):
         pass
     def run(self,**kwargs):
@@ -14,18 +17,39 @@ class Base:
         Parameters
         ----------
         kwargs : objet = {}. See https://shiny.posit.co/py/api/App.html
+
+        Notes
+        -----
+        The server runs on the asyncio event loop (Shiny does not support uvloop). HTTP requests are parsed with httptools when it is installed (pip install httptools), with h11 otherwise.
         """
         app = App(ui=self.app_ui, server=self.app_server)
         return run_app(app=app,launch_browser=True,**kwargs)
     
     # Run with notebooks
-    def run_notebooks(self,**kwargs):
+    def run_notebooks(self,host="127.0.0.1",port=8000,**kwargs):
         """
         Run the app on jupiter notebooks
         --------------------------------
+
+        Parameters
+        ----------
+        host : str, default = "127.0.0.1". The address that the app should listen on.
+
+        port : int, default = 8000. The port that the app should listen on.
+
+        kwargs : objet = {}. See https://www.uvicorn.org/settings/
         """
-        nest_asyncio.apply()
-        uvicorn.run(self.run(**kwargs))
+        app = App(ui=self.app_ui, server=self.app_server)
+        # asyncio loop : nest_asyncio only patches asyncio loops, and Shiny does not support uvloop.
+        # http="auto" picks httptools when it is installed
+        config = uvicorn.Config(app,host=host,port=port,loop="asyncio",**kwargs)
+        server = uvicorn.Server(config)
+        loop = asyncio.get_event_loop()
+        # Jupyter already runs the loop : only then is it patched to be re-entrant (nest_asyncio slows every task step)
+        if loop.is_running():
+            import nest_asyncio
+            nest_asyncio.apply(loop)
+        loop.run_until_complete(server.serve())
     
     # Stop App
     def stop(self):
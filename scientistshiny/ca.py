@@ -1,14 +1,266 @@
 # -*- coding: utf-8 -*-
 from shiny import Inputs, Outputs, Session, render, ui, reactive
 import shinyswatch
+from dataclasses import dataclass
+from functools import lru_cache, partial
+import weakref
 import numpy as np
 import pandas as pd
 import plotnine as pn
-import matplotlib.colors as mcolors
-from scientisttools import CA,fviz_ca_row,fviz_ca_col,fviz_eig, fviz_contrib,fviz_cos2, fviz_corrcircle
 from scientistshiny.base import Base
 from scientistshiny.function import *
 
+# Results choices
+_RESULT_CHOICES = {"coord":"Coordonnées","contrib":"Contributions","cos2":"Cos2 - Qualité de la représentation"}
+_SUP_CHOICES = {"coord":"Coordonnées","cos2":"Cos2 - Qualité de la représentation"}
+_QUALI_SUP_CHOICES = {"coord":"Coordonnées","cos2":"Cos2 - Qualité de la représentation","vtest":"Value-test","eta2" : "Eta2 - Rapport de corrélation"}
+
+# JavaScript predicates of the server-side conditional panels
+_PRED_FVIZ_QUANTI_SUP = "input.fviz_choice === 'fviz_quanti_sup'"
+_PRED_BAR_PLOT = "input.resume_choice === 'bar_plot'"
+_PRED_SUP_RES = {x : "input.value_choice == '"+x+"_res'" for x in ["row_sup","col_sup","quanti_sup","quali_sup"]}
+_PRED_SUP_CHOICE = {x : {y : "input."+x+"_choice === '"+y+"'" for y in _QUALI_SUP_CHOICES} for x in ["row_sup","col_sup","quanti_sup","quali_sup"]}
+
+# Supplementary elements of the model (rows, columns, quantitative and qualitative variables)
+_SUP_ATTRS = ("row_sup_","col_sup_","quanti_sup_","quali_sup_")
+
+def _sup_flags(model):
+    return tuple(hasattr(model,x) for x in _SUP_ATTRS)
+
+#-------------------------------------------------------------------------------------------------------
+## Factor maps, built from the model and the graphical parameters (plotnine copies the figure when drawing).
+## The builders are cached per app in CAshiny : the caches go away with the app, and never hold another model
+#-------------------------------------------------------------------------------------------------------
+# Graphical parameters of the factor maps (hashable : they are the cache keys). Parameters that the color mode
+# does not use are left to None.
+@dataclass(frozen=True,slots=True)
+class _RowState:
+    axis1 : int
+    axis2 : int
+    color_mode : str
+    actif_color : str | None
+    sup_color : str | None
+    quali_sup_color : str | None
+    var_quant : str | None
+    var_qual : str | None
+    add_ellipse : bool | None
+    text_size : float
+    lim_contrib : float
+    lim_cos2 : float
+    title : str
+    repel : bool
+
+@dataclass(frozen=True,slots=True)
+class _ColState:
+    axis1 : int
+    axis2 : int
+    color_mode : str
+    actif_color : str | None
+    sup_color : str | None
+    text_size : float
+    lim_contrib : float
+    lim_cos2 : float
+    title : str
+    repel : bool
+
+# scientisttools (and scikit-learn, scipy behind it) is only imported when needed : fitting a CA or drawing
+def _build_row_fig(model,state):
+    from scientisttools import fviz_ca_row
+    row_sup, _, _, quali_sup = _sup_flags(model)
+    kwargs = dict(self=model,axis=[state.axis1,state.axis2],row_sup=row_sup,quali_sup=quali_sup,
+                  text_size=state.text_size,lim_contrib=state.lim_contrib,lim_cos2=state.lim_cos2,title=state.title,repel=state.repel,ggtheme=PLOT_THEME)
+    color_mode = state.color_mode
+    if color_mode == "actif/sup":
+        kwargs.update(color=state.actif_color,color_sup=state.sup_color,color_quali_sup=state.quali_sup_color)
+    elif color_mode in ("cos2","contrib"):
+        kwargs.update(color=color_mode)
+    elif color_mode == "var_quant":
+        kwargs.update(color=state.var_quant,legend_title=state.var_quant)
+    elif color_mode == "var_qual":
+        kwargs.update(habillage=state.var_qual,add_ellipses=state.add_ellipse)
+    return fviz_ca_row(**kwargs)
+
+def _build_col_fig(model,state):
+    from scientisttools import fviz_ca_col
+    kwargs = dict(self=model,axis=[state.axis1,state.axis2],col_sup=_sup_flags(model)[1],
+                  text_size=state.text_size,lim_contrib=state.lim_contrib,lim_cos2=state.lim_cos2,title=state.title,repel=state.repel,ggtheme=PLOT_THEME)
+    if state.color_mode == "actif/sup":
+        kwargs.update(color=state.actif_color,color_sup=state.sup_color)
+    elif state.color_mode in ("cos2","contrib"):
+        kwargs.update(color=state.color_mode)
+    return fviz_ca_col(**kwargs)
+
+def _build_quanti_sup_fig(model,axis1,axis2,color,title,text_size):
+    from scientisttools import fviz_corrcircle
+    return fviz_corrcircle(self=model,axis=[axis1,axis2],color=color,title=title,text_size=text_size,ggtheme=PLOT_THEME)
+
+#-------------------------------------------------------------------------------------------------------
+## Scree plot and contributions/cosines maps, built from the model and the graphical parameters
+#-------------------------------------------------------------------------------------------------------
+def _build_eig_fig(model,choice,add_labels):
+    from scientisttools import fviz_eig
+    return fviz_eig(self=model,choice=choice,add_labels=add_labels,ggtheme=PLOT_THEME)
+
+def _build_contrib_fig(model,choice,axis,top,color,bar_width):
+    from scientisttools import fviz_contrib
+    return fviz_contrib(self=model,choice=choice,axis=axis,top_contrib=top,color=color,bar_width=bar_width,ggtheme=PLOT_THEME)
+
+def _build_cos2_fig(model,choice,axis,top,color,bar_width):
+    from scientisttools import fviz_cos2
+    return fviz_cos2(self=model,choice=choice,axis=axis,top_cos2=top,color=color,bar_width=bar_width,ggtheme=PLOT_THEME)
+
+#-------------------------------------------------------------------------------------------------------
+## App UI
+#-------------------------------------------------------------------------------------------------------
+def _build_app_ui(model):
+    has_row_sup, has_col_sup, has_quanti_sup, has_quali_sup = _sup_flags(model)
+
+    graph_choices = {"fviz_row": "Points lignes","fviz_col" : "Points colonnes"}
+
+    row_text_color_choices = {"actif/sup": "actifs/supplémentaires","cos2":"Cosinus","contrib":"Contribution"}
+
+    # Initialise value choice
+    value_choices = {"eigen_res":"Valeurs propres","col_res":"Résultats pour les colonnes","row_res":"Résultats pour les lignes"}
+
+    # Resume choices
+    resumes_choices = {"x/y":"Distributions conditionelles (X/Y)","y/x":"Distributions conditionnelles (Y/X)"}
+
+    # Update check if supplementary rows
+    if has_row_sup:
+        value_choices = {**value_choices,**{"row_sup_res":"Résultats pour les lignes supplémentaires"}}
+
+    # Check if supplementary columns
+    if has_col_sup:
+        value_choices = {**value_choices,**{"col_sup_res":"Résultats pour les colonnes supplémentaires"}}
+
+    # Check if supplementary quantitatives columns
+    if has_quanti_sup:
+        graph_choices = {**graph_choices,"fviz_quanti_sup" : "Variables quantitatives"}
+        row_text_color_choices = {**row_text_color_choices,**{"var_quant" : "Variable quantitative"}}
+        value_choices = {**value_choices,**{"quanti_sup_res":"Résultats pour les variables quantitatives supplémentaires"}}
+        resumes_choices = {**resumes_choices,**{"hist" : "Histogramme"}}
+
+    # Check if supplementary qualitatives columns
+    if has_quali_sup:
+        row_text_color_choices = {**row_text_color_choices,**{"var_qual" : "Variable qualitative"}}
+        value_choices = {**value_choices,**{"quali_sup_res":"Résultats pour les variables qualitatives supplémentaires"}}
+        resumes_choices = {**resumes_choices,**{"bar_plot" : "Diagramme en barres"}}
+
+    # App UI
+    return ui.page_fluid(
+        ui.include_css(css_path),
+        shinyswatch.theme.superhero(),
+        header(title="Analyse Factorielle des Correspondances",model_name="CA"),
+        ui.page_sidebar(
+            ui.sidebar(
+                ui.panel_well(
+                    ui.h6("Options graphiques",style="text-align : center"),
+                    ui.div(ui.h6("Axes"),style="display: inline-block;padding: 5px"),
+                    axes_input_select(model=model),
+                    ui.br(),
+                    ui.div(ui.input_select(id="fviz_choice",label="",choices=graph_choices,selected="fviz_row",multiple=False,width="100%")),
+                    ui.panel_conditional("input.fviz_choice === 'fviz_row'",
+                        title_input(id="row_title",value="Row points - CA"),
+                        text_size_input(which="row"),
+                        point_select_input(id="row_point_select"),
+                        ui.panel_conditional("input.row_point_select === 'cos2'",ui.div(lim_cos2(id="row_lim_cos2"),align="center")),
+                        ui.panel_conditional("input.row_point_select === 'contrib'",ui.div(lim_contrib(id="row_lim_contrib"),align="center")),
+                        text_color_input(id="row_text_color",choices=row_text_color_choices),
+                        ui.panel_conditional("input.row_text_color === 'actif/sup'",
+                            ui.input_select(id="row_text_actif_color",label="Points lignes actifs",choices=CSS4_DICT,selected="black",multiple=False,width="100%"),
+                            ui.output_ui("row_text_sup"),
+                            ui.output_ui("row_text_quali_sup")
+                        ),
+                        ui.panel_conditional("input.row_text_color === 'var_quant'",ui.output_ui("row_text_var_quant")),
+                        ui.panel_conditional("input.row_text_color === 'var_qual'",ui.output_ui("row_text_var_qual")),
+                        ui.input_switch(id="row_plot_repel",label="repel",value=True)
+                    ),
+                    ui.panel_conditional("input.fviz_choice ==='fviz_col'",
+                        title_input(id="col_title",value="Columns points - CA"),
+                        text_size_input(which="col"),
+                        point_select_input(id="col_point_select"),
+                        ui.panel_conditional("input.col_point_select === 'cos2'",ui.div(lim_cos2(id="col_lim_cos2"),align="center")),
+                        ui.panel_conditional("input.col_point_select === 'contrib'",ui.div(lim_contrib(id="col_lim_contrib"),align="center")),
+                        text_color_input(id="col_text_color",choices={"actif/sup" : "actif/supplémentaire","cos2":"Cosinus","contrib":"Contribution"}),
+                        ui.panel_conditional("input.col_text_color ==='actif/sup'",
+                            ui.input_select(id="col_text_actif_color",label="Points colonnes actives",choices=CSS4_DICT,selected="black",multiple=False,width="100%"),
+                            ui.output_ui("col_text_sup")
+                        ),
+                        ui.input_switch(id="col_plot_repel",label="repel",value=True)
+                    ),
+                    ui.output_ui("quanti_sup_fviz")
+                ),
+                ui.div(ui.input_action_button(id="exit",label="Quitter l'application",style='padding:5px; background-color: #fcac44;text-align:center;white-space: normal;'),align="center"),
+                width="25%"
+            ),
+            ui.navset_card_tab(
+                ui.nav_panel("Graphes",
+                    ui.row(
+                        ui.column(6,
+                            ui.div(ui.output_plot("fviz_row_plot",width='100%',height="600px",fill=True),align="center"),
+                            ui.hr(),
+                            ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px"),
+                            ui.div(ui.download_button(id="download_row_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;"),
+                            ui.div(ui.download_button(id="download_row_plot_png",label="png",style = download_btn_style),style="display: inline-block;"),
+                            ui.div(ui.download_button(id="download_row_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;"),
+                            align="center"
+                        ),
+                        ui.column(6,
+                            ui.div(ui.output_plot("fviz_col_plot",width='100%',height="600px"),align="center"),
+                            ui.hr(),
+                            ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px",align="center"),
+                            ui.div(ui.download_button(id="download_col_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;",align="center"),
+                            ui.div(ui.download_button(id="download_col_plot_png",label="png",style = download_btn_style),style="display: inline-block;",align="center"),
+                            ui.div(ui.download_button(id="download_col_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;",align="center"),
+                            align="center"
+                        )
+                    ),
+                    ui.output_plot("quanti_sup_plot")
+                ),
+                ui.nav_panel("Valeurs",
+                    ui.input_radio_buttons(id="value_choice",label=ui.h6("Quelles sorties voulez-vous?"),choices=value_choices,inline=True),
+                    ui.br(),
+                    eigen_panel(),
+                    ui.panel_conditional("input.value_choice === 'col_res'",
+                        ui.input_radio_buttons(id="col_choice",label=ui.h6("Quel type de résultats?"),choices=_RESULT_CHOICES,selected="coord",width="100%",inline=True),
+                        ui.panel_conditional("input.col_choice === 'coord'",panel_conditional1(text="col",name="coord")),
+                        ui.panel_conditional("input.col_choice === 'contrib'",panel_conditional2(text="col",name="contrib")),
+                        ui.panel_conditional("input.col_choice === 'cos2'",panel_conditional2(text="col",name="cos2"))
+                    ),
+                    ui.panel_conditional("input.value_choice === 'row_res'",
+                        ui.input_radio_buttons(id="row_choice",label=ui.h6("Quel type de résultats?"),choices=_RESULT_CHOICES,selected="coord",width="100%",inline=True),
+                        ui.panel_conditional("input.row_choice === 'coord'",panel_conditional1(text="row",name="coord")),
+                        ui.panel_conditional("input.row_choice === 'contrib'",panel_conditional2(text="row",name="contrib")),
+                        ui.panel_conditional("input.row_choice === 'cos2'",panel_conditional2(text="row",name="cos2"))
+                    ),
+                    ui.output_ui("row_sup_panel"),
+                    ui.output_ui("col_sup_panel"),
+                    ui.output_ui("quanti_sup_panel"),
+                    ui.output_ui("quali_sup_panel")
+                ),
+                ui.nav_panel("Résumé du jeu de données",
+                    ui.input_radio_buttons(id="resume_choice",label=ui.h6("Quel type de distributions?"),choices=resumes_choices,selected="x/y",width="100%",inline=True),
+                    ui.br(),
+                    ui.panel_conditional("input.resume_choice === 'x/y'",panel_conditional1(text="cond_dist",name="one")),
+                    ui.panel_conditional("input.resume_choice === 'y/x'",panel_conditional1(text="cond_dist",name="two")),
+                    ui.output_ui("quali_sup_graph")
+                ),
+                ui.nav_panel("Données",panel_conditional1(text="overall",name="data"))
+            )
+        )
+    )
+
+# App UI of each fitted model : creating the app again from the same model (e.g. re-running a notebook cell) reuses it.
+# Entries go away with their model, and keep the call_ of the fit they were built from : a refit replaces it, so the UI is rebuilt
+_APP_UI_CACHE = weakref.WeakKeyDictionary()
+
+def _app_ui(model):
+    call, app_ui = _APP_UI_CACHE.get(model,(None,None))
+    if call is not model.call_:
+        app_ui = _build_app_ui(model)
+        _APP_UI_CACHE[model] = (model.call_,app_ui)
+    return app_ui
+
 class CAshiny(Base):
     """
     Correspondance Analysis (CA) with scientistshiny
@@ -71,249 +323,222 @@ class CAshiny(Base):
     def __init__(self,model=None):
         # Check if model is an instance of pd.DataFrame class
         if isinstance(model,pd.DataFrame):        
-            # Check if qualitative data
-            is_quali = model.select_dtypes(exclude=np.number)
-            if is_quali.shape[1]>0:
-                for col in is_quali.columns.tolist():
-                    model[col] = model[col].astype("object")
-                quali_sup = [model.columns.tolist().index(x) for x in model.columns if x in is_quali.columns]
+            # Check if qualitative data : one pass over the dtypes (same test as select_dtypes(exclude=np.number))
+            quali_sup = [i for i, x in enumerate(model.dtypes) if not issubclass(x.type,np.number)]
+            if quali_sup:
+                quali_cols = model.columns[quali_sup]
+                model[quali_cols] = model[quali_cols].astype("object")
             else:
                 quali_sup = None
             
             # Fit the CA with scientisttools
+            from scientisttools import CA
             model = CA(quali_sup=quali_sup).fit(model)
 
         # Check if model is Correspondence Analysis (CA)
         if model.model_ != "ca":
             raise TypeError("'model' must be an object of class CA")
         
-        graph_choices = {"fviz_row": "Points lignes","fviz_col" : "Points colonnes"}
-
-        row_text_color_choices = {"actif/sup": "actifs/supplémentaires","cos2":"Cosinus","contrib":"Contribution"}
-
-        # Initialise value choice
-        value_choices = {"eigen_res":"Valeurs propres","col_res":"Résultats pour les colonnes","row_res":"Résultats pour les lignes"}
+        # Resolve supplementary elements once
+        has_row_sup, has_col_sup, has_quanti_sup, has_quali_sup = _sup_flags(model)
 
-        # Resume choices
-        resumes_choices = {"x/y":"Distributions conditionelles (X/Y)","y/x":"Distributions conditionnelles (Y/X)"}
-
-        # Update check if supplementary rows
-        if hasattr(model,"row_sup_"):
-            value_choices = {**value_choices,**{"row_sup_res":"Résultats pour les lignes supplémentaires"}}
-
-        # Check if supplementary columns
-        if hasattr(model,"col_sup_"):
-            value_choices = {**value_choices,**{"col_sup_res":"Résultats pour les colonnes supplémentaires"}}
-
-        # Check if supplementary quantitatives columns
-        if hasattr(model,"quanti_sup_"):
-            graph_choices = {**graph_choices,"fviz_quanti_sup" : "Variables quantitatives"}
-            row_text_color_choices = {**row_text_color_choices,**{"var_quant" : "Variable quantitative"}}
-            value_choices = {**value_choices,**{"quanti_sup_res":"Résultats pour les variables quantitatives supplémentaires"}}
-            resumes_choices = {**resumes_choices,**{"hist" : "Histogramme"}}
-
-        # Check if supplementary qualitatives columns
-        if hasattr(model,"quali_sup_"):
-            row_text_color_choices = {**row_text_color_choices,**{"var_qual" : "Variable qualitative"}}
-            value_choices = {**value_choices,**{"quali_sup_res":"Résultats pour les variables qualitatives supplémentaires"}}
-            resumes_choices = {**resumes_choices,**{"bar_plot" : "Diagramme en barres"}}
+        # Supplementary variables labels and select choices
+        quanti_sup_labels = tuple(model.quanti_sup_["coord"].index) if has_quanti_sup else ()
+        quali_sup_labels = tuple(model.quali_sup_["eta2"].index) if has_quali_sup else ()
+        quanti_sup_choices = {x : x for x in quanti_sup_labels}
+        quali_sup_choices = {x : x for x in quali_sup_labels}
 
         # App UI
-        app_ui = ui.page_fluid(
-            ui.include_css(css_path),
-            shinyswatch.theme.superhero(),
-            header(title="Analyse Factorielle des Correspondances",model_name="CA"),
-            ui.page_sidebar(
-                ui.sidebar(
-                    ui.panel_well(
-                        ui.h6("Options graphiques",style="text-align : center"),
-                        ui.div(ui.h6("Axes"),style="display: inline-block;padding: 5px"),
-                        axes_input_select(model=model),
-                        ui.br(),
-                        ui.div(ui.input_select(id="fviz_choice",label="",choices=graph_choices,selected="fviz_row",multiple=False,width="100%")),
-                        ui.panel_conditional("input.fviz_choice === 'fviz_row'",
-                            title_input(id="row_title",value="Row points - CA"),
-                            text_size_input(which="row"),
-                            point_select_input(id="row_point_select"),
-                            ui.panel_conditional("input.row_point_select === 'cos2'",ui.div(lim_cos2(id="row_lim_cos2"),align="center")),
-                            ui.panel_conditional("input.row_point_select === 'contrib'",ui.div(lim_contrib(id="row_lim_contrib"),align="center")),
-                            text_color_input(id="row_text_color",choices=row_text_color_choices),
-                            ui.panel_conditional("input.row_text_color === 'actif/sup'",
-                                ui.input_select(id="row_text_actif_color",label="Points lignes actifs",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"),
-                                ui.output_ui("row_text_sup"),
-                                ui.output_ui("row_text_quali_sup")
-                            ),
-                            ui.panel_conditional("input.row_text_color === 'var_quant'",ui.output_ui("row_text_var_quant")),
-                            ui.panel_conditional("input.row_text_color === 'var_qual'",ui.output_ui("row_text_var_qual")),
-                            ui.input_switch(id="row_plot_repel",label="repel",value=True)
-                        ),
-                        ui.panel_conditional("input.fviz_choice ==='fviz_col'",
-                            title_input(id="col_title",value="Columns points - CA"),
-                            text_size_input(which="col"),
-                            point_select_input(id="col_point_select"),
-                            ui.panel_conditional("input.col_point_select === 'cos2'",ui.div(lim_cos2(id="col_lim_cos2"),align="center")),
-                            ui.panel_conditional("input.col_point_select === 'contrib'",ui.div(lim_contrib(id="col_lim_contrib"),align="center")),
-                            text_color_input(id="col_text_color",choices={"actif/sup" : "actif/supplémentaire","cos2":"Cosinus","contrib":"Contribution"}),
-                            ui.panel_conditional("input.col_text_color ==='actif/sup'",
-                                ui.input_select(id="col_text_actif_color",label="Points colonnes actives",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"),
-                                ui.output_ui("col_text_sup")
-                            ),
-                            ui.input_switch(id="col_plot_repel",label="repel",value=True)
-                        ),
-                        ui.output_ui("quanti_sup_fviz")
-                    ),
-                    ui.div(ui.input_action_button(id="exit",label="Quitter l'application",style='padding:5px; background-color: #fcac44;text-align:center;white-space: normal;'),align="center"),
-                    width="25%"
-                ),
-                ui.navset_card_tab(
-                    ui.nav_panel("Graphes",
-                        ui.row(
-                            ui.column(6,
-                                ui.div(ui.output_plot("fviz_row_plot",width='100%',height="600px",fill=True),align="center"),
-                                ui.hr(),
-                                ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px"),
-                                ui.div(ui.download_button(id="download_row_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;"),
-                                ui.div(ui.download_button(id="download_row_plot_png",label="png",style = download_btn_style),style="display: inline-block;"),
-                                ui.div(ui.download_button(id="download_row_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;"),
-                                align="center"
-                            ),
-                            ui.column(6,
-                                ui.div(ui.output_plot("fviz_col_plot",width='100%',height="600px"),align="center"),
-                                ui.hr(),
-                                ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px",align="center"),
-                                ui.div(ui.download_button(id="download_col_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;",align="center"),
-                                ui.div(ui.download_button(id="download_col_plot_png",label="png",style = download_btn_style),style="display: inline-block;",align="center"),
-                                ui.div(ui.download_button(id="download_col_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;",align="center"),
-                                align="center"
-                            )
-                        ),
-                        ui.output_plot("quanti_sup_plot")
-                    ),
-                    ui.nav_panel("Valeurs",
-                        ui.input_radio_buttons(id="value_choice",label=ui.h6("Quelles sorties voulez-vous?"),choices=value_choices,inline=True),
-                        ui.br(),
-                        eigen_panel(),
-                        ui.panel_conditional("input.value_choice === 'col_res'",
-                            ui.input_radio_buttons(id="col_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","contrib":"Contributions","cos2":"Cos2 - Qualité de la représentation"},selected="coord",width="100%",inline=True),
-                            ui.panel_conditional("input.col_choice === 'coord'",panel_conditional1(text="col",name="coord")),
-                            ui.panel_conditional("input.col_choice === 'contrib'",panel_conditional2(text="col",name="contrib")),
-                            ui.panel_conditional("input.col_choice === 'cos2'",panel_conditional2(text="col",name="cos2"))
-                        ),
-                        ui.panel_conditional("input.value_choice === 'row_res'",
-                            ui.input_radio_buttons(id="row_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","contrib":"Contributions","cos2":"Cos2 - Qualité de la représentation"},selected="coord",width="100%",inline=True),
-                            ui.panel_conditional("input.row_choice === 'coord'",panel_conditional1(text="row",name="coord")),
-                            ui.panel_conditional("input.row_choice === 'contrib'",panel_conditional2(text="row",name="contrib")),
-                            ui.panel_conditional("input.row_choice === 'cos2'",panel_conditional2(text="row",name="cos2"))
+        app_ui = _app_ui(model)
+
+        # Figures of this app, cached on the graphical parameters : plotnine copies the plot when drawing, so a figure
+        # can be shared by the sessions. The caches belong to the app, and are released with it.
+        row_fig = lru_cache(maxsize=64)(partial(_build_row_fig,model))
+        col_fig = lru_cache(maxsize=64)(partial(_build_col_fig,model))
+        quanti_sup_fig = lru_cache(maxsize=64)(partial(_build_quanti_sup_fig,model))
+        eig_fig = lru_cache(maxsize=16)(partial(_build_eig_fig,model))
+        contrib_fig = lru_cache(maxsize=64)(partial(_build_contrib_fig,model))
+        cos2_fig = lru_cache(maxsize=64)(partial(_build_cos2_fig,model))
+
+        # Graph options and outputs of the supplementary elements : static, built once and shared by all sessions
+        graph_ui = {}
+        if has_row_sup:
+            graph_ui["row_text_sup"] = ui.TagList(ui.input_select(id="row_text_sup_color",label="Points lignes supplémentaires",choices=CSS4_DICT,selected="blue",multiple=False,width="100%"))
+        if has_col_sup:
+            graph_ui["col_text_sup"] = ui.TagList(ui.input_select(id="col_text_sup_color",label="Points colonnes supplémentaires",choices=CSS4_DICT,selected="blue",multiple=False,width="100%"))
+        if has_quanti_sup:
+            graph_ui["row_text_var_quant"] = ui.TagList(ui.input_select(id="row_text_var_quant_color",label="Choix de la variable",choices=quanti_sup_choices,selected=quanti_sup_labels[0],multiple=False))
+            graph_ui["quanti_sup_fviz"] = ui.panel_conditional(_PRED_FVIZ_QUANTI_SUP,
+                    title_input(id="quanti_sup_title",value="Correlation circle - MCA"),
+                    text_size_input(which="quanti_sup"),
+                    ui.input_select(id="quanti_sup_color",label="Variables quantitatives supplémentaires",choices=CSS4_DICT,selected="red",multiple=False,width="100%")
+                )
+            graph_ui["quanti_sup_plot"] = ui.TagList(
+                    ui.column(6,
+                        ui.div(ui.output_plot("fviz_quanti_sup_plot",width='100%', height='500px'),align="center"),
+                        ui.hr(),
+                        ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px",align="center"),
+                        ui.div(ui.download_button(id="download_quanti_sup_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;",align="center"),
+                        ui.div(ui.download_button(id="download_quanti_sup_plot_png",label="png",style = download_btn_style),style="display: inline-block;",align="center"),
+                        ui.div(ui.download_button(id="download_quanti_sup_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;",align="center"),
+                        align="center"
+                    )
+                )
+        if has_quali_sup:
+            graph_ui["row_text_quali_sup"] = ui.TagList(ui.input_select(id="row_text_quali_sup_color",label="Modalités supplémentaires",choices=CSS4_DICT,selected="red",multiple=False,width="100%"))
+            graph_ui["row_text_var_qual"] = ui.TagList(
+                    ui.input_select(id="row_text_var_qual_color",label="Choix de la variable",choices=quali_sup_choices,selected=quali_sup_labels[0],multiple=False,width="100%"),
+                    ui.input_switch(id="row_text_add_ellipse",label="Trace les ellipses de confiance autour des modalités",value=False)
+                )
+
+        # Results panels of the supplementary elements and bar plot panel : static, built once and shared by all sessions
+        panel_ui = {}
+        if has_row_sup:
+            panel_ui["row_sup_panel"] = ui.panel_conditional(_PRED_SUP_RES["row_sup"],
+                    ui.input_radio_buttons(id="row_sup_choice",label=ui.h6("Quel type de résultats?"),choices=_SUP_CHOICES,selected="coord",width="100%",inline=True),
+                    ui.panel_conditional(_PRED_SUP_CHOICE["row_sup"]["coord"],panel_conditional1(text="row_sup",name="coord")),
+                    ui.panel_conditional(_PRED_SUP_CHOICE["row_sup"]["cos2"],panel_conditional1(text="row_sup",name="cos2"))
+                )
+        if has_col_sup:
+            panel_ui["col_sup_panel"] = ui.panel_conditional(_PRED_SUP_RES["col_sup"],
+                    ui.input_radio_buttons(id="col_sup_choice",label=ui.h6("Quel type de résultats?"),choices=_SUP_CHOICES,selected="coord",width="100%",inline=True),
+                    ui.panel_conditional(_PRED_SUP_CHOICE["col_sup"]["coord"],panel_conditional1(text="col_sup",name="coord")),
+                    ui.panel_conditional(_PRED_SUP_CHOICE["col_sup"]["cos2"],panel_conditional1(text="col_sup",name="cos2"))
+                )
+        if has_quanti_sup:
+            panel_ui["quanti_sup_panel"] = ui.panel_conditional(_PRED_SUP_RES["quanti_sup"],
+                    ui.input_radio_buttons(id="quanti_sup_choice",label=ui.h6("Quel type de résultats?"),choices=_SUP_CHOICES,selected="coord",width="100%",inline=True),
+                    ui.panel_conditional(_PRED_SUP_CHOICE["quanti_sup"]["coord"],panel_conditional1(text="quanti_sup",name="coord")),
+                    ui.panel_conditional(_PRED_SUP_CHOICE["quanti_sup"]["cos2"],panel_conditional1(text="quanti_sup",name="cos2"))
+                )
+        if has_quali_sup:
+            panel_ui["quali_sup_panel"] = ui.panel_conditional(_PRED_SUP_RES["quali_sup"],
+                    ui.input_radio_buttons(id="quali_sup_choice",label=ui.h6("Quel type de résultats?"),choices=_QUALI_SUP_CHOICES,selected="coord",width="100%",inline=True),
+                    ui.panel_conditional(_PRED_SUP_CHOICE["quali_sup"]["coord"],panel_conditional1(text="quali_sup",name="coord")),
+                    ui.panel_conditional(_PRED_SUP_CHOICE["quali_sup"]["cos2"],panel_conditional1(text="quali_sup",name="cos2")),
+                    ui.panel_conditional(_PRED_SUP_CHOICE["quali_sup"]["vtest"],panel_conditional1(text="quali_sup",name="vtest")),
+                    ui.panel_conditional(_PRED_SUP_CHOICE["quali_sup"]["eta2"],panel_conditional1(text="quali_sup",name="eta2"))
+                )
+            panel_ui["quali_sup_graph"] = ui.panel_conditional(_PRED_BAR_PLOT,
+                    ui.row(
+                        ui.column(2,
+                            ui.input_select(id="quali_sup_label",label=ui.h6("Choisir une variable"),choices=quali_sup_choices,selected=quali_sup_labels[0])
                         ),
-                        ui.output_ui("row_sup_panel"),
-                        ui.output_ui("col_sup_panel"),
-                        ui.output_ui("quanti_sup_panel"),
-                        ui.output_ui("quali_sup_panel")
-                    ),
-                    ui.nav_panel("Résumé du jeu de données",
-                        ui.input_radio_buttons(id="resume_choice",label=ui.h6("Quel type de distributions?"),choices=resumes_choices,selected="x/y",width="100%",inline=True),
-                        ui.br(),
-                        ui.panel_conditional("input.resume_choice === 'x/y'",panel_conditional1(text="cond_dist",name="one")),
-                        ui.panel_conditional("input.resume_choice === 'y/x'",panel_conditional1(text="cond_dist",name="two")),
-                        ui.output_ui("quali_sup_graph")
-                    ),
-                    ui.nav_panel("Données",panel_conditional1(text="overall",name="data"))
+                        ui.column(10,
+                            ui.div(ui.output_plot(id="fviz_bar_plot",width='100%',height='500px'),align="center"),
+                            ui.hr(),
+                            ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px",align="center"),
+                            ui.div(ui.download_button(id="download_bar_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;",align="center"),
+                            ui.div(ui.download_button(id="download_bar_plot_png",label="png",style = download_btn_style),style="display: inline-block;",align="center"),
+                            ui.div(ui.download_button(id="download_bar_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;",align="center"),
+                            align="center"
+                        )
+                    )
                 )
-            )
-        )
+
+        # Results tables : rounded and labelled once, shared by all sessions. They stay in float64 : eigenvalues and
+        # inertias can exceed 1e3, where float32 no longer holds the 4 displayed decimals
+        eig = result_table(model.eig_,"dimensions")
+        eig.columns = eig.columns.str.capitalize()
+        tables = {"eigen" : eig,
+                  **{"col_"+x : result_table(model.col_[x],"Columns") for x in ["coord","contrib","cos2"]},
+                  **{"row_"+x : result_table(model.row_[x],"Rows") for x in ["coord","contrib","cos2"]}}
+        if has_col_sup:
+            tables.update({"col_sup_"+x : result_table(model.col_sup_[x],"Columns") for x in ["coord","cos2"]})
+        if has_row_sup:
+            tables.update({"row_sup_"+x : result_table(model.row_sup_[x],"Rows") for x in ["coord","cos2"]})
+        if has_quanti_sup:
+            tables.update({"quanti_sup_"+x : result_table(model.quanti_sup_[x],"Variables") for x in ["coord","cos2"]})
+        if has_quali_sup:
+            tables.update({"quali_sup_"+x : result_table(model.quali_sup_[x],"Categories") for x in ["coord","cos2","vtest"]})
+            tables["quali_sup_eta2"] = result_table(model.quali_sup_["eta2"],"Variables")
+
+        # Overall data
+        tables["overall_data"] = downcast_integers(categorize(model.call_["Xtot"].reset_index()))
+
+        # Conditional distributions : sums are computed once and totals are 100 by construction
+        X = model.call_["X"]
+        freq = X.to_numpy(dtype=float)
+        tables["cond_dist_one"] = result_table(pd.DataFrame(profiles(freq,axis=0,total=True),index=[*X.index,"Total"],columns=X.columns),"Rows")
+        tables["cond_dist_two"] = result_table(pd.DataFrame(profiles(freq,axis=1,total=True),index=X.index,columns=[*X.columns,"Total"]),"Rows")
+
+        # Displayed data of each table and display length (head, tail, all) : sliced once, whatever the filter switch
+        @lru_cache(maxsize=None)
+        def table_data(name,length):
+            return match_datalength(tables[name],length)
+
+        # Bar plot data : active rows of supplementary qualitative variables, as categorical
+        if has_quali_sup:
+            bar_data = model.call_["Xtot"].loc[model.call_["X"].index,list(quali_sup_labels)].astype("category")
+            # Bar plots, built once per variable
+            bar_plots = {}
+
+        # Axis choices : axes after (resp. before) each axis
+        all_axes = tuple(range(model.call_["n_components"]))
+        axis2_choices = [{i : i for i in all_axes[k+1:]} for k in all_axes]
+        axis1_choices = [{i : i for i in all_axes[:k]} for k in all_axes]
 
         def server(input:Inputs, output:Outputs, session:Session):
 
+            # Render timings of the session (debug logging only), logged when it ends
+            timings = {}
+            session.on_ended(lambda : log_timings(timings))
+
+            # Plots saved for the downloads of the session, in memory
+            saved = {}
+
             #----------------------------------------------------------------------------------------------
             # Disable x and y axis
             @reactive.Effect
             def _():
-                x = int(input.axis1())
-                Dim = [i for i in range(model.call_["n_components"]) if i > x]
-                ui.update_select(id="axis2",label="",choices={x : x for x in Dim},selected=Dim[0])
+                choices = axis2_choices[int(input.axis1())]
+                ui.update_select(id="axis2",label="",choices=choices,selected=next(iter(choices)))
 
             @reactive.Effect
             def _():
-                x = int(input.axis2())
-                Dim = [i for i in range(model.call_["n_components"]) if i < x]
-                ui.update_select(id="axis1",label="",choices={x : x for x in Dim},selected=Dim[0])
+                choices = axis1_choices[int(input.axis2())]
+                ui.update_select(id="axis1",label="",choices=choices,selected=next(iter(choices)))
 
             #--------------------------------------------------------------------------------------------------
             # Add supplementary rows color choice
-            if hasattr(model,"row_sup_"):
+            if has_row_sup:
                 @render.ui
                 def row_text_sup():
-                    return ui.TagList(ui.input_select(id="row_text_sup_color",label="Points lignes supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="blue",multiple=False,width="100%"))
+                    return graph_ui["row_text_sup"]
             
             #---------------------------------------------------------------------------------------------------
             # Add supplementary qualitative columns color choice
-            if hasattr(model,"quali_sup_"):
+            if has_quali_sup:
                 @render.ui
                 def row_text_quali_sup():
-                    return ui.TagList(ui.input_select(id="row_text_quali_sup_color",label="Modalités supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="red",multiple=False,width="100%"))
+                    return graph_ui["row_text_quali_sup"]
 
             #--------------------------------------------------------------------------------------------------------------
-            # Disable rows colors
-            if hasattr(model,"row_sup_") and hasattr(model,"quali_sup_"):
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="row_text_actif_color",label="Points lignes actifs",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.row_text_sup_color(),input.row_text_quali_sup_color()]]},selected="black")
-                
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="row_text_sup_color",label="Points lignes supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.row_text_actif_color(),input.row_text_quali_sup_color()]]},selected="blue")
-                
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="row_text_quali_sup_color",label="Modalités supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.row_text_actif_color(),input.row_text_sup_color()]]},selected="red")
-            elif hasattr(model,"row_sup_"):
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="row_text_actif_color",label="Points lignes actifs",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.row_text_sup_color()]},selected="black")
-                
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="row_text_sup_color",label="Points lignes supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.row_text_actif_color()]},selected="blue")
-            elif hasattr(model,"quali_sup_"):
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="row_text_actif_color",label="Points lignes actifs",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.row_text_quali_sup_color()]},selected="black")
-                
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="row_text_quali_sup_color",label="Modalités supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.row_text_actif_color()]},selected="red")
+            # Disable rows colors : each select excludes the colors chosen in the others
+            row_color_ids = ["row_text_actif_color",*(["row_text_sup_color"] if has_row_sup else []),*(["row_text_quali_sup_color"] if has_quali_sup else [])]
+            if len(row_color_ids) > 1:
+                exclusive_colors(input,row_color_ids,CSS4_NAMES)
 
             #---------------------------------------------------------------------------------------------------------------
-            if hasattr(model,"quanti_sup_"):
+            if has_quanti_sup:
                 @render.ui
                 def row_text_var_quant():
-                    quanti_sup_labels = model.quanti_sup_["coord"].index.tolist()
-                    return ui.TagList(ui.input_select(id="row_text_var_quant_color",label="Choix de la variable",choices={x:x for x in quanti_sup_labels},selected=quanti_sup_labels[0],multiple=False))
+                    return graph_ui["row_text_var_quant"]
                 
             #-------------------------------------------------------------------------------------------------
-            if hasattr(model,"quali_sup_"):
+            if has_quali_sup:
                 @render.ui
                 def row_text_var_qual():
-                    quali_sup_labels = model.quali_sup_["eta2"].index.tolist()
-                    return ui.TagList(
-                            ui.input_select(id="row_text_var_qual_color",label="Choix de la variable",choices={x:x for x in quali_sup_labels},selected=quali_sup_labels[0],multiple=False,width="100%"),
-                            ui.input_switch(id="row_text_add_ellipse",label="Trace les ellipses de confiance autour des modalités",value=False)
-                        )
+                    return graph_ui["row_text_var_qual"]
             
             #-----------------------------------------------------------------------------------------------
-            if hasattr(model,"col_sup_"):
+            if has_col_sup:
                 @render.ui
                 def col_text_sup():
-                    return ui.TagList(ui.input_select(id="col_text_sup_color",label="Points colonnes supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="blue",multiple=False,width="100%"))
+                    return graph_ui["col_text_sup"]
 
                 # Disable actifs and supplementary columns colors
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="col_text_actif_color",label="Points colonnes actifs",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.col_text_sup_color()]},selected="black")
-                
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="col_text_sup_color",label="Points colonnes supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.col_text_actif_color()]},selected="blue")
+                exclusive_colors(input,["col_text_actif_color","col_text_sup_color"],CSS4_NAMES)
 
             #--------------------------------------------------------------------------------
             ## Rows plot
@@ -321,85 +546,41 @@ class CAshiny(Base):
             # Reactive rows plot
             @reactive.Calc
             def plot_row():
-                if hasattr(model,"row_sup_"):
-                    row_sup = True
-                else:
-                    row_sup = False
-                
-                if hasattr(model,"quali_sup_"):
-                    quali_sup = True
-                else:
-                    quali_sup = False
-                
-                if input.row_text_color() == "actif/sup":
-                    if hasattr(model,"row_sup_"):
-                        color_sup = input.row_text_sup_color()
-                    else:
-                        color_sup = None
-                    
-                    if hasattr(model,"quali_sup_"):
-                        color_quali_sup = input.row_text_quali_sup_color()
-                    else:
-                        color_quali_sup = None
-                    
-                    fig = fviz_ca_row(self=model,
-                                      axis=[int(input.axis1()),int(input.axis2())],
-                                      color=input.row_text_actif_color(),
-                                      row_sup=row_sup,
-                                      color_sup = color_sup,
-                                      quali_sup=quali_sup,
-                                      color_quali_sup=color_quali_sup,
-                                      text_size = input.row_text_size(),
-                                      lim_contrib =input.row_lim_contrib(),
-                                      lim_cos2 = input.row_lim_cos2(),
-                                      title = input.row_title(),
-                                      repel=input.row_plot_repel())
-                elif input.row_text_color() in ["cos2","contrib"]:
-                    fig = fviz_ca_row(self=model,
-                                      axis=[int(input.axis1()),int(input.axis2())],
-                                      color=input.row_text_color(),
-                                      row_sup=row_sup,
-                                      quali_sup=quali_sup,
-                                      text_size = input.row_text_size(),
-                                      lim_contrib =input.row_lim_contrib(),
-                                      lim_cos2 = input.row_lim_cos2(),
-                                      title = input.row_title(),
-                                      repel=input.row_plot_repel())
-                elif input.row_text_color() == "var_quant":
-                    fig = fviz_ca_row(self=model,
-                                      axis=[int(input.axis1()),int(input.axis2())],
-                                      color=input.row_text_var_quant_color(),
-                                      row_sup=row_sup,
-                                      quali_sup=quali_sup,
-                                      text_size = input.row_text_size(),
-                                      lim_contrib =input.row_lim_contrib(),
-                                      lim_cos2 = input.row_lim_cos2(),
-                                      title = input.row_title(),
-                                      legend_title=input.row_text_var_quant_color(),
-                                      repel=input.row_plot_repel())
-                elif input.row_text_color() == "var_qual":
-                    fig = fviz_ca_row(self=model,
-                                      axis=[int(input.axis1()),int(input.axis2())],
-                                      habillage=input.row_text_var_qual_color(),
-                                      add_ellipses=input.row_text_add_ellipse(),
-                                      row_sup=row_sup,
-                                      quali_sup=quali_sup,
-                                      text_size = input.row_text_size(),
-                                      lim_contrib =input.row_lim_contrib(),
-                                      lim_cos2 = input.row_lim_cos2(),
-                                      title = input.row_title(),
-                                      repel=input.row_plot_repel())
-                return fig+pn.theme_gray()
+                color_mode = input.row_text_color()
+                actif_color = sup_color = quali_sup_color = var_quant = var_qual = add_ellipse = None
+                if color_mode == "actif/sup":
+                    actif_color = input.row_text_actif_color()
+                    if has_row_sup:
+                        sup_color = input.row_text_sup_color()
+                    if has_quali_sup:
+                        quali_sup_color = input.row_text_quali_sup_color()
+                elif color_mode == "var_quant":
+                    var_quant = input.row_text_var_quant_color()
+                elif color_mode == "var_qual":
+                    var_qual, add_ellipse = input.row_text_var_qual_color(), input.row_text_add_ellipse()
+                state = _RowState(int(input.axis1()),int(input.axis2()),color_mode,actif_color,sup_color,quali_sup_color,var_quant,var_qual,add_ellipse,
+                                  input.row_text_size(),input.row_lim_contrib(),input.row_lim_cos2(),input.row_title(),input.row_plot_repel())
+                return row_fig(state)
 
             # Render Rows plot
+            row_drawn = {}
             @render.plot(alt="Rows Factor Map - CA")
-            def fviz_row_plot():
-                return plot_row().draw()
+            @timed(timings)
+            async def fviz_row_plot():
+                return await draw_plot_async(plot_row(),row_drawn)
+
+            # Download Rows plot
+            @render.download(filename="Rows-Factor-Map.jpg")
+            async def download_row_plot_jpg():
+                yield await plot_bytes(plot_row(),"jpg",saved)
 
-            # Downlaod
-            # @session.download(filename="Rows-Factor-Map.png")
-            # def RowGraphDownloadPng():
-            #     return pw.load_ggplot(RowFactorPlot()).savefig("Rows-Factor-Map.png")
+            @render.download(filename="Rows-Factor-Map.png")
+            async def download_row_plot_png():
+                yield await plot_bytes(plot_row(),"png",saved)
+
+            @render.download(filename="Rows-Factor-Map.pdf")
+            async def download_row_plot_pdf():
+                yield await plot_bytes(plot_row(),"pdf",saved)
 
             #--------------------------------------------------------------------------------
             ## Columns plot
@@ -407,78 +588,70 @@ class CAshiny(Base):
             # Reactive Columns Plot
             @reactive.Calc
             def plot_col():
-                if hasattr(model,"col_sup_"):
-                    col_sup = True
-                else:
-                    col_sup = False
-
-                if input.col_text_color() == "actif/sup":
-                    if hasattr(model,"col_sup_"):
-                        color_sup = input.col_text_sup_color()
-                    else:
-                        color_sup = None
-
-                    fig = fviz_ca_col(self=model,
-                                      axis=[int(input.axis1()),int(input.axis2())],
-                                      title=input.col_title(),
-                                      color=input.col_text_actif_color(),
-                                      col_sup=col_sup,
-                                      color_sup=color_sup,
-                                      text_size=input.col_text_size(),
-                                      lim_contrib = input.col_lim_contrib(),
-                                      lim_cos2 = input.col_lim_cos2(),
-                                      repel=input.col_plot_repel())
-                elif input.col_text_color() in ["cos2","contrib"]:
-                    fig = fviz_ca_col(self=model,
-                                      axis=[int(input.axis1()),int(input.axis2())],
-                                      title=input.col_title(),
-                                      color=input.col_text_color(),
-                                      col_sup=col_sup,
-                                      text_size=input.col_text_size(),
-                                      lim_contrib = input.col_lim_contrib(),
-                                      lim_cos2 = input.col_lim_cos2(),
-                                      repel=input.col_plot_repel())
-                return fig+pn.theme_gray()
+                color_mode = input.col_text_color()
+                actif_color = sup_color = None
+                if color_mode == "actif/sup":
+                    actif_color = input.col_text_actif_color()
+                    if has_col_sup:
+                        sup_color = input.col_text_sup_color()
+                state = _ColState(int(input.axis1()),int(input.axis2()),color_mode,actif_color,sup_color,
+                                  input.col_text_size(),input.col_lim_contrib(),input.col_lim_cos2(),input.col_title(),input.col_plot_repel())
+                return col_fig(state)
 
             # Render Columns Plot
+            col_drawn = {}
             @render.plot(alt="Columns Factor Map - CA")
-            def fviz_col_plot():
-                return plot_col().draw()
+            @timed(timings)
+            async def fviz_col_plot():
+                return await draw_plot_async(plot_col(),col_drawn)
+
+            # Download Columns plot
+            @render.download(filename="Columns-Factor-Map.jpg")
+            async def download_col_plot_jpg():
+                yield await plot_bytes(plot_col(),"jpg",saved)
+
+            @render.download(filename="Columns-Factor-Map.png")
+            async def download_col_plot_png():
+                yield await plot_bytes(plot_col(),"png",saved)
+
+            @render.download(filename="Columns-Factor-Map.pdf")
+            async def download_col_plot_pdf():
+                yield await plot_bytes(plot_col(),"pdf",saved)
             
             #-------------------------------------------------------------------------------------------------
             ##   Supplementary quantitative variables
             #-------------------------------------------------------------------------------------------------
-            if hasattr(model,"quanti_sup_"):
+            if has_quanti_sup:
                 @render.ui
                 def quanti_sup_fviz():
-                    return ui.panel_conditional("input.fviz_choice === 'fviz_quanti_sup'",
-                            title_input(id="quanti_sup_title",value="Correlation circle - MCA"),
-                            text_size_input(which="quanti_sup"),
-                            ui.input_select(id="quanti_sup_color",label="Variables quantitatives supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="red",multiple=False,width="100%")
-                        )
+                    return graph_ui["quanti_sup_fviz"]
             
                 @render.ui
                 def quanti_sup_plot():
-                    return ui.TagList(
-                            ui.column(6,
-                                ui.div(ui.output_plot("fviz_quanti_sup_plot",width='100%', height='500px'),align="center"),
-                                ui.hr(),
-                                ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px",align="center"),
-                                ui.div(ui.download_button(id="download_quanti_sup_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;",align="center"),
-                                ui.div(ui.download_button(id="download_quanti_sup_plot_png",label="png",style = download_btn_style),style="display: inline-block;",align="center"),
-                                ui.div(ui.download_button(id="download_quanti_sup_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;",align="center"),
-                                align="center"
-                            )
-                        )
+                    return graph_ui["quanti_sup_plot"]
 
                 @reactive.Calc
                 def plot_quanti_sup():
-                    fig =  fviz_corrcircle(self=model,axis=[int(input.axis1()),int(input.axis2())],color=input.quanti_sup_color(),title=input.quanti_sup_title(),text_size=input.quanti_sup_text_size(),ggtheme=pn.theme_gray())
-                    return fig 
+                    return quanti_sup_fig(int(input.axis1()),int(input.axis2()),input.quanti_sup_color(),input.quanti_sup_title(),input.quanti_sup_text_size())
                 
+                quanti_sup_drawn = {}
                 @render.plot(alt="Correlation circle - MCA")
-                def fviz_quanti_sup_plot():
-                    return plot_quanti_sup().draw()
+                @timed(timings)
+                async def fviz_quanti_sup_plot():
+                    return await draw_plot_async(plot_quanti_sup(),quanti_sup_drawn)
+
+                # Download correlation circle
+                @render.download(filename="Correlation-Circle.jpg")
+                async def download_quanti_sup_plot_jpg():
+                    yield await plot_bytes(plot_quanti_sup(),"jpg",saved)
+
+                @render.download(filename="Correlation-Circle.png")
+                async def download_quanti_sup_plot_png():
+                    yield await plot_bytes(plot_quanti_sup(),"png",saved)
+
+                @render.download(filename="Correlation-Circle.pdf")
+                async def download_quanti_sup_plot_pdf():
+                    yield await plot_bytes(plot_quanti_sup(),"pdf",saved)
             
             #-------------------------------------------------------------------------------------------
             ## Eigenvalue informations
@@ -486,37 +659,18 @@ class CAshiny(Base):
             # Reactive Scree  plot
             @reactive.Calc
             def plot_eigen():
-                return fviz_eig(self=model,choice=input.fviz_eigen_choice(),add_labels=input.fviz_eigen_label(),ggtheme=pn.theme_gray())
+                return eig_fig(input.fviz_eigen_choice(),input.fviz_eigen_label())
 
             # Render Scree plot
+            eigen_drawn = {}
             @render.plot(alt="Scree Plot - CA")
-            def fviz_eigen():
-                return plot_eigen().draw()
-
-            # Eigen value - DataFrame
-            @render.data_frame
-            def eigen_table():
-                eig = model.eig_.round(4).reset_index().rename(columns={"index":"dimensions"})
-                eig.columns = [x.capitalize() for x in eig.columns]
-                return DataTable(data=match_datalength(eig,input.eigen_table_len()),filters=input.eigen_table_filter())
+            @timed(timings)
+            async def fviz_eigen():
+                return await draw_plot_async(plot_eigen(),eigen_drawn)
 
             #--------------------------------------------------------------------------------------------
             ##      Columns informations
             #---------------------------------------------------------------------------------------------
-            # Factor coordinates
-            @render.data_frame
-            def col_coord_table():
-                col_coord = model.col_["coord"].round(4).reset_index()
-                col_coord.columns = ["Columns", *col_coord.columns[1:]]
-                return DataTable(data=match_datalength(data=col_coord,value=input.col_coord_len()),filters=input.col_coord_filter())
-
-            # Columns Contributions
-            @render.data_frame
-            def col_contrib_table():
-                col_contrib = model.col_["contrib"].round(4).reset_index()
-                col_contrib.columns = ["Columns", *col_contrib.columns[1:]]
-                return  DataTable(data=match_datalength(data=col_contrib,value=input.col_contrib_len()),filters=input.col_contrib_filter())
-
             # Add Columns Contributions Modal Show
             @reactive.Effect
             @reactive.event(input.col_contrib_graph_btn)
@@ -526,20 +680,14 @@ class CAshiny(Base):
             # Reactive Columns Contributions Map
             @reactive.Calc
             def col_contrib_plot():
-                fig = fviz_contrib(self=model,choice="col",axis=input.col_contrib_axis(),top_contrib=int(input.col_contrib_top()),color=input.col_contrib_color(),bar_width=input.col_contrib_bar_width(),ggtheme=pn.theme_gray())
-                return fig
+                return contrib_fig("col",input.col_contrib_axis(),int(input.col_contrib_top()),input.col_contrib_color(),input.col_contrib_bar_width())
 
             # Plot columns Contributions
+            col_contrib_drawn = {}
             @render.plot(alt="Columns Contributions Map - CA")
-            def fviz_col_contrib():
-                return col_contrib_plot().draw()
-
-            # Square cosinus
-            @render.data_frame
-            def col_cos2_table():
-                col_cos2 = model.col_["cos2"].round(4).reset_index()
-                col_cos2.columns = ["Columns", *col_cos2.columns[1:]]
-                return  DataTable(data=match_datalength(data=col_cos2,value=input.col_cos2_len()),filters=input.col_cos2_filter())
+            @timed(timings)
+            async def fviz_col_contrib():
+                return await draw_plot_async(col_contrib_plot(),col_contrib_drawn)
 
             # Add Columns Cos2 Modal Show
             @reactive.Effect
@@ -550,125 +698,42 @@ class CAshiny(Base):
             # Reactive Graph
             @reactive.Calc
             def col_cos2_plot():
-                fig = fviz_cos2(self=model,choice="col",axis=input.col_cos2_axis(),top_cos2=int(input.col_cos2_top()),color=input.col_cos2_color(),bar_width=input.col_cos2_bar_width(),ggtheme=pn.theme_gray())
-                return fig
+                return cos2_fig("col",input.col_cos2_axis(),int(input.col_cos2_top()),input.col_cos2_color(),input.col_cos2_bar_width())
 
             # Plot Columns Cos2
+            col_cos2_drawn = {}
             @render.plot(alt="Columns Cosines Map - CA")
-            def fviz_col_cos2():
-                return col_cos2_plot().draw()
+            @timed(timings)
+            async def fviz_col_cos2():
+                return await draw_plot_async(col_cos2_plot(),col_cos2_drawn)
 
             #---------------------------------------------------------------------------------
             ## Supplementary Columns
             #------------------------------------------------------------------------------------
-            if hasattr(model,"col_sup_"):
+            if has_col_sup:
                 @render.ui
                 def col_sup_panel():
-                    return ui.panel_conditional("input.value_choice == 'col_sup_res'",
-                                ui.input_radio_buttons(id="col_sup_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","cos2":"Cos2 - Qualité de la représentation"},selected="coord",width="100%",inline=True),
-                                ui.panel_conditional("input.col_sup_choice === 'coord'",panel_conditional1(text="col_sup",name="coord")),
-                                ui.panel_conditional("input.col_sup_choice === 'cos2'",panel_conditional1(text="col_sup",name="cos2"))
-                            )
-            
-                # Supplementary columns coordinates
-                @render.data_frame
-                def col_sup_coord_table():
-                    col_sup_coord = model.col_sup_["coord"].round(4).reset_index()
-                    col_sup_coord.columns = ["Columns", *col_sup_coord.columns[1:]]
-                    return DataTable(data=match_datalength(data=col_sup_coord,value=input.col_sup_coord_len()),filters=input.col_sup_coord_filter())
-
-                # Supplementary columns Cos2
-                @render.data_frame
-                def col_sup_cos2_table():
-                    col_sup_cos2 = model.col_sup_["cos2"].round(4).reset_index()
-                    col_sup_cos2.columns = ["Columns", *col_sup_cos2.columns[1:]]
-                    return DataTable(data=match_datalength(data=col_sup_cos2,value=input.col_sup_cos2_len()),filters=input.col_sup_cos2_filter())
+                    return panel_ui["col_sup_panel"]
             
             #---------------------------------------------------------------------------------
             ## Supplementary quantitative Variables
             #---------------------------------------------------------------------------------
-            if hasattr(model,"quanti_sup_"):
+            if has_quanti_sup:
                 @render.ui
                 def quanti_sup_panel():
-                    return ui.panel_conditional("input.value_choice == 'quanti_sup_res'",
-                                ui.input_radio_buttons(id="quanti_sup_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","cos2":"Cos2 - Qualité de la représentation"},selected="coord",width="100%",inline=True),
-                                ui.panel_conditional("input.quanti_sup_choice === 'coord'",panel_conditional1(text="quanti_sup",name="coord")),
-                                ui.panel_conditional("input.quanti_sup_choice === 'cos2'",panel_conditional1(text="quanti_sup",name="cos2"))
-                            )
-                
-                # Factor coordinates
-                @render.data_frame
-                def quanti_sup_coord_table():
-                    quanti_sup_coord = model.quanti_sup_["coord"].round(4).reset_index()
-                    quanti_sup_coord.columns = ["Variables", *quanti_sup_coord.columns[1:]]
-                    return DataTable(data=match_datalength(data=quanti_sup_coord,value=input.quanti_sup_coord_len()),filters=input.quanti_sup_coord_filter())
+                    return panel_ui["quanti_sup_panel"]
                 
-                # Square cosinus
-                @render.data_frame
-                def quanti_sup_cos2_table():
-                    quanti_sup_cos2 = model.quanti_sup_["cos2"].round(4).reset_index()
-                    quanti_sup_cos2.columns = ["Variables", *quanti_sup_cos2.columns[1:]]
-                    return DataTable(data=match_datalength(data=quanti_sup_cos2,value=input.quanti_sup_cos2_len()),filters=input.quanti_sup_cos2_filter())
-            
             #------------------------------------------------------------------------------------------
             ## Supplementary qualitative variables
             #-----------------------------------------------------------------------------------------
-            if hasattr(model,"quali_sup_"):
+            if has_quali_sup:
                 @render.ui
                 def quali_sup_panel():
-                    return ui.panel_conditional("input.value_choice == 'quali_sup_res'",
-                                ui.input_radio_buttons(id="quali_sup_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","cos2":"Cos2 - Qualité de la représentation","vtest":"Value-test","eta2" : "Eta2 - Rapport de corrélation"},selected="coord",width="100%",inline=True),
-                                ui.panel_conditional("input.quali_sup_choice === 'coord'",panel_conditional1(text="quali_sup",name="coord")),
-                                ui.panel_conditional("input.quali_sup_choice === 'cos2'",panel_conditional1(text="quali_sup",name="cos2")),
-                                ui.panel_conditional("input.quali_sup_choice === 'vtest'",panel_conditional1(text="quali_sup",name="vtest")),
-                                ui.panel_conditional("input.quali_sup_choice === 'eta2'",panel_conditional1(text="quali_sup",name="eta2"))
-                            )
-                
-                # Factor coordinates
-                @render.data_frame
-                def quali_sup_coord_table():
-                    quali_sup_coord = model.quali_sup_["coord"].round(4).reset_index()
-                    quali_sup_coord.columns = ["Categories", *quali_sup_coord.columns[1:]]
-                    return  DataTable(data = match_datalength(quali_sup_coord,input.quali_sup_coord_len()),filters=input.quali_sup_coord_filter())
-                
-                # Square cosinus
-                @render.data_frame
-                def quali_sup_cos2_table():
-                    quali_sup_cos2 = model.quali_sup_["cos2"].round(4).reset_index()
-                    quali_sup_cos2.columns = ["Categories", *quali_sup_cos2.columns[1:]]
-                    return  DataTable(data = match_datalength(quali_sup_cos2,input.quali_sup_cos2_len()),filters=input.quali_sup_cos2_filter())
+                    return panel_ui["quali_sup_panel"]
                 
-                # Value - Test
-                @render.data_frame
-                def quali_sup_vtest_table():
-                    quali_sup_vtest = model.quali_sup_["vtest"].round(4).reset_index()
-                    quali_sup_vtest.columns = ["Categories", *quali_sup_vtest.columns[1:]]
-                    return  DataTable(data = match_datalength(quali_sup_vtest,input.quali_sup_vtest_len()),filters=input.quali_sup_vtest_filter())
-                
-                # Square correlation ratio
-                @render.data_frame
-                def quali_sup_eta2_table():
-                    quali_sup_eta2 = model.quali_sup_["eta2"].round(4).reset_index()
-                    quali_sup_eta2.columns = ["Variables", *quali_sup_eta2.columns[1:]]
-                    return  DataTable(data = match_datalength(quali_sup_eta2,input.quali_sup_eta2_len()),filters=input.quali_sup_eta2_filter())
-
             #---------------------------------------------------------------------------------------------
             ## Row Points Informations
             #---------------------------------------------------------------------------------------------
-            # Rows Coordinates
-            @render.data_frame
-            def row_coord_table():
-                row_coord = model.row_["coord"].round(4).reset_index()
-                row_coord.columns = ["Rows", *row_coord.columns[1:]]
-                return DataTable(data = match_datalength(row_coord,input.row_coord_len()),filters=input.row_coord_filter())
-
-            # Rows Contributions
-            @render.data_frame
-            def row_contrib_table():
-                row_contrib = model.row_["contrib"].round(4).reset_index()
-                row_contrib.columns = ["Rows", *row_contrib.columns[1:]]
-                return  DataTable(data=match_datalength(row_contrib,input.row_contrib_len()),filters=input.row_contrib_filter())
-
             # Add rows Contributions Modal Show
             @reactive.Effect
             @reactive.event(input.row_contrib_graph_btn)
@@ -678,19 +743,13 @@ class CAshiny(Base):
             # Plot Rows Contributions
             @reactive.Calc
             def row_contrib_plot():
-                fig = fviz_contrib(self=model,choice="row",axis=input.row_contrib_axis(),top_contrib=int(input.row_contrib_top()),color = input.row_contrib_color(),bar_width= input.row_contrib_bar_width(),ggtheme=pn.theme_gray())
-                return fig
+                return contrib_fig("row",input.row_contrib_axis(),int(input.row_contrib_top()),input.row_contrib_color(),input.row_contrib_bar_width())
 
+            row_contrib_drawn = {}
             @render.plot(alt="Rows Contributions Map - CA")
-            def fviz_row_contrib():
-                return row_contrib_plot().draw()
-
-            # Rows Cos2
-            @render.data_frame
-            def row_cos2_table():
-                row_cos2 = model.row_["cos2"].round(4).reset_index()
-                row_cos2.columns = ["Rows", *row_cos2.columns[1:]]
-                return  DataTable(data = match_datalength(row_cos2,input.row_cos2_len()),filters=input.row_cos2_filter())
+            @timed(timings)
+            async def fviz_row_contrib():
+                return await draw_plot_async(row_contrib_plot(),row_contrib_drawn)
 
             # Add Rows Cos2 Modal Show
             @reactive.Effect
@@ -701,104 +760,69 @@ class CAshiny(Base):
             # Plot Rows Cos2
             @reactive.Calc
             def row_cos2_plot():
-                fig = fviz_cos2(self=model,choice="row",axis=input.row_cos2_axis(),top_cos2=int(input.row_cos2_top()),color=input.row_cos2_color(),bar_width=input.row_cos2_bar_width(),ggtheme=pn.theme_gray())
-                return fig
+                return cos2_fig("row",input.row_cos2_axis(),int(input.row_cos2_top()),input.row_cos2_color(),input.row_cos2_bar_width())
 
+            row_cos2_drawn = {}
             @render.plot(alt="Rows Cosines Map - CA")
-            def fviz_row_cos2():
-                return row_cos2_plot().draw()
+            @timed(timings)
+            async def fviz_row_cos2():
+                return await draw_plot_async(row_cos2_plot(),row_cos2_drawn)
             
             #-------------------------------------------------------------------------------------------------
             ## Supplementary Rows informations
             #-------------------------------------------------------------------------------------------------
-            if hasattr(model,"row_sup_"):
+            if has_row_sup:
                 @render.ui
                 def row_sup_panel():
-                    return ui.panel_conditional("input.value_choice == 'row_sup_res'",
-                                ui.input_radio_buttons(id="row_sup_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","cos2":"Cos2 - Qualité de la représentation"},selected="coord",width="100%",inline=True),
-                                ui.panel_conditional("input.row_sup_choice === 'coord'",panel_conditional1(text="row_sup",name="coord")),
-                                ui.panel_conditional("input.row_sup_choice === 'cos2'",panel_conditional1(text="row_sup",name="cos2"))
-                            )
-
-                # Factor coordinates
-                @render.data_frame
-                def row_sup_coord_table():
-                    row_sup_coord = model.row_sup_["coord"].round(4).reset_index()
-                    row_sup_coord.columns = ["Rows", *row_sup_coord.columns[1:]]
-                    return  DataTable(data = match_datalength(row_sup_coord,input.row_sup_coord_len()),filters=input.row_sup_coord_filter())
-
-                # Square cosinus
-                @render.data_frame
-                def row_sup_cos2_table():
-                    row_sup_cos2 = model.row_sup_["cos2"].round(4).reset_index()
-                    row_sup_cos2.columns = ["Rows", *row_sup_cos2.columns[1:]]
-                    return  DataTable(data = match_datalength(row_sup_cos2,input.row_sup_cos2_len()),filters=input.row_sup_cos2_filter())
+                    return panel_ui["row_sup_panel"]
 
             #-------------------------------------------------------------------------------------------------
             ## Summary of data
             #-------------------------------------------------------------------------------------------------
-            # Distribution conditionelle (X/Y)
-            @render.data_frame
-            def cond_dist_one_table():
-                data = model.call_["X"].apply(lambda x : 100*x/np.sum(x),axis=0)
-                data.loc["Total",:] = data.sum(axis=0)
-                data = data.round(4).reset_index()
-                data.columns = ["Rows", *data.columns[1:]]
-                return DataTable(data = match_datalength(data,input.cond_dist_one_len()),filters=input.cond_dist_one_filter())
-
-            # Distribution conditionelle (Y/X)
-            @render.data_frame
-            def cond_dist_two_table():
-                data = model.call_["X"].apply(lambda x : 100*x/np.sum(x),axis=1)
-                data.loc[:,"Total"] = data.sum(axis=1)
-                data = data.round(4).reset_index()
-                data.columns = ["Rows", *data.columns[1:]]
-                return DataTable(data = match_datalength(data,input.cond_dist_two_len()),filters=input.cond_dist_two_filter())
-            
-            if hasattr(model,"quanti_sup_"):
+
+            if has_quanti_sup:
                 pass
             
-            if hasattr(model,"quali_sup_"):
-                quali_sup_labels = model.quali_sup_["eta2"].index.tolist()
+            if has_quali_sup:
                 @render.ui
                 def quali_sup_graph():
-                    return ui.panel_conditional("input.resume_choice === 'bar_plot'",
-                            ui.row(
-                                ui.column(2,
-                                    ui.input_select(id="quali_sup_label",label=ui.h6("Choisir une variable"),choices={x:x for x in quali_sup_labels},selected=quali_sup_labels[0])
-                                ),
-                                ui.column(10,
-                                    ui.div(ui.output_plot(id="fviz_bar_plot",width='100%',height='500px'),align="center"),
-                                    ui.hr(),
-                                    ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px",align="center"),
-                                    ui.div(ui.download_button(id="download_bar_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;",align="center"),
-                                    ui.div(ui.download_button(id="download_bar_plot_png",label="png",style = download_btn_style),style="display: inline-block;",align="center"),
-                                    ui.div(ui.download_button(id="download_bar_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;",align="center"),
-                                    align="center"
-                                )
-                            )
-                        )
+                    return panel_ui["quali_sup_graph"]
                 
                 @reactive.Calc
                 def plot_bar():
-                    data = model.call_["Xtot"].loc[:,quali_sup_labels].astype("object")
-                    if hasattr(model,"row_sup_"):
-                        data = data.drop(index=model.call_["row_sup"])
-                    return pn.ggplot(data,pn.aes(x=input.quali_sup_label()))+ pn.geom_bar(color="black",fill="gray")
+                    label = input.quali_sup_label()
+                    if label not in bar_plots:
+                        bar_plots[label] = pn.ggplot(bar_data,pn.aes(x=label))+ pn.geom_bar(color="black",fill="gray")
+                    return bar_plots[label]
 
                 # Diagramme en barres
+                bar_drawn = {}
                 @render.plot(alt="Bar-Plot")
-                def fviz_bar_plot():
-                    return plot_bar().draw()
+                @timed(timings)
+                async def fviz_bar_plot():
+                    return await draw_plot_async(plot_bar(),bar_drawn)
 
             #---------------------------------------------------------------------------------------------------
-            ## Overall Data
+            ## Tables : one renderer per prepared table, reading its display length and filter inputs
             #---------------------------------------------------------------------------------------------------
-            @render.data_frame
-            def overall_data_table():
-                overall_data = model.call_["Xtot"].reset_index()
-                return DataTable(data = match_datalength(overall_data,input.overall_data_len()),filters=input.overall_data_filter())
-            
+            # DataTable of each table, display length and filter switch : built once per session (a DataTable holds the
+            # selection and filters of its session)
+            @lru_cache(maxsize=None)
+            def table_view(name,length,filters):
+                return DataTable(data=table_data(name,length),filters=filters)
+
+            def table_output(name,prefix,output_id):
+                def table():
+                    return table_view(name,input[prefix+"_len"](),input[prefix+"_filter"]())
+                table.__name__ = output_id
+                render.data_frame(timed(timings)(table))
+
+            for name in tables:
+                if name == "eigen":
+                    table_output(name,"eigen_table","eigen_table")
+                else:
+                    table_output(name,name,name+"_table")
+
             #-----------------------------------------------------------------------------------------------------------------------
             ## Close the session
             #------------------------------------------------------------------------------------------------------------------------
@@ -1,16 +1,462 @@
 # -*- coding: utf-8 -*-
-from shiny import Inputs, Outputs, Session, render, ui, reactive
+import copy
+from shiny import Inputs, Outputs, Session, render, ui, reactive, req
 import shinyswatch
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from types import MappingProxyType
 import numpy as np
 import pandas as pd
 import scipy as sp
 import plotnine as pn
-import matplotlib.colors as mcolors
 from sklearn.cluster import KMeans
 from scientisttools import FAMD,fviz_famd_ind, fviz_famd_mod,fviz_famd_var,fviz_famd_col,fviz_eig, fviz_contrib,fviz_cos2,dimdesc
 from scientistshiny.base import Base
 from scientistshiny.function import *
 
+#-------------------------------------------------------------------------------------------------------
+## Static parts of the App UI (no model-dependent choices) : built once, shared by all the apps
+#-------------------------------------------------------------------------------------------------------
+# Variables factor map options
+_VAR_OPTIONS = ui.panel_conditional("input.fviz_choice === 'fviz_var'",
+    title_input(id="var_title",value="Variables - FAMD"),
+    text_size_input(which="var"),
+    ui.input_select(id="var_quant_text_actif_color",label="Variables quantitatives actives",choices=CSS4_DICT,selected="black",multiple=False,width="100%"),
+    ui.input_select(id="var_qual_text_actif_color",label="Variables qualitatives actives",choices=CSS4_DICT,selected="green",multiple=False,width="100%"),
+    ui.output_ui("var_quant_text_sup"),
+    ui.output_ui("var_qual_text_sup"),
+    ui.input_switch(id="var_plot_repel",label="repel",value=True)
+)
+
+# Graphs tab : the four factor maps and their download buttons
+_GRAPH_ROWS = (
+    ui.row(
+        ui.column(6,
+            ui.div(ui.output_plot("fviz_ind_plot",width='100%', height='500px'),align="center"),
+            ui.hr(),
+            ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px"),
+            ui.div(ui.download_button(id="download_ind_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;"),
+            ui.div(ui.download_button(id="download_ind_plot_png",label="png",style = download_btn_style),style="display: inline-block;"),
+            ui.div(ui.download_button(id="download_ind_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;"),
+            align="center"
+        ),
+        ui.column(6,
+            ui.div(ui.output_plot("fviz_quanti_var_plot",width='100%', height='500px'),align="center"),
+            ui.hr(),
+            ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px",align="center"),
+            ui.div(ui.download_button(id="download_quanti_var_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;",align="center"),
+            ui.div(ui.download_button(id="download_quanti_var_plot_png",label="png",style = download_btn_style),style="display: inline-block;",align="center"),
+            ui.div(ui.download_button(id="download_quanti_var_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;",align="center"),
+            align="center"
+        )
+    ),
+    ui.br(),
+    ui.row(
+        ui.column(6,
+            ui.div(ui.output_plot("fviz_quali_var_plot",width='100%', height='500px'),align="center"),
+            ui.hr(),
+            ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px"),
+            ui.div(ui.download_button(id="download_quali_var_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;"),
+            ui.div(ui.download_button(id="download_quali_var_plot_png",label="png",style = download_btn_style),style="display: inline-block;"),
+            ui.div(ui.download_button(id="download_quali_var_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;"),
+            align="center"
+        ),
+        ui.column(6,
+            ui.div(ui.output_plot("fviz_var_plot",width='100%', height='500px'),align="center"),
+            ui.hr(),
+            ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px",align="center"),
+            ui.div(ui.download_button(id="download_var_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;"),
+            ui.div(ui.download_button(id="download_var_plot_png",label="png",style = download_btn_style),style="display: inline-block;"),
+            ui.div(ui.download_button(id="download_var_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;"),
+            align="center"
+        )
+    ),
+)
+
+# Values tab : eigenvalues and results of the active elements
+_VALUE_PANELS = (
+    eigen_panel(),
+    ui.panel_conditional("input.value_choice === 'quanti_var_res'",
+        ui.input_radio_buttons(id="quanti_var_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","contrib":"Contributions","cos2":"Cos2 - Qualité de la représentation"},selected="coord",width="100%",inline=True),
+        ui.panel_conditional("input.quanti_var_choice === 'coord'",panel_conditional1(text="quanti_var",name="coord")),
+        ui.panel_conditional("input.quanti_var_choice === 'contrib'",panel_conditional2(text="quanti_var",name="contrib")),
+        ui.panel_conditional("input.quanti_var_choice === 'cos2'",panel_conditional2(text="quanti_var",name="cos2"))
+    ),
+    ui.panel_conditional("input.value_choice === 'quali_var_res'",
+        ui.input_radio_buttons(id="mod_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","contrib":"Contributions","cos2":"Cos2 - Qualité de la représentation","vtest":"Value - test"},selected="coord",width="100%",inline=True),
+        ui.panel_conditional("input.mod_choice === 'coord'",panel_conditional1(text="quali_var",name="coord")),
+        ui.panel_conditional("input.mod_choice === 'contrib'",panel_conditional2(text="quali_var",name="contrib")),
+        ui.panel_conditional("input.mod_choice === 'cos2'",panel_conditional2(text="quali_var",name="cos2")),
+        ui.panel_conditional("input.mod_choice === 'vtest'",panel_conditional1(text="quali_var",name="vtest"))
+    ),
+    ui.panel_conditional("input.value_choice === 'var_res'",
+        ui.input_radio_buttons(id="var_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","contrib":"Contributions","cos2":"Cos2 - Qualité de la représentation"},selected="coord",width="100%",inline=True),
+        ui.panel_conditional("input.var_choice === 'coord'",panel_conditional1(text="var",name="coord")),
+        ui.panel_conditional("input.var_choice === 'contrib'",panel_conditional1(text="var",name="contrib")),
+        ui.panel_conditional("input.var_choice === 'cos2'",panel_conditional1(text="var",name="cos2"))
+    ),
+    ui.panel_conditional("input.value_choice === 'ind_res'",
+        ui.input_radio_buttons(id="ind_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","contrib":"Contributions","cos2":"Cos2 - Qualité de la représentation"},selected="coord",width="100%",inline=True),
+        ui.panel_conditional("input.ind_choice === 'coord'",panel_conditional1(text="ind",name="coord")),
+        ui.panel_conditional("input.ind_choice === 'contrib'",panel_conditional2(text="ind",name="contrib")),
+        ui.panel_conditional("input.ind_choice === 'cos2'",panel_conditional2(text="ind",name="cos2"))
+    )
+)
+
+# Values tab : results of the supplementary elements, only added when the model has them
+_IND_SUP_PANEL = ui.panel_conditional("input.value_choice == 'ind_sup_res'",
+    ui.input_radio_buttons(id="ind_sup_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","cos2":"Cos2 - Qualité de la représentation"},selected="coord",width="100%",inline=True),
+    ui.panel_conditional("input.ind_sup_choice === 'coord'",panel_conditional1(text="ind_sup",name="coord")),
+    ui.panel_conditional("input.ind_sup_choice === 'cos2'",panel_conditional1(text="ind_sup",name="cos2"))
+)
+
+_QUANTI_SUP_PANEL = ui.panel_conditional("input.value_choice == 'quanti_sup_res'",
+    ui.input_radio_buttons(id="quanti_sup_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","cos2":"Cos2 - Qualité de la représentation"},selected="coord",width="100%",inline=True),
+    ui.panel_conditional("input.quanti_sup_choice === 'coord'",panel_conditional1(text="quanti_sup",name="coord")),
+    ui.panel_conditional("input.quanti_sup_choice === 'cos2'",panel_conditional1(text="quanti_sup",name="cos2"))
+)
+
+_QUALI_SUP_PANEL = ui.panel_conditional("input.value_choice == 'quali_sup_res'",
+    ui.input_radio_buttons(id="quali_sup_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","cos2":"Cos2 - Qualité de la représentation","vtest":"Value-test","eta2" : "Eta2 - Rapport de corrélation"},selected="coord",width="100%",inline=True),
+    ui.panel_conditional("input.quali_sup_choice === 'coord'",panel_conditional1(text="quali_sup",name="coord")),
+    ui.panel_conditional("input.quali_sup_choice === 'cos2'",panel_conditional1(text="quali_sup",name="cos2")),
+    ui.panel_conditional("input.quali_sup_choice === 'vtest'",panel_conditional1(text="quali_sup",name="vtest")),
+    ui.panel_conditional("input.quali_sup_choice === 'eta2'",panel_conditional1(text="quali_sup",name="eta2"))
+)
+
+#-------------------------------------------------------------------------------------------------------
+## Factor maps, built from the model and the graphical parameters (plotnine copies the figure when drawing).
+## The builders are cached per app in FAMDshiny : the caches go away with the app, and never hold another model
+#-------------------------------------------------------------------------------------------------------
+# Graphical parameters of the factor maps (hashable : they are the cache keys). Parameters that the color mode
+# does not use are left to None.
+@dataclass(frozen=True,slots=True)
+class _IndState:
+    axis1 : int
+    axis2 : int
+    color_mode : str
+    actif_color : str | None
+    quali_actif_color : str | None
+    sup_color : str | None
+    quali_sup_color : str | None
+    var_quant : str | None
+    var_qual : str | None
+    add_ellipse : bool | None
+    nb_clusters : int | None
+    text_size : float
+    lim_contrib : float | None
+    lim_cos2 : float | None
+    title : str
+    repel : bool
+
+@dataclass(frozen=True,slots=True)
+class _QuantiVarState:
+    axis1 : int
+    axis2 : int
+    color_mode : str
+    actif_color : str | None
+    sup_color : str | None
+    nb_clusters : int | None
+    text_size : float
+    lim_contrib : float
+    lim_cos2 : float
+    title : str
+
+@dataclass(frozen=True,slots=True)
+class _QualiVarState:
+    axis1 : int
+    axis2 : int
+    color_mode : str
+    actif_color : str | None
+    sup_color : str | None
+    nb_clusters : int | None
+    text_size : float
+    lim_contrib : float
+    lim_cos2 : float
+    title : str
+    repel : bool
+
+@dataclass(frozen=True,slots=True)
+class _VarState:
+    axis1 : int
+    axis2 : int
+    quanti_color : str
+    quali_color : str
+    quanti_sup_color : str | None
+    quali_sup_color : str | None
+    text_size : float
+    title : str
+    repel : bool
+
+def _build_ind_fig(model,state):
+    kwargs = dict(self=model,axis=[state.axis1,state.axis2],ind_sup=hasattr(model,"ind_sup_"),quali_sup=hasattr(model,"quali_sup_"),
+                  text_size=state.text_size,lim_contrib=state.lim_contrib,lim_cos2=state.lim_cos2,title=state.title,repel=state.repel)
+    color_mode = state.color_mode
+    if color_mode == "actif/sup":
+        kwargs.update(color=state.actif_color,color_quali_var=state.quali_actif_color,color_sup=state.sup_color,color_quali_sup=state.quali_sup_color)
+    elif color_mode in ("cos2","contrib"):
+        kwargs.update(color=color_mode)
+    elif color_mode == "var_qual":
+        kwargs.update(habillage=state.var_qual,add_ellipses=state.add_ellipse)
+    elif color_mode == "var_quant":
+        kwargs.update(color=state.var_quant)
+    elif color_mode == "kmeans":
+        kwargs.update(color=KMeans(n_clusters=state.nb_clusters, random_state=np.random.seed(123), n_init="auto").fit(model.ind_["coord"].to_numpy()))
+    return fviz_famd_ind(**kwargs) + PLOT_THEME
+
+def _build_quanti_var_fig(model,state):
+    kwargs = dict(self=model,axis=[state.axis1,state.axis2],title=state.title,quanti_sup=hasattr(model,"quanti_sup_"),
+                  text_size=state.text_size,lim_contrib=state.lim_contrib,lim_cos2=state.lim_cos2)
+    color_mode = state.color_mode
+    if color_mode == "actif/sup":
+        kwargs.update(color=state.actif_color,color_sup=state.sup_color)
+    elif color_mode in ("cos2","contrib"):
+        kwargs.update(color=color_mode)
+    elif color_mode == "kmeans":
+        kwargs.update(color=KMeans(n_clusters=state.nb_clusters, random_state=np.random.seed(123), n_init="auto").fit(model.quanti_var_["coord"].to_numpy()))
+    return fviz_famd_col(**kwargs) + PLOT_THEME
+
+def _build_quali_var_fig(model,state):
+    kwargs = dict(self=model,axis=[state.axis1,state.axis2],title=state.title,quali_sup=hasattr(model,"quali_sup_"),text_size=state.text_size,
+                  lim_contrib=state.lim_contrib,lim_cos2=state.lim_cos2,repel=state.repel)
+    color_mode = state.color_mode
+    if color_mode == "actif/sup":
+        kwargs.update(color=state.actif_color,color_sup=state.sup_color)
+    elif color_mode in ("cos2","contrib"):
+        kwargs.update(color=color_mode)
+    elif color_mode == "kmeans":
+        kwargs.update(color=KMeans(n_clusters=state.nb_clusters, random_state=np.random.seed(123), n_init="auto").fit(model.quali_var_["coord"].to_numpy()))
+    return fviz_famd_mod(**kwargs) + PLOT_THEME
+
+def _build_var_fig(model,state):
+    kwargs = dict(self=model,axis=[state.axis1,state.axis2],title=state.title,color_quali=state.quali_color,color_quanti=state.quanti_color,
+                  add_quanti_sup=hasattr(model,"quanti_sup_"),add_quali_sup=hasattr(model,"quali_sup_"),text_size=state.text_size,repel=state.repel,ggtheme=PLOT_THEME)
+    # Supplementary variables colors, only for the supplementary variables of the model
+    if kwargs["add_quanti_sup"]:
+        kwargs.update(color_quanti_sup=state.quanti_sup_color)
+    if kwargs["add_quali_sup"]:
+        kwargs.update(color_quali_sup=state.quali_sup_color)
+    return fviz_famd_var(**kwargs)
+
+#-------------------------------------------------------------------------------------------------------
+## Scree plot and contributions/cosines maps, built from the model and the graphical parameters
+#-------------------------------------------------------------------------------------------------------
+def _build_eig_fig(model,choice,add_labels):
+    return fviz_eig(self=model,choice=choice,add_labels=add_labels,ggtheme=PLOT_THEME)
+
+def _build_contrib_fig(model,choice,axis,top,color,bar_width):
+    return fviz_contrib(self=model,choice=choice,axis=axis,top_contrib=top,color=color,bar_width=bar_width,ggtheme=PLOT_THEME)
+
+def _build_cos2_fig(model,choice,axis,top,color,bar_width):
+    return fviz_cos2(self=model,choice=choice,axis=axis,top_cos2=top,color=color,bar_width=bar_width,ggtheme=PLOT_THEME)
+
+#-------------------------------------------------------------------------------------------------------
+## Variables labels and App UI
+#-------------------------------------------------------------------------------------------------------
+def _var_labels(model):
+    # Labels are kept as pandas Index : they are only turned into python objects when building the choices
+    # Quantitative variables labels
+    quanti_var_labels = model.quanti_var_["coord"].index
+
+    # Qualitative variables labels : hash-based set difference, in the order of the variables
+    quali_var_labels = model.var_["coord"].index.difference(quanti_var_labels,sort=False)
+
+    # Supplementary variables
+    if hasattr(model,"quanti_sup_"):
+        quanti_var_labels = quanti_var_labels.append(model.quanti_sup_["coord"].index)
+    if hasattr(model,"quali_sup_"):
+        quali_var_labels = quali_var_labels.append(model.quali_sup_["eta2"].index)
+    return quanti_var_labels, quali_var_labels
+
+# Model restricted to max_points active individuals, for the individuals factor map of a large data set. The individuals
+# best represented (cos2) and with the largest contributions on the plane of axes axis1 and axis2 are kept, the others are
+# sampled at random (fixed seed : the same axes give the same points). The results of the individuals, the data and the
+# weights are restricted alike, so that the limits of fviz_famd_ind keep working on the drawn points.
+def _thin_individuals(model,axis1,axis2,max_points,seed=123):
+    n_ind = model.ind_["coord"].shape[0]
+    if n_ind <= max_points:
+        return model
+    axes = [axis1,axis2]
+    cos2 = model.ind_["cos2"].to_numpy()[:,axes].sum(axis=1)
+    # Contributions to the plane : weighted by the eigenvalues of the axes
+    eigen = model.eig_.iloc[axes,0].to_numpy()
+    contrib = model.ind_["contrib"].to_numpy()[:,axes] @ eigen / eigen.sum()
+    n_best = max_points // 4
+    best = np.union1d(np.argpartition(cos2,-n_best)[-n_best:],np.argpartition(contrib,-n_best)[-n_best:]) if n_best else np.empty(0,dtype=int)
+    others = np.setdiff1d(np.arange(n_ind),best)
+    sample = np.random.default_rng(seed).choice(others,size=max_points-best.size,replace=False)
+    # Positions of the kept individuals, in the order of the model
+    keep = np.sort(np.concatenate((best,sample)))
+    active = model.ind_["coord"].index
+
+    # Results of the active individuals (pandas objects indexed by them, numpy arrays of one row per individual) are taken
+    # at the kept positions. Data of the active and supplementary individuals (Xtot) lose the dropped active individuals.
+    def take(v):
+        if isinstance(v,(pd.DataFrame,pd.Series)):
+            if v.index.equals(active):
+                return v.iloc[keep]
+            if len(v) > n_ind and v.index.is_unique and active.isin(v.index).all():
+                return v.drop(index=active.delete(keep))
+        elif isinstance(v,np.ndarray) and v.ndim > 0 and v.shape[0] == n_ind:
+            return v[keep]
+        return v
+    def restrict(results):
+        return {k : take(v) for k, v in results.items()}
+    thinned = copy.copy(model)
+    thinned.ind_, thinned.call_ = restrict(model.ind_), restrict(model.call_)
+    return thinned
+
+# Description of all the axes for a p-value
+def _dim_desc(model,proba):
+    return dimdesc(self=model,axis=None,proba=proba)
+
+# Outputs of the values tab : one read-only mapping per combination of supplementary elements
+@lru_cache(maxsize=8)
+def _value_choices(has_ind_sup,has_quanti_sup,has_quali_sup):
+    value_choice = {"eigen_res":"Valeurs propres","quanti_var_res":"Résultats sur les variables quantitatives","quali_var_res":"Résultats sur les variables qualitatives","var_res":"Résultats sur les variables","ind_res":"Résultats sur les individus"}
+
+    if has_ind_sup:
+        value_choice["ind_sup_res"] = "Résultats des individus supplémentaires"
+
+    # Check if supplementary quantitatives variables
+    if has_quanti_sup:
+        value_choice["quanti_sup_res"] = "Résultats des variables quantitatives supplémentaires"
+
+    # Check if supplementary qualitatives variables
+    if has_quali_sup:
+        value_choice["quali_sup_res"] = "Résultats des variables qualitatives supplémentaires"
+    return MappingProxyType(value_choice)
+
+def _build_app_ui(model,quanti_var_labels,quali_var_labels):
+    # Variables select choices, each shared by the factor map and the summary selects
+    quanti_var_choices = {x : x for x in quanti_var_labels}
+    quali_var_choices = {x : x for x in quali_var_labels}
+
+    # Outputs of the values tab
+    value_choice = _value_choices(hasattr(model,"ind_sup_"),hasattr(model,"quanti_sup_"),hasattr(model,"quali_sup_"))
+
+    # App UI
+    return ui.page_fluid(
+        ui.include_css(css_path),
+        shinyswatch.theme.superhero(),
+        header(title="Analyse Factorielle des données mixtes",model_name="FAMD"),
+        ui.page_sidebar(
+            ui.sidebar(
+                ui.panel_well(
+                    ui.h6("Options graphiques",style="text-align:center"),
+                    ui.div(ui.h6("Axes"),style="display: inline-block;padding: 5px"),
+                    axes_input_select(model=model),
+                    ui.br(),
+                    ui.div(ui.input_select(id="fviz_choice",label="Quel graphe voule-vous modifier?",choices={"fviz_ind":"Individus","fviz_var_quant":"Variables quantitatives","fviz_var_qual":"Variables qualitatives","fviz_var": "Variables"},selected="fviz_ind",multiple=False,width="100%")),
+                    ui.panel_conditional("input.fviz_choice === 'fviz_ind'",
+                        title_input(id="ind_title",value="Individuals - FAMD"),
+                        text_size_input(which="ind"),
+                        point_select_input(id="ind_point_select"),
+                        ui.panel_conditional("input.ind_point_select === 'cos2'",ui.div(lim_cos2(id="ind_lim_cos2"),align="center")),
+                        ui.panel_conditional("input.ind_point_select === 'contrib'",ui.div(lim_contrib(id="ind_lim_contrib"),align="center")),
+                        text_color_input(id="ind_text_color",choices={"actif/sup":"actifs/supplémentaires","cos2":"Cosinus","contrib":"Contribution","var_quant":"Variable quantitative","var_qual":"Variable qualitative","kmeans" : "KMeans"}),
+                        ui.panel_conditional("input.ind_text_color === 'actif/sup'",
+                            ui.input_select(id="ind_text_actif_color",label="Individus actifs",choices=CSS4_DICT,selected="black",multiple=False,width="100%"),
+                            ui.input_select(id="ind_text_quali_actif_color",label="Modalités actives",choices=CSS4_DICT,selected="green",multiple=False,width="100%"),
+                            ui.output_ui("ind_text_sup"),
+                            ui.output_ui("ind_text_quali_sup")
+                        ),
+                        ui.panel_conditional("input.ind_text_color === 'var_qual'",
+                            ui.input_select(id="ind_text_var_qual_color",label="Choix de la variable",choices=quali_var_choices,selected=quali_var_labels[0],multiple=False,width="100%"),
+                            ui.input_switch(id="ind_text_add_ellipse",label="Trace les ellipses de confiance autour des barycentres",value=False)
+                        ),
+                        ui.panel_conditional("input.ind_text_color === 'var_quant'",ui.input_select(id="ind_text_var_quant_color",label="Choix de la variable",choices=quanti_var_choices,selected=quanti_var_labels[0],multiple=False,width="100%")),
+                        ui.panel_conditional("input.ind_text_color === 'kmeans'",ui.input_numeric(id="ind_text_kmeans_nb_clusters",label="Choix du nombre de clusters",value=2,min=1,max=model.ind_["coord"].shape[0],step=1,width="100%")),
+                        ui.input_switch(id="ind_plot_repel",label="repel",value=True)
+                    ),
+                    ui.panel_conditional("input.fviz_choice === 'fviz_var_quant'",
+                        title_input(id="quanti_var_title",value="Correlation circle - FAMD"),
+                        text_size_input(which="quanti_var"),
+                        point_select_input(id="quanti_var_point_select"),
+                        ui.panel_conditional("input.quanti_var_point_select === 'cos2'",ui.div(lim_cos2(id="quanti_var_lim_cos2"),align="center")),
+                        ui.panel_conditional("input.quanti_var_point_select === 'contrib'",ui.div(lim_contrib(id="quanti_var_lim_contrib"),align="center")),
+                        text_color_input(id="quanti_var_text_color",choices={"actif/sup": "actifs/supplémentaires","cos2":"Cosinus","contrib":"Contribution","kmeans":"KMeans"}),
+                        ui.panel_conditional("input.quanti_var_text_color === 'actif/sup'",
+                            ui.input_select(id="quanti_var_text_actif_color",label="Variables quantitatives actives",choices=CSS4_DICT,selected="black",multiple=False,width="100%"),
+                            ui.output_ui("quanti_var_text_sup"),
+                        ),
+                        ui.panel_conditional("input.quanti_var_text_color === 'kmeans'",ui.input_numeric(id="quanti_var_text_kmeans_nb_clusters",label="Choix du nombre de clusters",value=2,min=1,max=model.quanti_var_["coord"].shape[0],step=1,width="100%")),
+                    ),
+                    ui.panel_conditional("input.fviz_choice === 'fviz_var_qual'",
+                        title_input(id="quali_var_title",value="Variables categories - FAMD"),
+                        text_size_input(which="quali_var"),
+                        point_select_input(id="quali_var_point_select"),
+                        ui.panel_conditional("input.quali_var_point_select === 'cos2'",ui.div(lim_cos2(id="quali_var_lim_cos2"),align="center")),
+                        ui.panel_conditional("input.quali_var_point_select === 'contrib'",ui.div(lim_contrib(id="quali_var_lim_contrib"),align="center")),
+                        text_color_input(id="quali_var_text_color",choices={"actif/sup": "actifs/supplémentaires","cos2":"Cosinus","contrib":"Contribution","kmeans":"KMeans"}),
+                        ui.panel_conditional("input.quali_var_text_color === 'actif/sup'",
+                            ui.input_select(id="quali_var_text_actif_color",label="Modalités actives",choices=CSS4_DICT,selected="black",multiple=False,width="100%"),
+                            ui.output_ui("quali_var_text_sup"),
+                        ),
+                        ui.panel_conditional("input.quali_var_text_color === 'kmeans'",ui.input_numeric(id="quali_var_text_kmeans_nb_clusters",label="Choix du nombre de clusters",value=2,min=1,max=model.quali_var_["coord"].shape[0],step=1,width="100%")),
+                        ui.input_switch(id="quali_var_plot_repel",label="repel",value=True)
+                    ),
+                    _VAR_OPTIONS,
+                    ui.div(ui.input_action_button(id="exit",label="Quitter l'application",style='padding:5px; background-color: #2e4053;text-align:center;white-space: normal;'),align="center")
+                ),
+                width="25%"
+            ),
+            ui.navset_card_tab(
+                ui.nav_panel("Graphes",*_GRAPH_ROWS),
+                ui.nav_panel("Valeurs",
+                    ui.input_radio_buttons(id="value_choice",label=ui.h6("Quelles sorties voulez-vous?"),choices=value_choice,inline=True),
+                    ui.br(),
+                    *_VALUE_PANELS,
+                    *([_IND_SUP_PANEL] if hasattr(model,"ind_sup_") else []),
+                    *([_QUANTI_SUP_PANEL] if hasattr(model,"quanti_sup_") else []),
+                    *([_QUALI_SUP_PANEL] if hasattr(model,"quali_sup_") else [])
+                ),
+                dim_desc_panel(model=model),
+                ui.nav_panel("Résumé du jeu de données",
+                    ui.input_radio_buttons(id="resume_choice",label=ui.h6("Quelles sorties voulez - vous?"),choices={"stats_desc":"Statistiques descriptives","hist_plot" : "Histogramme","corr_matrix": "Matrice des corrélations","bar_plot":"Diagramme en barres","chi2_test" : "Test de Chi2","others_test":"Autres mesures d'association"},selected="stats_desc",width="100%",inline=True),
+                    ui.br(),
+                    ui.panel_conditional("input.resume_choice === 'stats_desc'",panel_conditional1(text="stats",name="desc")),
+                    ui.panel_conditional("input.resume_choice === 'hist_plot'",
+                        ui.row(
+                            ui.column(2,
+                                ui.input_select(id="quanti_var_label",label="Choisir une variable",choices=quanti_var_choices,selected=quanti_var_labels[0],width="100%"),
+                                ui.input_switch(id="add_density",label="Densite",value=False)
+                            ),
+                            ui.column(10,
+                                ui.div(ui.output_plot("fviz_hist_plot",width='100%', height='500px'),align="center"),
+                                ui.hr(),
+                                ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px"),
+                                ui.div(ui.download_button(id="download_hist_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;"),
+                                ui.div(ui.download_button(id="download_hist_plot_png",label="png",style = download_btn_style),style="display: inline-block;"),
+                                ui.div(ui.download_button(id="download_hist_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;"),
+                                align="center"
+                            )
+                        )
+                    ),
+                    ui.panel_conditional("input.resume_choice === 'corr_matrix'",panel_conditional1(text="corr",name="matrix")),
+                    ui.panel_conditional("input.resume_choice === 'bar_plot'",
+                        ui.row(
+                            ui.column(2,ui.input_select(id="quali_var_label",label="Choisir une variable",choices=quali_var_choices,selected=quali_var_labels[0],width="100%")),
+                            ui.column(10,
+                                ui.div(ui.output_plot("fviz_bar_plot",width='100%', height='500px'),align="center"),
+                                ui.hr(),
+                                ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px"),
+                                ui.div(ui.download_button(id="download_bar_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;"),
+                                ui.div(ui.download_button(id="download_bar_plot_png",label="png",style = download_btn_style),style="display: inline-block;"),
+                                ui.div(ui.download_button(id="download_bar_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;"),
+                                align="center"
+                            )
+                        )
+                    ),
+                    ui.panel_conditional("input.resume_choice === 'chi2_test'",panel_conditional1(text="chi2",name="test")),
+                    ui.panel_conditional("input.resume_choice === 'others_test'",panel_conditional1(text="others",name="test"))
+                ),
+                ui.nav_panel("Données",panel_conditional1(text="overall",name="data"))
+            )
+        )
+    )
+
+
 class FAMDshiny(Base):
     """
     Factor Analysis of Mixed Data (FAMD) with scientistshiny
@@ -30,6 +476,8 @@ class FAMDshiny(Base):
     ----------
     `model` : a pandas dataframe with n rows (individuals) and p columns (variables) or an instance of class FAMD. A FAMD result from scientisttools.
 
+    `max_points` : None or a positive integer, default = None. If an integer (e.g. 5000) and the number of active individuals is larger, the individuals factor map draws a subsample of max_points individuals : the best represented (highest cos2) and largest contributions on the plane, completed by a random sample of the others. It only applies to the graph, not to the tables.
+
     Returns
     -------
     `Graphs` : a tab containing the individuals factor map, the correlation circle, the variables categories factor map and the variables factor (quantitative and qualitative)
@@ -68,7 +516,13 @@ class FAMDshiny(Base):
     for jupyter notebooks
     https://stackoverflow.com/questions/74070505/how-to-run-fastapi-application-inside-jupyter
     """
-    def __init__(self,model=None):
+    __slots__ = ("app_ui","app_server")
+
+    def __init__(self,model=None,max_points=None):
+        # Check max_points
+        if max_points is not None and (isinstance(max_points,bool) or not isinstance(max_points,(int,np.integer)) or max_points <= 0):
+            raise ValueError("'max_points' must be None or a positive integer")
+
         # Check if model is an instance of pd.DataFrame class
         if isinstance(model,pd.DataFrame):        
             # Check if qualitative data
@@ -83,632 +537,300 @@ class FAMDshiny(Base):
         if model.model_ != "famd":
             raise ValueError("'model' must be an object of class FAMD")
         
-        # Initialise value choice
-        value_choice = {"eigen_res":"Valeurs propres","quanti_var_res":"Résultats sur les variables quantitatives","quali_var_res":"Résultats sur les variables qualitatives","var_res":"Résultats sur les variables","ind_res":"Résultats sur les individus"}
+        # Variables labels (shared with the server)
+        quanti_var_labels, quali_var_labels = _var_labels(model)
 
-        # Quantitative variables labels
-        quanti_var_labels = model.quanti_var_["coord"].index.tolist()
+        # Data of the active individuals : the supplementary individuals are dropped once for the summary
+        active_data = model.call_["Xtot"]
+        if hasattr(model,"ind_sup_"):
+            active_data = active_data.drop(index=model.call_["ind_sup"])
 
-        # Qualitative variables labels
-        quali_var_labels = [x for x in model.var_["coord"].index if x  not in quanti_var_labels]
-        
+        # Results tables : rounded and labelled once, shared by all sessions
+        eig = result_table(model.eig_,"dimensions")
+        eig.columns = eig.columns.str.capitalize()
+        tables = {"eigen" : eig,
+                  **{"quanti_var_"+x : result_table(model.quanti_var_[x],"Variables") for x in ["coord","contrib","cos2"]},
+                  **{"quali_var_"+x : result_table(model.quali_var_[x],"Categories") for x in ["coord","contrib","cos2","vtest"]},
+                  **{"var_"+x : result_table(model.var_[x],"Variables") for x in ["coord","contrib","cos2"]},
+                  **{"ind_"+x : result_table(model.ind_[x],"Individus") for x in ["coord","contrib","cos2"]}}
         if hasattr(model,"ind_sup_"):
-            value_choice = {**value_choice,**{"ind_sup_res" : "Résultats des individus supplémentaires"}}
-            
-        # Check if supplementary quantitatives variables
+            tables.update({"ind_sup_"+x : result_table(model.ind_sup_[x],"Individus") for x in ["coord","cos2"]})
         if hasattr(model,"quanti_sup_"):
-            value_choice = {**value_choice, **{"quanti_sup_res" : "Résultats des variables quantitatives supplémentaires"}}
-            quanti_var_labels = [*quanti_var_labels,*model.quanti_sup_["coord"].index.tolist()]
+            tables.update({"quanti_sup_"+x : result_table(model.quanti_sup_[x],"Variables") for x in ["coord","cos2"]})
+        if hasattr(model,"quali_sup_"):
+            tables.update({"quali_sup_"+x : result_table(model.quali_sup_[x],"Categories") for x in ["coord","cos2","vtest"]})
+            tables["quali_sup_eta2"] = result_table(model.quali_sup_["eta2"],"Variables")
+
+        # App UI
+        app_ui = _build_app_ui(model,quanti_var_labels,quali_var_labels)
+
+        # Figures and axes description of this app, cached on their parameters : plotnine copies the plot when drawing,
+        # so a figure can be shared by the sessions. The caches belong to the app, and are released with it.
+        # With max_points, the individuals factor map is drawn from a thinned model (one per pair of axes)
+        thinned_model = lru_cache(maxsize=8)(partial(_thin_individuals,model,max_points=max_points))
+        @lru_cache(maxsize=64)
+        def ind_fig(state):
+            return _build_ind_fig(model if max_points is None else thinned_model(state.axis1,state.axis2),state)
+        quanti_var_fig = lru_cache(maxsize=64)(partial(_build_quanti_var_fig,model))
+        quali_var_fig = lru_cache(maxsize=64)(partial(_build_quali_var_fig,model))
+        var_fig = lru_cache(maxsize=64)(partial(_build_var_fig,model))
+        eig_fig = lru_cache(maxsize=16)(partial(_build_eig_fig,model))
+        contrib_fig = lru_cache(maxsize=64)(partial(_build_contrib_fig,model))
+        cos2_fig = lru_cache(maxsize=64)(partial(_build_cos2_fig,model))
+        dim_desc_cache = lru_cache(maxsize=8)(partial(_dim_desc,model))
 
-        # Check if supplementary qualitatives variables
+        # Color selects of the supplementary elements : static, built once and shared by all sessions
+        graph_ui = {}
+        if hasattr(model,"ind_sup_"):
+            graph_ui["ind_text_sup"] = ui.TagList(ui.input_select(id="ind_text_sup_color",label="Individus supplémentaires",choices=CSS4_DICT,selected="blue",multiple=False,width="100%"))
+        if hasattr(model,"quanti_sup_"):
+            graph_ui["quanti_var_text_sup"] = ui.TagList(ui.input_select(id="quanti_var_text_sup_color",label="Variables quantitatives supplémentaires",choices=CSS4_DICT,selected="blue",multiple=False,width="100%"))
+            graph_ui["var_quant_text_sup"] = ui.TagList(ui.input_select(id="var_quant_text_sup_color",label="Variables quantitatives supplémentaires",choices=CSS4_DICT,selected="blue",multiple=False,width="100%"))
         if hasattr(model,"quali_sup_"):
-            value_choice = {**value_choice,**{"quali_sup_res" : "Résultats des variables qualitatives supplémentaires"}}
-            quali_var_labels = [*quali_var_labels,*model.quali_sup_["eta2"].index.tolist()]
-        
-        # UI
-        app_ui = ui.page_fluid(
-            ui.include_css(css_path),
-            shinyswatch.theme.superhero(),
-            header(title="Analyse Factorielle des données mixtes",model_name="FAMD"),
-            ui.page_sidebar(
-                ui.sidebar(
-                    ui.panel_well(
-                        ui.h6("Options graphiques",style="text-align:center"),
-                        ui.div(ui.h6("Axes"),style="display: inline-block;padding: 5px"),
-                        axes_input_select(model=model),
-                        ui.br(),
-                        ui.div(ui.input_select(id="fviz_choice",label="Quel graphe voule-vous modifier?",choices={"fviz_ind":"Individus","fviz_var_quant":"Variables quantitatives","fviz_var_qual":"Variables qualitatives","fviz_var": "Variables"},selected="fviz_ind",multiple=False,width="100%")),
-                        ui.panel_conditional("input.fviz_choice === 'fviz_ind'",
-                            title_input(id="ind_title",value="Individuals - FAMD"),
-                            text_size_input(which="ind"),
-                            point_select_input(id="ind_point_select"),
-                            ui.panel_conditional("input.ind_point_select === 'cos2'",ui.div(lim_cos2(id="ind_lim_cos2"),align="center")),
-                            ui.panel_conditional("input.ind_point_select === 'contrib'",ui.div(lim_contrib(id="ind_lim_contrib"),align="center")),
-                            text_color_input(id="ind_text_color",choices={"actif/sup":"actifs/supplémentaires","cos2":"Cosinus","contrib":"Contribution","var_quant":"Variable quantitative","var_qual":"Variable qualitative","kmeans" : "KMeans"}),
-                            ui.panel_conditional("input.ind_text_color === 'actif/sup'",
-                                ui.input_select(id="ind_text_actif_color",label="Individus actifs",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"),
-                                ui.input_select(id="ind_text_quali_actif_color",label="Modalités actives",choices={x:x for x in mcolors.CSS4_COLORS},selected="green",multiple=False,width="100%"),
-                                ui.output_ui("ind_text_sup"),
-                                ui.output_ui("ind_text_quali_sup")
-                            ),
-                            ui.panel_conditional("input.ind_text_color === 'var_qual'",
-                                ui.input_select(id="ind_text_var_qual_color",label="Choix de la variable",choices={x:x for x in quali_var_labels},selected=quali_var_labels[0],multiple=False,width="100%"),
-                                ui.input_switch(id="ind_text_add_ellipse",label="Trace les ellipses de confiance autour des barycentres",value=False)
-                            ),
-                            ui.panel_conditional("input.ind_text_color === 'var_quant'",ui.input_select(id="ind_text_var_quant_color",label="Choix de la variable",choices={x:x for x in quanti_var_labels},selected=quanti_var_labels[0],multiple=False,width="100%")),
-                            ui.panel_conditional("input.ind_text_color === 'kmeans'",ui.input_numeric(id="ind_text_kmeans_nb_clusters",label="Choix du nombre de clusters",value=2,min=1,max=model.ind_["coord"].shape[0],step=1,width="100%")),
-                            ui.input_switch(id="ind_plot_repel",label="repel",value=True)
-                        ),
-                        ui.panel_conditional("input.fviz_choice === 'fviz_var_quant'",
-                            title_input(id="quanti_var_title",value="Correlation circle - FAMD"),
-                            text_size_input(which="quanti_var"),
-                            point_select_input(id="quanti_var_point_select"),
-                            ui.panel_conditional("input.quanti_var_point_select === 'cos2'",ui.div(lim_cos2(id="quanti_var_lim_cos2"),align="center")),
-                            ui.panel_conditional("input.quanti_var_point_select === 'contrib'",ui.div(lim_contrib(id="quanti_var_lim_contrib"),align="center")),
-                            text_color_input(id="quanti_var_text_color",choices={"actif/sup": "actifs/supplémentaires","cos2":"Cosinus","contrib":"Contribution","kmeans":"KMeans"}),
-                            ui.panel_conditional("input.quanti_var_text_color === 'actif/sup'",
-                                ui.input_select(id="quanti_var_text_actif_color",label="Variables quantitatives actives",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"),
-                                ui.output_ui("quanti_var_text_sup"),
-                            ),
-                            ui.panel_conditional("input.quanti_var_text_color === 'kmeans'",ui.input_numeric(id="quanti_var_text_kmeans_nb_clusters",label="Choix du nombre de clusters",value=2,min=1,max=model.quanti_var_["coord"].shape[0],step=1,width="100%")),
-                        ),
-                        ui.panel_conditional("input.fviz_choice === 'fviz_var_qual'",
-                            title_input(id="quali_var_title",value="Variables categories - FAMD"),
-                            text_size_input(which="quali_var"),
-                            point_select_input(id="quali_var_point_select"),
-                            ui.panel_conditional("input.quali_var_point_select === 'cos2'",ui.div(lim_cos2(id="quali_var_lim_cos2"),align="center")),
-                            ui.panel_conditional("input.quali_var_point_select === 'contrib'",ui.div(lim_contrib(id="quali_var_lim_contrib"),align="center")),
-                            text_color_input(id="quali_var_text_color",choices={"actif/sup": "actifs/supplémentaires","cos2":"Cosinus","contrib":"Contribution","kmeans":"KMeans"}),
-                            ui.panel_conditional("input.quali_var_text_color === 'actif/sup'",
-                                ui.input_select(id="quali_var_text_actif_color",label="Modalités actives",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"),
-                                ui.output_ui("quali_var_text_sup"),
-                            ),
-                            ui.panel_conditional("input.quali_var_text_color === 'kmeans'",ui.input_numeric(id="quali_var_text_kmeans_nb_clusters",label="Choix du nombre de clusters",value=2,min=1,max=model.quali_var_["coord"].shape[0],step=1,width="100%")),
-                            ui.input_switch(id="quali_var_plot_repel",label="repel",value=True)
-                        ),
-                        ui.panel_conditional("input.fviz_choice === 'fviz_var'",
-                            title_input(id="var_title",value="Variables - FAMD"),
-                            text_size_input(which="var"),
-                            ui.input_select(id="var_quant_text_actif_color",label="Variables quantitatives actives",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"),
-                            ui.input_select(id="var_qual_text_actif_color",label="Variables qualitatives actives",choices={x:x for x in mcolors.CSS4_COLORS},selected="green",multiple=False,width="100%"),
-                            ui.output_ui("var_quant_text_sup"),
-                            ui.output_ui("var_qual_text_sup"),
-                            ui.input_switch(id="var_plot_repel",label="repel",value=True)
-                        ),
-                        ui.div(ui.input_action_button(id="exit",label="Quitter l'application",style='padding:5px; background-color: #2e4053;text-align:center;white-space: normal;'),align="center")
-                    ),
-                    width="25%"
-                ),
-                ui.navset_card_tab(
-                    ui.nav_panel("Graphes",
-                        ui.row(
-                            ui.column(6,
-                                ui.div(ui.output_plot("fviz_ind_plot",width='100%', height='500px'),align="center"),
-                                ui.hr(),
-                                ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px"),
-                                ui.div(ui.download_button(id="download_ind_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;"),
-                                ui.div(ui.download_button(id="download_ind_plot_png",label="png",style = download_btn_style),style="display: inline-block;"),
-                                ui.div(ui.download_button(id="download_ind_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;"),
-                                align="center"
-                            ),
-                            ui.column(6,
-                                ui.div(ui.output_plot("fviz_quanti_var_plot",width='100%', height='500px'),align="center"),
-                                ui.hr(),
-                                ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px",align="center"),
-                                ui.div(ui.download_button(id="download_quanti_var_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;",align="center"),
-                                ui.div(ui.download_button(id="download_quanti_var_plot_png",label="png",style = download_btn_style),style="display: inline-block;",align="center"),
-                                ui.div(ui.download_button(id="download_quanti_var_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;",align="center"),
-                                align="center"
-                            )
-                        ),
-                        ui.br(),
-                        ui.row(
-                            ui.column(6,
-                                ui.div(ui.output_plot("fviz_quali_var_plot",width='100%', height='500px'),align="center"),
-                                ui.hr(),
-                                ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px"),
-                                ui.div(ui.download_button(id="download_quali_var_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;"),
-                                ui.div(ui.download_button(id="download_quali_var_plot_png",label="png",style = download_btn_style),style="display: inline-block;"),
-                                ui.div(ui.download_button(id="download_quali_var_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;"),
-                                align="center"
-                            ),
-                            ui.column(6,
-                                ui.div(ui.output_plot("fviz_var_plot",width='100%', height='500px'),align="center"),
-                                ui.hr(),
-                                ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px",align="center"),
-                                ui.div(ui.download_button(id="download_var_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;"),
-                                ui.div(ui.download_button(id="download_var_plot_png",label="png",style = download_btn_style),style="display: inline-block;"),
-                                ui.div(ui.download_button(id="download_var_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;"),
-                                align="center"
-                            )
-                        ),
-                    ),
-                    ui.nav_panel("Valeurs",
-                        ui.input_radio_buttons(id="value_choice",label=ui.h6("Quelles sorties voulez-vous?"),choices=value_choice,inline=True),
-                        ui.br(),
-                        eigen_panel(),
-                        ui.panel_conditional("input.value_choice === 'quanti_var_res'",
-                            ui.input_radio_buttons(id="quanti_var_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","contrib":"Contributions","cos2":"Cos2 - Qualité de la représentation"},selected="coord",width="100%",inline=True),
-                            ui.panel_conditional("input.quanti_var_choice === 'coord'",panel_conditional1(text="quanti_var",name="coord")),
-                            ui.panel_conditional("input.quanti_var_choice === 'contrib'",panel_conditional2(text="quanti_var",name="contrib")),
-                            ui.panel_conditional("input.quanti_var_choice === 'cos2'",panel_conditional2(text="quanti_var",name="cos2"))
-                        ),
-                        ui.panel_conditional("input.value_choice === 'quali_var_res'",
-                            ui.input_radio_buttons(id="mod_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","contrib":"Contributions","cos2":"Cos2 - Qualité de la représentation","vtest":"Value - test"},selected="coord",width="100%",inline=True),
-                            ui.panel_conditional("input.mod_choice === 'coord'",panel_conditional1(text="quali_var",name="coord")),
-                            ui.panel_conditional("input.mod_choice === 'contrib'",panel_conditional2(text="quali_var",name="contrib")),
-                            ui.panel_conditional("input.mod_choice === 'cos2'",panel_conditional2(text="quali_var",name="cos2")),
-                            ui.panel_conditional("input.mod_choice === 'vtest'",panel_conditional1(text="quali_var",name="vtest"))
-                        ),
-                        ui.panel_conditional("input.value_choice === 'var_res'",
-                            ui.input_radio_buttons(id="var_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","contrib":"Contributions","cos2":"Cos2 - Qualité de la représentation"},selected="coord",width="100%",inline=True),
-                            ui.panel_conditional("input.var_choice === 'coord'",panel_conditional1(text="var",name="coord")),
-                            ui.panel_conditional("input.var_choice === 'contrib'",panel_conditional1(text="var",name="contrib")),
-                            ui.panel_conditional("input.var_choice === 'cos2'",panel_conditional1(text="var",name="cos2"))
-                        ),
-                        ui.panel_conditional("input.value_choice === 'ind_res'",
-                            ui.input_radio_buttons(id="ind_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","contrib":"Contributions","cos2":"Cos2 - Qualité de la représentation"},selected="coord",width="100%",inline=True),
-                            ui.panel_conditional("input.ind_choice === 'coord'",panel_conditional1(text="ind",name="coord")),
-                            ui.panel_conditional("input.ind_choice === 'contrib'",panel_conditional2(text="ind",name="contrib")),
-                            ui.panel_conditional("input.ind_choice === 'cos2'",panel_conditional2(text="ind",name="cos2"))
-                        ),
-                        ui.output_ui("ind_sup_panel"),
-                        ui.output_ui("quanti_sup_panel"),
-                        ui.output_ui("quali_sup_panel")
-                    ),
-                    dim_desc_panel(model=model),
-                    ui.nav_panel("Résumé du jeu de données",
-                        ui.input_radio_buttons(id="resume_choice",label=ui.h6("Quelles sorties voulez - vous?"),choices={"stats_desc":"Statistiques descriptives","hist_plot" : "Histogramme","corr_matrix": "Matrice des corrélations","bar_plot":"Diagramme en barres","chi2_test" : "Test de Chi2","others_test":"Autres mesures d'association"},selected="stats_desc",width="100%",inline=True),
-                        ui.br(),
-                        ui.panel_conditional("input.resume_choice === 'stats_desc'",panel_conditional1(text="stats",name="desc")),
-                        ui.panel_conditional("input.resume_choice === 'hist_plot'",
-                            ui.row(
-                                ui.column(2,
-                                    ui.input_select(id="quanti_var_label",label="Choisir une variable",choices={x:x for x in quanti_var_labels},selected=quanti_var_labels[0],width="100%"),
-                                    ui.input_switch(id="add_density",label="Densite",value=False)
-                                ),
-                                ui.column(10,
-                                    ui.div(ui.output_plot("fviz_hist_plot",width='100%', height='500px'),align="center"),
-                                    ui.hr(),
-                                    ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px"),
-                                    ui.div(ui.download_button(id="download_hist_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;"),
-                                    ui.div(ui.download_button(id="download_hist_plot_png",label="png",style = download_btn_style),style="display: inline-block;"),
-                                    ui.div(ui.download_button(id="download_hist_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;"),
-                                    align="center"
-                                )
-                            )
-                        ),
-                        ui.panel_conditional("input.resume_choice === 'corr_matrix'",panel_conditional1(text="corr",name="matrix")),
-                        ui.panel_conditional("input.resume_choice === 'bar_plot'",
-                            ui.row(
-                                ui.column(2,ui.input_select(id="quali_var_label",label="Choisir une variable",choices={x:x for x in quali_var_labels},selected=quali_var_labels[0],width="100%")),
-                                ui.column(10,
-                                    ui.div(ui.output_plot("fviz_bar_plot",width='100%', height='500px'),align="center"),
-                                    ui.hr(),
-                                    ui.div(ui.h6("Téléchargement"),style="display: inline-block;padding: 5px"),
-                                    ui.div(ui.download_button(id="download_bar_plot_jpg",label="jpg",style = download_btn_style),style="display: inline-block;"),
-                                    ui.div(ui.download_button(id="download_bar_plot_png",label="png",style = download_btn_style),style="display: inline-block;"),
-                                    ui.div(ui.download_button(id="download_bar_plot_pdf",label="pdf",style = download_btn_style),style="display: inline-block;"),
-                                    align="center"
-                                )
-                            )
-                        ),
-                        ui.panel_conditional("input.resume_choice === 'chi2_test'",panel_conditional1(text="chi2",name="test")),
-                        ui.panel_conditional("input.resume_choice === 'others_test'",panel_conditional1(text="others",name="test"))
-                    ),
-                    ui.nav_panel("Données",panel_conditional1(text="overall",name="data"))
-                )
-            )
-        )
+            graph_ui["ind_text_quali_sup"] = ui.TagList(ui.input_select(id="ind_text_quali_sup_color",label="Modalités supplémentaires",choices=CSS4_DICT,selected="red",multiple=False,width="100%"))
+            graph_ui["quali_var_text_sup"] = ui.TagList(ui.input_select(id="quali_var_text_sup_color",label="Modalités supplémentaires",choices=CSS4_DICT,selected="blue",multiple=False,width="100%"))
+            graph_ui["var_qual_text_sup"] = ui.TagList(ui.input_select(id="var_qual_text_sup_color",label="Variables qualitatives supplémentaires",choices=CSS4_DICT,selected="red",multiple=False,width="100%"))
+
+        # Axis choices : axes after (resp. before) each axis
+        all_axes = tuple(range(model.call_["n_components"]))
+        axis2_choices = [{i : i for i in all_axes[k+1:]} for k in all_axes]
+        axis1_choices = [{i : i for i in all_axes[:k]} for k in all_axes]
 
         # Server
         def server(input:Inputs, output:Outputs, session:Session):
-            
+
+            # Plots saved for the downloads of the session, in memory
+            saved = {}
+
             #----------------------------------------------------------------------------------------------
-            # Disable x and y axis
+            # Disable x and y axis. The other axis keeps its selection while it is still valid : its select then sends
+            # no new value and the peer effect does not fire back
             @reactive.Effect
             def _():
-                Dim = [i for i in range(model.call_["n_components"]) if i > int(input.axis1())]
-                ui.update_select(id="axis2",label="",choices={x : x for x in Dim},selected=Dim[0])
+                choices = axis2_choices[int(input.axis1())]
+                with reactive.isolate():
+                    axis2 = int(input.axis2())
+                ui.update_select(id="axis2",label="",choices=choices,selected=axis2 if axis2 in choices else next(iter(choices)))
             
             @reactive.Effect
             def _():
-                Dim = [i for i in range(model.call_["n_components"]) if i < int(input.axis2())]
-                ui.update_select(id="axis1",label="",choices={x : x for x in Dim},selected=Dim[0])
+                choices = axis1_choices[int(input.axis2())]
+                with reactive.isolate():
+                    axis1 = int(input.axis1())
+                ui.update_select(id="axis1",label="",choices=choices,selected=axis1 if axis1 in choices else next(iter(choices)))
             
             #--------------------------------------------------------------------------------------------------
             if hasattr(model,"ind_sup_"):
                 @render.ui
                 def ind_text_sup():
-                    return ui.TagList(ui.input_select(id="ind_text_sup_color",label="Individus supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="blue",multiple=False,width="100%"))
+                    return graph_ui["ind_text_sup"]
             
             if hasattr(model,"quali_sup_"):
                 @render.ui
                 def ind_text_quali_sup():
-                    return ui.TagList(ui.input_select(id="ind_text_quali_sup_color",label="Modalités supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="red",multiple=False,width="100%"))
-            
-            #-----------------------------------------------------------------------------------------------------
-            # Disable individuals colors
-            if hasattr(model,"ind_sup_") and hasattr(model,"quali_sup_"):
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.ind_text_quali_actif_color(),input.ind_text_sup_color(),input.ind_text_quali_sup_color()]]},selected="black")
-                
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="ind_text_quali_actif_color",label="Modalités actives",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.ind_text_actif_color(),input.ind_text_sup_color(),input.ind_text_quali_sup_color()]]},selected="green")
-            
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="ind_text_sup_color",label="Individus supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.ind_text_actif_color(),input.ind_text_quali_actif_color(),input.ind_text_quali_sup_color()]]},selected="blue")
-
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="ind_text_quali_sup_color",label="Modalités supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.ind_text_actif_color(),input.ind_text_quali_actif_color(),input.ind_text_sup_color()]]},selected="red")
-            elif hasattr(model,"ind_sup_"):
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.ind_text_quali_actif_color(),input.ind_text_sup_color()]]},selected="black")
-                
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="ind_text_quali_actif_color",label="Modalités actives",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.ind_text_actif_color(),input.ind_text_sup_color()]]},selected="green")
-            
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="ind_text_sup_color",label="Individus supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.ind_text_actif_color(),input.ind_text_quali_actif_color()]]},selected="blue")
-            elif hasattr(model,"quali_sup_"):
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.ind_text_quali_actif_color(),input.ind_text_quali_sup_color()]]},selected="black")
-                
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="ind_text_quali_actif_color",label="Modalités actives",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.ind_text_actif_color(),input.ind_text_quali_sup_color()]]},selected="green")
-
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="ind_text_quali_sup_color",label="Modalités supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.ind_text_actif_color(),input.ind_text_quali_actif_color()]]},selected="red")
-            else:
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.ind_text_quali_actif_color()]},selected="black")
-                
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="ind_text_quali_actif_color",label="Modalités actives",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.ind_text_actif_color()]},selected="green")
+                    return graph_ui["ind_text_quali_sup"]
             
+            # Disable individuals colors : each select excludes the colors chosen in the others
+            ind_color_ids = ["ind_text_actif_color","ind_text_quali_actif_color",*(["ind_text_sup_color"] if hasattr(model,"ind_sup_") else []),*(["ind_text_quali_sup_color"] if hasattr(model,"quali_sup_") else [])]
+            exclusive_colors(input,ind_color_ids,CSS4_NAMES)
+
             #-------------------------------------------------------------------------------------------
             if hasattr(model,"quanti_sup_"):
                 @render.ui
                 def quanti_var_text_sup():
-                    return ui.TagList(ui.input_select(id="quanti_var_text_sup_color",label="Variables quantitatives supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="blue",multiple=False,width="100%"))
+                    return graph_ui["quanti_var_text_sup"]
                 
-                # Disable quantitative variables colors
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="quanti_var_text_actif_color",label="Variables quantitatives actives",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.quanti_var_text_sup_color()]},selected="black")
-                
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="quanti_var_text_sup_color",label="Variables quantitatives supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.quanti_var_text_actif_color()]},selected="blue")
+                # Disable actifs and supplementary quantitative variables colors
+                exclusive_colors(input,["quanti_var_text_actif_color","quanti_var_text_sup_color"],CSS4_NAMES)
 
             #-------------------------------------------------------------------------------------------
             if hasattr(model,"quali_sup_"):
                 @render.ui
                 def quali_var_text_sup():
-                    return ui.TagList(ui.input_select(id="quali_var_text_sup_color",label="Modalités supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="blue",multiple=False,width="100%"))
-                
-                # Disable qualitative variables colors
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="quali_var_text_actif_color",label="Modalités actives",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.quali_var_text_sup_color()]},selected="black")
+                    return graph_ui["quali_var_text_sup"]
                 
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="quali_var_text_sup_color",label="Modalités supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.quali_var_text_actif_color()]},selected="blue")
-            
+                # Disable actifs and supplementary categories colors
+                exclusive_colors(input,["quali_var_text_actif_color","quali_var_text_sup_color"],CSS4_NAMES)
+
             #------------------------------------------------------------------------------------------
             if hasattr(model,"quanti_sup_"):
                 @render.ui
                 def var_quant_text_sup():
-                    return ui.TagList(ui.input_select(id="var_quant_text_sup_color",label="Variables quantitatives supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="blue",multiple=False,width="100%"))
+                    return graph_ui["var_quant_text_sup"]
 
             if hasattr(model,"quali_sup_"):
                 @render.ui
                 def var_qual_text_sup():
-                    return ui.TagList(ui.input_select(id="var_qual_text_sup_color",label="Variables qualitatives supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="red",multiple=False,width="100%"))
+                    return graph_ui["var_qual_text_sup"]
+
+            # Disable variables colors : each select excludes the colors chosen in the others
+            var_color_ids = ["var_quant_text_actif_color","var_qual_text_actif_color",*(["var_quant_text_sup_color"] if hasattr(model,"quanti_sup_") else []),*(["var_qual_text_sup_color"] if hasattr(model,"quali_sup_") else [])]
+            exclusive_colors(input,var_color_ids,CSS4_NAMES)
+
+            # Axes of the factor maps. Changing one axis can leave the pair invalid (axis1 >= axis2) until the other select is
+            # updated : the maps keep their current figure and are only rebuilt once for the new valid pair
+            @reactive.Calc
+            def axes():
+                axis1, axis2 = int(input.axis1()), int(input.axis2())
+                req(axis1 < axis2,cancel_output=True)
+                return axis1, axis2
+
+            # Plots are drawn on the plot thread through draw_plot_async, which keeps the figure drawn for each output : a resize reuses it.
+            # The factor maps, scree plot and contributions/cosines maps come from the cached builders, which return the same
+            # plot for the same parameters : their last drawn figures are kept, so coming back to previous parameters does not
+            # draw again. The summary plots are built anew on each change, so only their last figure is kept.
+            # Outputs in hidden tabs and panels are suspended by Shiny : the calcs only run for the plots on screen.
 
-            #----------------------------------------------------------------------------------------------------
-            # Disable individuals colors
-            if hasattr(model,"quanti_sup_") and hasattr(model,"quali_sup_"):
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="var_quant_text_actif_color",label="Variables quantitatives actives",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.var_qual_text_actif_color(),input.var_quant_text_sup_color(),input.var_qual_text_sup_color()]]},selected="black")
-                
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="var_qual_text_actif_color",label="Variables qualitatives actives",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.var_quant_text_actif_color(),input.var_quant_text_sup_color(),input.var_qual_text_sup_color()]]},selected="green")
-            
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="var_quant_text_sup_color",label="Variables quantitatives supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.var_quant_text_actif_color(),input.var_qual_text_actif_color(),input.var_qual_text_sup_color()]]},selected="blue")
-
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="var_qual_text_sup_color",label="Variables qualitatives supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.var_quant_text_actif_color(),input.var_qual_text_actif_color(),input.var_quant_text_sup_color()]]},selected="red")
-            elif hasattr(model,"quanti_sup_"):
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="var_quant_text_actif_color",label="Variables quantitatives actives",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.var_qual_text_actif_color(),input.var_quant_text_sup_color()]]},selected="black")
-                
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="var_qual_text_actif_color",label="Variables qualitatives actives",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.var_quant_text_actif_color(),input.var_quant_text_sup_color()]]},selected="green")
-            
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="var_quant_text_sup_color",label="Variables quantitatives supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.var_quant_text_actif_color(),input.var_qual_text_actif_color()]]},selected="blue")
-            elif hasattr(model,"quali_sup_"):
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="var_quant_text_actif_color",label="Variables quantitatives actives",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.var_qual_text_actif_color(),input.var_qual_text_sup_color()]]},selected="black")
-                
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="var_qual_text_actif_color",label="Variables qualitatives actives",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.var_quant_text_actif_color(),input.var_qual_text_sup_color()]]},selected="green")
-
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="var_qual_text_sup_color",label="Variables qualitatives supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.var_quant_text_actif_color(),input.var_qual_text_actif_color()]]},selected="red")
-            else:
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="var_quant_text_actif_color",label="variables quantitatives actives",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.var_qual_text_actif_color()]},selected="black")
-                
-                @reactive.Effect
-                def _():
-                    ui.update_select(id="var_qual_text_actif_color",label="Variables qualitatives actives",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.var_quant_text_actif_color()]},selected="green")
-            
             #-----------------------------------------------------------------------------------------
             ## Individuals - FAMD
             #-----------------------------------------------------------------------------------------
             @reactive.Calc
             def plot_ind():
-                if hasattr(model,"ind_sup_"):
-                    ind_sup = True
-                else:
-                    ind_sup = False
-                
-                if hasattr(model,"quali_sup_"):
-                    quali_sup = True
-                else:
-                    quali_sup = False
+                axis1, axis2 = axes()
+                # Only the limit of the selected labels is passed : fviz_famd_ind cannot apply a cos2 and a contribution
+                # limit at once
+                point_select = input.ind_point_select()
+                ind_lim_cos2 = input.ind_lim_cos2() if point_select == "cos2" else None
+                ind_lim_contrib = input.ind_lim_contrib() if point_select == "contrib" else None
 
-                if input.ind_text_color() == "actif/sup":
+                color_mode = input.ind_text_color()
+                actif_color = quali_actif_color = sup_color = quali_sup_color = var_quant = var_qual = add_ellipse = nb_clusters = None
+                if color_mode == "actif/sup":
+                    actif_color, quali_actif_color = input.ind_text_actif_color(), input.ind_text_quali_actif_color()
                     if hasattr(model,"ind_sup_"):
-                        color_sup = input.ind_text_sup_color()
-                    else:
-                        color_sup = None
-                    
+                        sup_color = input.ind_text_sup_color()
                     if hasattr(model,"quali_sup_"):
-                        color_quali_sup = input.ind_text_quali_sup_color()
-                    else:
-                        color_quali_sup = None
- 
-                    fig = fviz_famd_ind(self = model,
-                                        axis = [int(input.axis1()),int(input.axis2())],
-                                        color = input.ind_text_actif_color(),
-                                        color_quali_var = input.ind_text_quali_actif_color(),
-                                        ind_sup = ind_sup,
-                                        quali_sup = quali_sup,
-                                        color_sup = color_sup,
-                                        color_quali_sup = color_quali_sup,
-                                        text_size = input.ind_text_size(),
-                                        lim_contrib =input.ind_lim_contrib(),
-                                        lim_cos2 = input.ind_lim_cos2(),
-                                        title = input.ind_title(),
-                                        repel=input.ind_plot_repel())
-                elif input.ind_text_color() in ["cos2","contrib"]:
-                    fig = fviz_famd_ind(self = model,
-                                        axis = [int(input.axis1()),int(input.axis2())],
-                                        color = input.ind_text_color(),
-                                        ind_sup = ind_sup,
-                                        quali_sup = quali_sup,
-                                        text_size = input.ind_text_size(),
-                                        lim_contrib = input.ind_lim_contrib(),
-                                        lim_cos2 = input.ind_lim_cos2(),
-                                        title = input.ind_title(),
-                                        repel=input.ind_plot_repel())
-                elif input.ind_text_color() == "var_qual":
-                    fig = fviz_famd_ind(self=model,
-                                         axis=[int(input.axis1()),int(input.axis2())],
-                                         text_size = input.ind_text_size(),
-                                         lim_contrib =input.ind_lim_contrib(),
-                                         lim_cos2 = input.ind_lim_cos2(),
-                                         title = input.ind_title(),
-                                         habillage = input.ind_text_var_qual_color(),
-                                         add_ellipses=input.ind_text_add_ellipse(),
-                                         ind_sup=ind_sup,
-                                         quali_sup=quali_sup,
-                                         repel=input.ind_plot_repel())
-                elif  input.ind_text_color() == "var_quant":
-                    fig  = fviz_famd_ind(self=model,
-                                         axis=[int(input.axis1()),int(input.axis2())],
-                                         color = input.ind_text_var_quant_color(),
-                                         text_size = input.ind_text_size(),
-                                         lim_contrib =input.ind_lim_contrib(),
-                                         lim_cos2 = input.ind_lim_cos2(),
-                                         title = input.ind_title(),
-                                         ind_sup = ind_sup,
-                                         quali_sup=quali_sup,
-                                         repel=input.ind_plot_repel())
-                elif input.ind_text_color() == "kmeans":
-                    kmeans = KMeans(n_clusters=input.ind_text_kmeans_nb_clusters(), random_state=np.random.seed(123), n_init="auto").fit(model.ind_["coord"])
-                    fig = fviz_famd_ind(self = model,
-                                       axis = [int(input.axis1()),int(input.axis2())],
-                                       color = kmeans,
-                                       ind_sup = ind_sup,
-                                       quali_sup = quali_sup,
-                                       text_size = input.ind_text_size(),
-                                       lim_contrib = input.ind_lim_contrib(),
-                                       lim_cos2 = input.ind_lim_cos2(),
-                                       title = input.ind_title(),
-                                       repel=input.ind_plot_repel())
-                return fig+pn.theme_gray()
+                        quali_sup_color = input.ind_text_quali_sup_color()
+                elif color_mode == "var_qual":
+                    var_qual, add_ellipse = input.ind_text_var_qual_color(), input.ind_text_add_ellipse()
+                elif color_mode == "var_quant":
+                    var_quant = input.ind_text_var_quant_color()
+                elif color_mode == "kmeans":
+                    nb_clusters = input.ind_text_kmeans_nb_clusters()
+                state = _IndState(axis1,axis2,color_mode,actif_color,quali_actif_color,sup_color,quali_sup_color,var_quant,var_qual,add_ellipse,nb_clusters,
+                                  input.ind_text_size(),ind_lim_contrib,ind_lim_cos2,input.ind_title(),input.ind_plot_repel())
+                return ind_fig(state)
 
             # Individuals - FAMD
+            ind_drawn = {}
             @render.plot(alt="Individuals - FAMD")
-            def fviz_ind_plot():
-                return plot_ind().draw()
-            
-            # import io
-            # @session.download(filename="Individuals-Factor-Map.png")
-            # def IndGraphDownloadPng():
-            #     with io.BytesIO() as buf:
-            #         plt.savefig(RowPlot(), format="png")
-            #         yield buf.getvalue()
+            async def fviz_ind_plot():
+                return await draw_plot_async(plot_ind(),ind_drawn)
+
+            # Download Individuals plot
+            @render.download(filename="Individuals-Factor-Map.jpg")
+            async def download_ind_plot_jpg():
+                yield await plot_bytes(plot_ind(),"jpg",saved)
+
+            @render.download(filename="Individuals-Factor-Map.png")
+            async def download_ind_plot_png():
+                yield await plot_bytes(plot_ind(),"png",saved)
+
+            @render.download(filename="Individuals-Factor-Map.pdf")
+            async def download_ind_plot_pdf():
+                yield await plot_bytes(plot_ind(),"pdf",saved)
 
             #-------------------------------------------------------------------------------------------------
             #   Correlation circle - FAMD
             #-------------------------------------------------------------------------------------------------
             @reactive.Calc
             def plot_quanti_var():
-                if hasattr(model,"quanti_sup_"):
-                    quanti_sup = True
-                else:
-                    quanti_sup = False
-                
-                if input.quanti_var_text_color() == "actif/sup":
+                color_mode = input.quanti_var_text_color()
+                actif_color = sup_color = nb_clusters = None
+                if color_mode == "actif/sup":
+                    actif_color = input.quanti_var_text_actif_color()
                     if hasattr(model,"quanti_sup_"):
-                        color_sup = input.quanti_var_text_sup_color()
-                    else:
-                        color_sup = None
-                    
-                    fig = fviz_famd_col(self = model,
-                                        axis = [int(input.axis1()),int(input.axis2())],
-                                        title = input.quanti_var_title(),
-                                        color = input.quanti_var_text_actif_color(),
-                                        quanti_sup = quanti_sup,
-                                        color_sup = color_sup,
-                                        text_size = input.quanti_var_text_size(),
-                                        lim_contrib = input.quanti_var_lim_contrib(),
-                                        lim_cos2 = input.quanti_var_lim_cos2())
-                elif input.quanti_var_text_color() in ["cos2","contrib"]:
-                    fig = fviz_famd_col(self = model,
-                                        axis = [int(input.axis1()),int(input.axis2())],
-                                        title = input.quanti_var_title(),
-                                        color = input.quanti_var_text_color(),
-                                        quanti_sup = quanti_sup,
-                                        text_size = input.quanti_var_text_size(),
-                                        lim_contrib = input.quanti_var_lim_contrib(),
-                                        lim_cos2 = input.quanti_var_lim_cos2())
-                elif input.quanti_var_text_color() == "kmeans":
-                    kmeans = KMeans(n_clusters=input.quanti_var_text_kmeans_nb_clusters(), random_state=np.random.seed(123), n_init="auto").fit(model.quanti_var_["coord"])
-                    fig = fviz_famd_col(self = model,
-                                       axis = [int(input.axis1()),int(input.axis2())],
-                                       title = input.quanti_var_title(),
-                                       color = kmeans,
-                                       quanti_sup = quanti_sup,
-                                       text_size = input.quanti_var_text_size(),
-                                       lim_contrib = input.quanti_var_lim_contrib(),
-                                       lim_cos2 = input.quanti_var_lim_cos2())
-                return fig + pn.theme_gray()
+                        sup_color = input.quanti_var_text_sup_color()
+                elif color_mode == "kmeans":
+                    nb_clusters = input.quanti_var_text_kmeans_nb_clusters()
+                state = _QuantiVarState(*axes(),color_mode,actif_color,sup_color,nb_clusters,
+                                        input.quanti_var_text_size(),input.quanti_var_lim_contrib(),input.quanti_var_lim_cos2(),input.quanti_var_title())
+                return quanti_var_fig(state)
             
+            quanti_var_drawn = {}
             @render.plot(alt="Correlation circle - FAMD")
-            def fviz_quanti_var_plot():
-                return plot_quanti_var().draw()
+            async def fviz_quanti_var_plot():
+                return await draw_plot_async(plot_quanti_var(),quanti_var_drawn)
+
+            # Download Correlation circle
+            @render.download(filename="Correlation-Circle.jpg")
+            async def download_quanti_var_plot_jpg():
+                yield await plot_bytes(plot_quanti_var(),"jpg",saved)
+
+            @render.download(filename="Correlation-Circle.png")
+            async def download_quanti_var_plot_png():
+                yield await plot_bytes(plot_quanti_var(),"png",saved)
+
+            @render.download(filename="Correlation-Circle.pdf")
+            async def download_quanti_var_plot_pdf():
+                yield await plot_bytes(plot_quanti_var(),"pdf",saved)
 
             #------------------------------------------------------------------------------------
             #  Variables categories - FAMD
             #-----------------------------------------------------------------------------------
             @reactive.Calc
             def plot_quali_var():
-                if hasattr(model,"quali_sup_"):
-                    quali_sup = True
-                else:
-                    quali_sup = False
-                if input.quali_var_text_color() == "actif/sup":
+                color_mode = input.quali_var_text_color()
+                actif_color = sup_color = nb_clusters = None
+                if color_mode == "actif/sup":
+                    actif_color = input.quali_var_text_actif_color()
                     if hasattr(model,"quali_sup_"):
-                        color_sup = input.quali_var_text_sup_color()
-                    else:
-                        color_sup = None
-                    fig = fviz_famd_mod(self = model,
-                                        axis = [int(input.axis1()),int(input.axis2())],
-                                        title = input.quali_var_title(),
-                                        color = input.quali_var_text_actif_color(),
-                                        quali_sup = quali_sup,
-                                        color_sup = color_sup,
-                                        text_size = input.quali_var_text_size(),
-                                        lim_contrib = input.quali_var_lim_contrib(),
-                                        lim_cos2 = input.quali_var_lim_cos2(),
-                                        repel = input.quali_var_plot_repel())
-                elif input.quali_var_text_color() in ["cos2","contrib"]:
-                    fig = fviz_famd_mod(self = model,
-                                        axis = [int(input.axis1()),int(input.axis2())],
-                                        title = input.quali_var_title(),
-                                        color = input.quali_var_text_color(),
-                                        quali_sup = quali_sup,
-                                        text_size = input.quali_var_text_size(),
-                                        lim_contrib = input.quali_var_lim_contrib(),
-                                        lim_cos2 = input.quali_var_lim_cos2(),
-                                        repel = input.quali_var_plot_repel())
-                elif input.quali_var_text_color() == "kmeans":
-                    kmeans = KMeans(n_clusters = input.quali_var_text_kmeans_nb_clusters(), random_state = np.random.seed(123), n_init="auto").fit(model.quali_var_["coord"])
-                    fig = fviz_famd_mod(self = model,
-                                       axis = [int(input.axis1()),int(input.axis2())],
-                                       title = input.quali_var_title(),
-                                       color = kmeans,
-                                       quali_sup = quali_sup,
-                                       text_size = input.quali_var_text_size(),
-                                       lim_contrib = input.quali_var_lim_contrib(),
-                                       lim_cos2 = input.quali_var_lim_cos2(), 
-                                       repel = input.quali_var_plot_repel())
-                return fig + pn.theme_gray()
+                        sup_color = input.quali_var_text_sup_color()
+                elif color_mode == "kmeans":
+                    nb_clusters = input.quali_var_text_kmeans_nb_clusters()
+                state = _QualiVarState(*axes(),color_mode,actif_color,sup_color,nb_clusters,
+                                       input.quali_var_text_size(),input.quali_var_lim_contrib(),input.quali_var_lim_cos2(),input.quali_var_title(),input.quali_var_plot_repel())
+                return quali_var_fig(state)
                 
             # Variables categories - FAMD
+            quali_var_drawn = {}
             @render.plot(alt="Variables categories - FAMD")
-            def fviz_quali_var_plot():
-                return plot_quali_var().draw()
+            async def fviz_quali_var_plot():
+                return await draw_plot_async(plot_quali_var(),quali_var_drawn)
+
+            # Download Variables categories plot
+            @render.download(filename="Variables-Categories-Factor-Map.jpg")
+            async def download_quali_var_plot_jpg():
+                yield await plot_bytes(plot_quali_var(),"jpg",saved)
+
+            @render.download(filename="Variables-Categories-Factor-Map.png")
+            async def download_quali_var_plot_png():
+                yield await plot_bytes(plot_quali_var(),"png",saved)
+
+            @render.download(filename="Variables-Categories-Factor-Map.pdf")
+            async def download_quali_var_plot_pdf():
+                yield await plot_bytes(plot_quali_var(),"pdf",saved)
             
             #------------------------------------------------------------------------------------------------
             # Variables Map
             #-------------------------------------------------------------------------------------------------
             @reactive.Calc
             def plot_var():
-                if hasattr(model,"quanti_sup_"):
-                    color_quanti_sup = input.var_quant_text_sup_color()
-                    quanti_sup = True
-                else:
-                    quanti_sup = False
-                    color_quanti_sup = None
-                
-                if hasattr(model,"quali_sup_"):
-                    quali_sup = True
-                    color_quali_sup = input.var_qual_text_sup_color()
-                else:
-                    quali_sup = False
-                    color_quali_sup = None
-                
-                fig = fviz_famd_var(self=model,
-                                    axis=[int(input.axis1()),int(input.axis2())],
-                                    title = input.var_title(),
-                                    color_quali=input.var_qual_text_actif_color(),
-                                    color_quanti=input.var_quant_text_actif_color(),
-                                    add_quanti_sup=quanti_sup ,
-                                    color_quanti_sup=color_quanti_sup,
-                                    add_quali_sup=quali_sup,
-                                    color_quali_sup=color_quali_sup,
-                                    text_size=input.var_text_size(),
-                                    repel = input.var_plot_repel(),
-                                    ggtheme=pn.theme_gray())
-                return fig
+                quanti_sup_color = input.var_quant_text_sup_color() if hasattr(model,"quanti_sup_") else None
+                quali_sup_color = input.var_qual_text_sup_color() if hasattr(model,"quali_sup_") else None
+                state = _VarState(*axes(),input.var_quant_text_actif_color(),input.var_qual_text_actif_color(),quanti_sup_color,quali_sup_color,
+                                  input.var_text_size(),input.var_title(),input.var_plot_repel())
+                return var_fig(state)
 
             # Variables Factor Map - MCA
+            var_drawn = {}
             @output
             @render.plot(alt="Variables - FAMD")
-            def fviz_var_plot():
-                return plot_var().draw()
+            async def fviz_var_plot():
+                return await draw_plot_async(plot_var(),var_drawn)
+
+            # Download Variables plot
+            @render.download(filename="Variables-Factor-Map.jpg")
+            async def download_var_plot_jpg():
+                yield await plot_bytes(plot_var(),"jpg",saved)
+
+            @render.download(filename="Variables-Factor-Map.png")
+            async def download_var_plot_png():
+                yield await plot_bytes(plot_var(),"png",saved)
+
+            @render.download(filename="Variables-Factor-Map.pdf")
+            async def download_var_plot_pdf():
+                yield await plot_bytes(plot_var(),"pdf",saved)
             
             #-------------------------------------------------------------------------------------------
             ## Eigenvalue - Scree plot
@@ -716,37 +838,17 @@ class FAMDshiny(Base):
             # Reactive Scree plot
             @reactive.Calc
             def plot_eigen():
-                return fviz_eig(self=model,choice=input.fviz_eigen_choice(),add_labels=input.fviz_eigen_label(),ggtheme=pn.theme_gray())
+                return eig_fig(input.fviz_eigen_choice(),input.fviz_eigen_label())
 
             # Render Scree plot
+            eigen_drawn = {}
             @render.plot(alt="Scree Plot - PCA")
-            def fviz_eigen():
-                return plot_eigen().draw()
-            
-            # Eigen value - DataFrame
-            @render.data_frame
-            def eigen_table():
-                eig = model.eig_.round(4).reset_index().rename(columns={"index":"dimensions"})
-                eig.columns = [x.capitalize() for x in eig.columns]
-                return DataTable(data=match_datalength(eig,input.eigen_table_len()),filters=input.eigen_table_filter())
+            async def fviz_eigen():
+                return await draw_plot_async(plot_eigen(),eigen_drawn)
             
             #-----------------------------------------------------------------------------------------
             ## Quantitative variables informations
             #-----------------------------------------------------------------------------------------
-            # Factor coordinates
-            @render.data_frame
-            def quanti_var_coord_table():
-                quanti_var_coord = model.quanti_var_["coord"].round(4).reset_index()
-                quanti_var_coord.columns = ["Variables",*quanti_var_coord.columns[1:]]
-                return  DataTable(data = match_datalength(quanti_var_coord,input.quanti_var_coord_len()),filters=input.quanti_var_coord_filter())
-            
-            # Continuous variables contributions
-            @render.data_frame
-            def quanti_var_contrib_table():
-                quanti_var_contrib = model.quanti_var_["contrib"].round(4).reset_index()
-                quanti_var_contrib.columns = ["Variables",*quanti_var_contrib.columns[1:]]
-                return  DataTable(data=match_datalength(quanti_var_contrib,input.quanti_var_contrib_len()),filters=input.quanti_var_contrib_filter())
-            
             # Variables Contributions Modal Show
             @reactive.Effect
             @reactive.event(input.quanti_var_contrib_graph_btn)
@@ -756,18 +858,12 @@ class FAMDshiny(Base):
             # Plot Individuals Contributions
             @reactive.Calc
             def plot_quanti_var_contrib():
-                return fviz_contrib(self=model,choice="quanti_var",axis=input.quanti_var_contrib_axis(),top_contrib=int(input.quanti_var_contrib_top()),color = input.quanti_var_contrib_color(),bar_width= input.quanti_var_contrib_bar_width(),ggtheme=pn.theme_gray())
+                return contrib_fig("quanti_var",input.quanti_var_contrib_axis(),int(input.quanti_var_contrib_top()),input.quanti_var_contrib_color(),input.quanti_var_contrib_bar_width())
 
+            quanti_var_contrib_drawn = {}
             @render.plot(alt="Quantitative variables contributions Map - FAMD")
-            def fviz_quanti_var_contrib():
-                return plot_quanti_var_contrib().draw()
-            
-            # Square cosinus
-            @render.data_frame
-            def quanti_var_cos2_table():
-                quanti_var_cos2 = model.quanti_var_["cos2"].round(4).reset_index()
-                quanti_var_cos2.columns = ["Variables",*quanti_var_cos2.columns[1:]]
-                return  DataTable(data = match_datalength(quanti_var_cos2,input.quanti_var_cos2_len()),filters=input.quanti_var_cos2_filter())
+            async def fviz_quanti_var_contrib():
+                return await draw_plot_async(plot_quanti_var_contrib(),quanti_var_contrib_drawn)
             
             # Variables Contributions Modal Show
             @reactive.Effect
@@ -778,55 +874,16 @@ class FAMDshiny(Base):
             # Plot Individuals Contributions
             @reactive.Calc
             def plot_quanti_var_cos2():
-                return fviz_cos2(self=model,choice="quanti_var",axis=input.quanti_var_cos2_axis(),top_cos2=int(input.quanti_var_cos2_top()),color = input.quanti_var_cos2_color(),bar_width= input.quanti_var_cos2_bar_width(),ggtheme=pn.theme_gray())
+                return cos2_fig("quanti_var",input.quanti_var_cos2_axis(),int(input.quanti_var_cos2_top()),input.quanti_var_cos2_color(),input.quanti_var_cos2_bar_width())
             
+            quanti_var_cos2_drawn = {}
             @render.plot(alt="Quantitative variables cosinus Map - FAMD")
-            def fviz_quanti_var_cos2():
-                return plot_quanti_var_cos2().draw()
-            
-            #-----------------------------------------------------------------------------------------
-            ## Supplementary quantitative variables
-            #-----------------------------------------------------------------------------------------
-            if hasattr(model,"quanti_sup_"):
-                @render.ui
-                def quanti_sup_panel():
-                    return ui.panel_conditional("input.value_choice == 'quanti_sup_res'",
-                                ui.input_radio_buttons(id="quanti_sup_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","cos2":"Cos2 - Qualité de la représentation"},selected="coord",width="100%",inline=True),
-                                ui.panel_conditional("input.quanti_sup_choice === 'coord'",panel_conditional1(text="quanti_sup",name="coord")),
-                                ui.panel_conditional("input.quanti_sup_choice === 'cos2'",panel_conditional1(text="quanti_sup",name="cos2"))
-                            )
-            
-                # Factor coordinates - correlation with factor
-                @render.data_frame
-                def quanti_sup_coord_table():
-                    quanti_sup_coord = model.quanti_sup_["coord"].round(4).reset_index()
-                    quanti_sup_coord.columns = ["Variables", *quanti_sup_coord.columns[1:]]
-                    return DataTable(data=match_datalength(data=quanti_sup_coord,value=input.quanti_sup_coord_len()),filters=input.quanti_sup_coord_filter())
-                
-                # Square cosinus
-                @render.data_frame
-                def quanti_sup_cos2_table():
-                    quanti_sup_cos2 = model.quanti_sup_["cos2"].round(4).reset_index()
-                    quanti_sup_cos2.columns = ["Variables", *quanti_sup_cos2.columns[1:]]
-                    return DataTable(data=match_datalength(data=quanti_sup_cos2,value=input.quanti_sup_cos2_len()),filters=input.quanti_sup_cos2_filter())
+            async def fviz_quanti_var_cos2():
+                return await draw_plot_async(plot_quanti_var_cos2(),quanti_var_cos2_drawn)
             
             #----------------------------------------------------------------------------------------------------
             ##   Categories/modalités
             #----------------------------------------------------------------------------------------------------
-            # Fcator coordinates
-            @render.data_frame
-            def quali_var_coord_table():
-                quali_var_coord = model.quali_var_["coord"].round(4).reset_index()
-                quali_var_coord.columns = ["Categories",*quali_var_coord.columns[1:]]
-                return DataTable(data=match_datalength(data=quali_var_coord,value=input.quali_var_coord_len()),filters=input.quali_var_coord_filter())
-            
-            # Variables Contributions
-            @render.data_frame
-            def quali_var_contrib_table():
-                quali_var_contrib = model.quali_var_["contrib"].round(4).reset_index()
-                quali_var_contrib.columns = ["Categories",*quali_var_contrib.columns[1:]]
-                return  DataTable(data=match_datalength(data=quali_var_contrib,value=input.quali_var_contrib_len()),filters=input.quali_var_contrib_filter())
-            
             # Add Variables Contributions Modal Show
             @reactive.Effect
             @reactive.event(input.quali_var_contrib_graph_btn)
@@ -835,19 +892,13 @@ class FAMDshiny(Base):
             
             @reactive.Calc
             def plot_quali_var_contrib():
-                return fviz_contrib(self=model,choice="quali_var",axis=input.quali_var_contrib_axis(),top_contrib=int(input.quali_var_contrib_top()),color=input.quali_var_contrib_color(),bar_width=input.quali_var_contrib_bar_width(),ggtheme=pn.theme_gray())
+                return contrib_fig("quali_var",input.quali_var_contrib_axis(),int(input.quali_var_contrib_top()),input.quali_var_contrib_color(),input.quali_var_contrib_bar_width())
 
             # Plot variables Contributions
+            quali_var_contrib_drawn = {}
             @render.plot(alt="Variables/categories contributions Map - FAMD")
-            def fviz_quali_var_contrib():
-                return plot_quali_var_contrib().draw()
-            
-            # Square cosinus
-            @render.data_frame
-            def quali_var_cos2_table():
-                quali_var_cos2 = model.quali_var_["cos2"].round(4).reset_index()
-                quali_var_cos2.columns = ["Categories",*quali_var_cos2.columns[1:]]
-                return  DataTable(data=match_datalength(data=quali_var_cos2,value=input.quali_var_cos2_len()),filters=input.quali_var_cos2_filter())
+            async def fviz_quali_var_contrib():
+                return await draw_plot_async(plot_quali_var_contrib(),quali_var_contrib_drawn)
             
             # Add Variables Cos2 Modal Show
             @reactive.Effect
@@ -857,103 +908,17 @@ class FAMDshiny(Base):
             
             @reactive.Calc
             def plot_quali_var_cos2():
-                return fviz_cos2(self=model,choice="quali_var",axis=input.quali_var_cos2_axis(),top_cos2=int(input.quali_var_cos2_top()),color=input.quali_var_cos2_color(),bar_width=input.quali_var_cos2_bar_width(),ggtheme=pn.theme_gray())
+                return cos2_fig("quali_var",input.quali_var_cos2_axis(),int(input.quali_var_cos2_top()),input.quali_var_cos2_color(),input.quali_var_cos2_bar_width())
 
             # Plot variables categories Cos2
+            quali_var_cos2_drawn = {}
             @render.plot(alt="Variables/categories Cosines Map - FAMD")
-            def fviz_quali_var_cos2():
-                return plot_quali_var_cos2().draw()
-            
-            # Value - test
-            @render.data_frame
-            def quali_var_vtest_table():
-                quali_var_vtest = model.quali_var_["vtest"].round(4).reset_index()
-                quali_var_vtest.columns = ["Categories",*quali_var_vtest.columns[1:]]
-                return  DataTable(data=match_datalength(data=quali_var_vtest,value=input.quali_var_vtest_len()),filters=input.quali_var_vtest_filter())
-            
-            #------------------------------------------------------------------------------------------
-            # Supplementary qualitatives variables
-            #------------------------------------------------------------------------------------------
-            if hasattr(model,"quali_sup_"):
-                @render.ui
-                def quali_sup_panel():
-                    return ui.panel_conditional("input.value_choice == 'quali_sup_res'",
-                                ui.input_radio_buttons(id="quali_sup_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","cos2":"Cos2 - Qualité de la représentation","vtest":"Value-test","eta2" : "Eta2 - Rapport de corrélation"},selected="coord",width="100%",inline=True),
-                                ui.panel_conditional("input.quali_sup_choice === 'coord'",panel_conditional1(text="quali_sup",name="coord")),
-                                ui.panel_conditional("input.quali_sup_choice === 'cos2'",panel_conditional1(text="quali_sup",name="cos2")),
-                                ui.panel_conditional("input.quali_sup_choice === 'vtest'",panel_conditional1(text="quali_sup",name="vtest")),
-                                ui.panel_conditional("input.quali_sup_choice === 'eta2'",panel_conditional1(text="quali_sup",name="eta2"))
-                            )
-            
-                # Factor coordinates
-                @render.data_frame
-                def quali_sup_coord_table():
-                    quali_sup_coord = model.quali_sup_["coord"].round(4).reset_index()
-                    quali_sup_coord.columns = ["Categories", *quali_sup_coord.columns[1:]]
-                    return  DataTable(data = match_datalength(quali_sup_coord,input.quali_sup_coord_len()),filters=input.quali_sup_coord_filter())
-                
-                # Square cosinus
-                @render.data_frame
-                def quali_sup_cos2_table():
-                    quali_sup_cos2 = model.quali_sup_["cos2"].round(4).reset_index()
-                    quali_sup_cos2.columns = ["Categories", *quali_sup_cos2.columns[1:]]
-                    return  DataTable(data = match_datalength(quali_sup_cos2,input.quali_sup_cos2_len()),filters=input.quali_sup_cos2_filter())
-                
-                # Value - Test
-                @render.data_frame
-                def quali_sup_vtest_table():
-                    quali_sup_vtest = model.quali_sup_["vtest"].round(4).reset_index()
-                    quali_sup_vtest.columns = ["Categories", *quali_sup_vtest.columns[1:]]
-                    return  DataTable(data = match_datalength(quali_sup_vtest,input.quali_sup_vtest_len()),filters=input.quali_sup_vtest_filter())
-                
-                # Square correlation ratio
-                @render.data_frame
-                def quali_sup_eta2_table():
-                    quali_sup_eta2 = model.quali_sup_["eta2"].round(4).reset_index()
-                    quali_sup_eta2.columns = ["Variables", *quali_sup_eta2.columns[1:]]
-                    return  DataTable(data = match_datalength(quali_sup_eta2,input.quali_sup_eta2_len()),filters=input.quali_sup_eta2_filter())
-            
-            #-------------------------------------------------------------------------------------------
-            ##   Variables informations
-            #------------------------------------------------------------------------------------------
-            # Factor coordinates
-            @render.data_frame
-            def var_coord_table():
-                var_coord = model.var_["coord"].round(4).reset_index()
-                var_coord.columns = ["Variables",*var_coord.columns[1:]]
-                return DataTable(data = match_datalength(var_coord,input.var_coord_len()),filters=input.var_coord_filter())
-            
-            # Contributions
-            @render.data_frame
-            def var_contrib_table():
-                var_contrib = model.var_["contrib"].round(4).reset_index()
-                var_contrib.columns = ["Variables",*var_contrib.columns[1:]]
-                return  DataTable(data=match_datalength(var_contrib,input.var_contrib_len()),filters=input.var_contrib_filter())
+            async def fviz_quali_var_cos2():
+                return await draw_plot_async(plot_quali_var_cos2(),quali_var_cos2_drawn)
             
-            # Square cosinus
-            @render.data_frame
-            def var_cos2_table():
-                var_cos2 = model.var_["cos2"].round(4).reset_index()
-                var_cos2.columns = ["Variables",*var_cos2.columns[1:]]
-                return  DataTable(data=match_datalength(var_cos2,input.var_cos2_len()),filters=input.var_cos2_filter())
-
             #--------------------------------------------------------------------------------------------------------
             ## Individuals informations
             #--------------------------------------------------------------------------------------------------------
-            # Factor coordinates
-            @render.data_frame
-            def ind_coord_table():
-                ind_coord = model.ind_["coord"].round(4).reset_index()
-                ind_coord.columns = ["Individus", *ind_coord.columns[1:]]
-                return DataTable(data = match_datalength(ind_coord,input.ind_coord_len()),filters=input.ind_coord_filter())
-            
-            # Individuals Contributions
-            @render.data_frame
-            def ind_contrib_table():
-                ind_contrib = model.ind_["contrib"].round(4).reset_index()
-                ind_contrib.columns = ["Individus", *ind_contrib.columns[1:]]
-                return  DataTable(data=match_datalength(ind_contrib,input.ind_contrib_len()),filters=input.ind_contrib_filter())
-            
             # Add indiviuals Contributions Modal Show
             @reactive.Effect
             @reactive.event(input.ind_contrib_graph_btn)
@@ -962,19 +927,13 @@ class FAMDshiny(Base):
             
             @reactive.Calc
             def ind_contrib_plot():
-                return fviz_contrib(self=model,choice="ind",axis=input.ind_contrib_axis(),top_contrib=int(input.ind_contrib_top()),color = input.ind_contrib_color(),bar_width= input.ind_contrib_bar_width(),ggtheme=pn.theme_gray())
+                return contrib_fig("ind",input.ind_contrib_axis(),int(input.ind_contrib_top()),input.ind_contrib_color(),input.ind_contrib_bar_width())
 
             # Plot Individuals Contributions
+            ind_contrib_drawn = {}
             @render.plot(alt="Individuals Contributions Map - FAMD")
-            def fviz_ind_contrib():
-                return ind_contrib_plot().draw()
-            
-            # Square cosinus
-            @render.data_frame
-            def ind_cos2_table():
-                ind_cos2 = model.ind_["cos2"].round(4).reset_index()
-                ind_cos2.columns = ["Individus", *ind_cos2.columns[1:]]
-                return  DataTable(data = match_datalength(ind_cos2,input.ind_cos2_len()),filters=input.ind_cos2_filter())
+            async def fviz_ind_contrib():
+                return await draw_plot_async(ind_contrib_plot(),ind_contrib_drawn)
             
             # Add Variables Cos2 Modal Show
             @reactive.Effect
@@ -984,99 +943,73 @@ class FAMDshiny(Base):
             
             @reactive.Calc
             def ind_cos2_plot():
-                return fviz_cos2(self=model,choice="ind",axis=input.ind_cos2_axis(),top_cos2=int(input.ind_cos2_top()),color=input.ind_cos2_color(),bar_width=input.ind_cos2_bar_width(),ggtheme=pn.theme_gray())
+                return cos2_fig("ind",input.ind_cos2_axis(),int(input.ind_cos2_top()),input.ind_cos2_color(),input.ind_cos2_bar_width())
 
             # Plot variables Cos2
+            ind_cos2_drawn = {}
             @render.plot(alt="Individuals Cosines Map - FAMD")
-            def fviz_ind_cos2(): 
-                return ind_cos2_plot().draw()
-            
-            #---------------------------------------------------------------------------------------------
-            ## Supplementary individuals informations
-            #---------------------------------------------------------------------------------------------
-            if hasattr(model,"ind_sup_"):
-                @render.ui
-                def ind_sup_panel():
-                    return ui.panel_conditional("input.value_choice == 'ind_sup_res'",
-                                ui.input_radio_buttons(id="ind_sup_choice",label=ui.h6("Quel type de résultats?"),choices={"coord":"Coordonnées","cos2":"Cos2 - Qualité de la représentation"},selected="coord",width="100%",inline=True),
-                                ui.panel_conditional("input.ind_sup_choice === 'coord'",panel_conditional1(text="ind_sup",name="coord")),
-                                ui.panel_conditional("input.ind_sup_choice === 'cos2'",panel_conditional1(text="ind_sup",name="cos2"))
-                            )
-                
-                # Factor coordinates
-                @render.data_frame
-                def ind_sup_coord_table():
-                    ind_sup_coord = model.ind_sup_["coord"].round(4).reset_index()
-                    ind_sup_coord.columns = ["Individus", *ind_sup_coord.columns[1:]]
-                    return  DataTable(data = match_datalength(ind_sup_coord,input.ind_sup_coord_len()),filters=input.ind_sup_coord_filter())
-                
-                # Square cosinus
-                @render.data_frame
-                def ind_sup_cos2_table():
-                    ind_sup_cos2 = model.ind_sup_["cos2"].round(4).reset_index()
-                    ind_sup_cos2.columns = ["Individus", *ind_sup_cos2.columns[1:]]
-                    return  DataTable(data = match_datalength(ind_sup_cos2,input.ind_sup_cos2_len()),filters=input.ind_sup_cos2_filter())
+            async def fviz_ind_cos2():
+                return await draw_plot_async(ind_cos2_plot(),ind_cos2_drawn)
             
             #----------------------------------------------------------------------------------------
             ## Description of axis
             #----------------------------------------------------------------------------------------
-            @reactive.Effect
-            def _():
-                Dimdesc = dimdesc(self=model,axis=None,proba=float(input.dim_desc_pvalue()))[input.dim_desc_axis()]
+            # Computed when the tab is shown : its outputs are suspended while hidden.
+            # All the axes are described at once : changing the axis is a lookup, only a new p-value reruns dimdesc
+            @reactive.Calc
+            def dim_desc_all():
+                return dim_desc_cache(float(input.dim_desc_pvalue()))
+
+            @reactive.Calc
+            def dim_desc_result():
+                return dim_desc_all()[input.dim_desc_axis()]
+
+            @render.ui
+            def dim_desc():
+                Dimdesc = dim_desc_result()
+                if "quanti" in Dimdesc.keys() and "quali" in Dimdesc.keys():
+                    return ui.TagList(
+                        ui.input_radio_buttons(id="dim_desc_choice",label=ui.h6("Choice"),choices={"quanti" : "Quantitative","quali" : "Qualitative"},selected="quanti",width="100%",inline=True),
+                        ui.panel_conditional("input.dim_desc_choice === 'quanti'",panel_conditional1(text="quanti",name="desc")),
+                        ui.panel_conditional("input.dim_desc_choice === 'quali'",panel_conditional1(text="quali",name="desc"))
+                    )
+                elif "quanti" in Dimdesc.keys() and "quali" not in Dimdesc.keys():
+                    return ui.TagList(
+                        ui.input_radio_buttons(id="dim_desc_choice",label=ui.h6("Choice"),choices={"quanti" : "Quantitative"},selected="quanti",width="100%",inline=True),
+                        ui.panel_conditional("input.dim_desc_choice === 'quanti'",panel_conditional1(text="quanti",name="desc"))
+                    )
+
+            @render.data_frame
+            def quanti_desc_table():
+                Dimdesc = dim_desc_result()
+                req("quanti" in Dimdesc.keys())
+                data = Dimdesc["quanti"].round(4).reset_index().rename(columns={"index":"Variables"})
+                return  DataTable(data = match_datalength(data,input.quanti_desc_len()),filters=input.quanti_desc_filter())
+
+            @render.data_frame
+            def quali_desc_table():
+                Dimdesc = dim_desc_result()
+                req("quali" in Dimdesc.keys())
+                data = Dimdesc["quali"].round(4).reset_index().rename(columns={"index":"Variables"})
+                return  DataTable(data = match_datalength(data,input.quali_desc_len()),filters=input.quali_desc_filter())
 
-                @output
-                @render.ui
-                def dim_desc():
-                    if "quanti" in Dimdesc.keys() and "quali" in Dimdesc.keys():
-                        return ui.TagList(
-                            ui.input_radio_buttons(id="dim_desc_choice",label=ui.h6("Choice"),choices={"quanti" : "Quantitative","quali" : "Qualitative"},selected="quanti",width="100%",inline=True),
-                            ui.panel_conditional("input.dim_desc_choice === 'quanti'",panel_conditional1(text="quanti",name="desc")),
-                            ui.panel_conditional("input.dim_desc_choice === 'quali'",panel_conditional1(text="quali",name="desc"))
-                        )
-                    elif "quanti" in Dimdesc.keys() and "quali" not in Dimdesc.keys():
-                        return ui.TagList(
-                            ui.input_radio_buttons(id="dim_desc_choice",label=ui.h6("Choice"),choices={"quanti" : "Quantitative"},selected="quanti",width="100%",inline=True),
-                            ui.panel_conditional("input.dim_desc_choice === 'quanti'",panel_conditional1(text="quanti",name="desc"))
-                        )
-                    
-                if "quanti" in Dimdesc.keys():
-                    @render.data_frame
-                    def quanti_desc_table():
-                        data = Dimdesc["quanti"].round(4).reset_index().rename(columns={"index":"Variables"})
-                        return  DataTable(data = match_datalength(data,input.quanti_desc_len()),filters=input.quanti_desc_filter())
-                
-                if "quali" in Dimdesc.keys():
-                    @render.data_frame
-                    def quali_desc_table():
-                        data = Dimdesc["quali"].round(4).reset_index().rename(columns={"index":"Variables"})
-                        return  DataTable(data = match_datalength(data,input.quali_desc_len()),filters=input.quali_desc_filter())
-                    
             #-----------------------------------------------------------------------------------------------
             ## Summary of data
             #-----------------------------------------------------------------------------------------------
             # Quantitative data
             @reactive.Calc
             def quanti_data():
-                data = model.call_["Xtot"].loc[:,quanti_var_labels].astype("float")
-                if hasattr(model,"ind_sup_"):
-                    data = data.drop(index=model.call_["ind_sup"])
-                return data
+                return active_data.loc[:,quanti_var_labels].astype("float")
             
             # Qualitative data
             @reactive.Calc
             def quali_data():
-                data = model.call_["Xtot"].loc[:,quali_var_labels].astype("object")
-                if hasattr(model,"ind_sup_"):
-                    data = data.drop(index=model.call_["ind_sup"])
-                return data
+                return active_data.loc[:,quali_var_labels].astype("object")
 
             # Descriptive statistics
             @render.data_frame
             def stats_desc_table():
-                data = model.call_["Xtot"]
-                if hasattr(model,"ind_sup_"):
-                    data = data.drop(index=model.call_["ind_sup"])
-                stats_desc = data.describe(include="all").round(4).T.reset_index().rename(columns={"index":"Variables"})
+                stats_desc = active_data.describe(include="all").round(4).T.reset_index().rename(columns={"index":"Variables"})
                 return  DataTable(data = match_datalength(stats_desc,input.stats_desc_len()),filters=input.stats_desc_filter())
             
             # Histogram plot
@@ -1090,9 +1023,23 @@ class FAMDshiny(Base):
                     p = p + pn.geom_histogram(color="black", fill="gray")
                 return p + pn.ggtitle(f"Histogram de {input.quanti_var_label()}")
 
+            hist_drawn = {}
             @render.plot(alt="Histogram - FAMD")
-            def fviz_hist_plot():
-                return plot_hist().draw()
+            async def fviz_hist_plot():
+                return await draw_plot_async(plot_hist(),hist_drawn,maxsize=1)
+
+            # Download Histogram
+            @render.download(filename="Histogram.jpg")
+            async def download_hist_plot_jpg():
+                yield await plot_bytes(plot_hist(),"jpg",saved)
+
+            @render.download(filename="Histogram.png")
+            async def download_hist_plot_png():
+                yield await plot_bytes(plot_hist(),"png",saved)
+
+            @render.download(filename="Histogram.pdf")
+            async def download_hist_plot_pdf():
+                yield await plot_bytes(plot_hist(),"pdf",saved)
 
             # Pearson correlation matrix
             @render.data_frame
@@ -1105,9 +1052,23 @@ class FAMDshiny(Base):
             def plot_bar():
                 return pn.ggplot(quali_data(),pn.aes(x=input.quali_var_label()))+pn.geom_bar(color="black", fill="gray")
             
+            bar_drawn = {}
             @render.plot(alt="Bar-Plot")
-            def fviz_bar_plot():
-                return plot_bar().draw()
+            async def fviz_bar_plot():
+                return await draw_plot_async(plot_bar(),bar_drawn,maxsize=1)
+
+            # Download Bar plot
+            @render.download(filename="Bar-Plot.jpg")
+            async def download_bar_plot_jpg():
+                yield await plot_bytes(plot_bar(),"jpg",saved)
+
+            @render.download(filename="Bar-Plot.png")
+            async def download_bar_plot_png():
+                yield await plot_bytes(plot_bar(),"png",saved)
+
+            @render.download(filename="Bar-Plot.pdf")
+            async def download_bar_plot_pdf():
+                yield await plot_bytes(plot_bar(),"pdf",saved)
             
             # Chi2 test
             @render.data_frame
@@ -1155,6 +1116,27 @@ class FAMDshiny(Base):
                 overall_data = model.call_["Xtot"].reset_index().rename(columns={"index":"Individus"})
                 return DataTable(data = match_datalength(overall_data,input.overall_data_len()),filters=input.overall_data_filter())
             
+            #---------------------------------------------------------------------------------------------------
+            ## Tables : one renderer per prepared table, reading its display length and filter inputs
+            #---------------------------------------------------------------------------------------------------
+            # DataTable of each table, display length and filter switch : built once per session (a DataTable holds the
+            # selection and filters of its session)
+            @lru_cache(maxsize=None)
+            def table_view(name,length,filters):
+                return DataTable(data=match_datalength(tables[name],length),filters=filters)
+
+            def table_output(name,prefix,output_id):
+                def table():
+                    return table_view(name,input[prefix+"_len"](),input[prefix+"_filter"]())
+                table.__name__ = output_id
+                render.data_frame(table)
+
+            for name in tables:
+                if name == "eigen":
+                    table_output(name,"eigen_table","eigen_table")
+                else:
+                    table_output(name,name,name+"_table")
+
             #-----------------------------------------------------------------------------------------------------------------------
             ## Close the session
             #------------------------------------------------------------------------------------------------------------------------
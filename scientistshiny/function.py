@@ -1,7 +1,21 @@
 # -*- coding: utf-8 -*-
-from shiny import ui, render
+from shiny import ui, render, reactive
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+import asyncio
+import importlib.util
+import inspect
+import io
+import logging
+import time
+import numpy as np
+import numexpr as ne
+import pandas as pd
+import matplotlib
 import matplotlib.colors as mcolors
+import plotnine as pn
 from pathlib import Path
+from types import MappingProxyType
 
 # CSS path
 css_path = Path(__file__).parent / "www" / "style.css"
@@ -9,15 +23,26 @@ css_path = Path(__file__).parent / "www" / "style.css"
 # Download Btn Background
 download_btn_style = "background-color: #1C2951;"
 
+# CSS4 colors names and choices (read-only, shared by all apps)
+CSS4_NAMES = tuple(mcolors.CSS4_COLORS)
+CSS4_DICT = MappingProxyType({c : c for c in CSS4_NAMES})
+
+# Theme of all the graphs (plotnine copies the plot, theme included, when drawing : one instance is shared by all apps)
+PLOT_THEME = pn.theme_gray()
+
 def header(title=None,model_name=None):
     return ui.panel_title(ui.div(ui.h1(title),align="center",style="background-color:#2e4053;font-family: Cambria,Georgia,serif;"),window_title=model_name+"shiny")
 
 def axes_input_select(model=None):
+    # Same choices for both axes
+    choices = {x:x for x in range(model.call_["n_components"])}
     return ui.TagList(
-        ui.div(ui.input_select(id="axis1",label="",choices={x:x for x in range(model.call_["n_components"])},selected=0,multiple=False),style="display: inline-block;"),
-        ui.div(ui.input_select(id="axis2",label="",choices={x:x for x in range(model.call_["n_components"])},selected=1,multiple=False),style="display: inline-block;"),
+        ui.div(ui.input_select(id="axis1",label="",choices=choices,selected=0,multiple=False),style="display: inline-block;"),
+        ui.div(ui.input_select(id="axis2",label="",choices=choices,selected=1,multiple=False),style="display: inline-block;"),
     )
 
+# Sliders (and text inputs) are debounced by Shiny in the browser (250 ms) : a drag only sends its settled value,
+# so the plots read them directly
 def text_size_input(which=None):
     return ui.input_slider(id=which+"_text_size",label="Taille des libellés",min=8,max=20,value=8,step=2,ticks=False)
 
@@ -139,14 +164,171 @@ def panel_conditional2(text=str,name=str):
 
 # Match with data
 def match_datalength(data,value):
+    # Nothing to slice when the data fits in a head/tail view
+    if value == "all" or data.shape[0] <= 6:
+        return data
     match value:
         case "head":
             return data.head(6)
         case "tail":
             return data.tail(6)
-        case "all":
-            return data
         
+# Round a numeric DataFrame on its underlying array
+def round_dataframe(data,decimals=4):
+    return pd.DataFrame(np.round(data.to_numpy(copy=False),decimals),index=data.index,columns=data.columns)
+
+# Rounded results with their labels as first column, named label
+def result_table(data,label,decimals=4):
+    table = round_dataframe(data,decimals)
+    # Named index : reset_index gives the label column directly (a new Index, the model's one is left untouched)
+    table.index = table.index.rename(label)
+    return table.reset_index()
+
+# Qualitative columns with repeated values stored as categorical : integer codes instead of one Python object per row.
+# Columns of unique labels are left as they are (categories would only add the codes).
+def categorize(data):
+    quali = [x for x in data.columns if data[x].dtype == object and data[x].nunique() < data.shape[0]/2]
+    if quali:
+        data = data.astype(dict.fromkeys(quali,"category"))
+    return data
+
+# Integer columns (e.g. the counts of a contingency table) stored with the smallest integer type holding their values
+def downcast_integers(data):
+    ints = data.select_dtypes(np.integer).columns
+    if len(ints):
+        data = data.astype({x : pd.to_numeric(data[x],downcast="integer").dtype for x in ints})
+    return data
+
+# Profiles (in percentage) of a contingency table, multithreaded with numexpr on large tables. Each cell is divided by
+# its margin (100*X/margin, as rounded in the tables : no reciprocal product). With total, the profiles are written in a
+# single array ending with their totals (100 by construction).
+def profiles(X,axis=0,total=False):
+    margin = X.sum(axis=axis,keepdims=True)
+    shape = list(X.shape)
+    if total:
+        shape[axis] += 1
+    out = np.full(shape,100.0)
+    if X.size > 10000:
+        ne.evaluate("100*X/margin",out=out[:X.shape[0],:X.shape[1]])
+    else:
+        np.divide(100*X,margin,out=out[:X.shape[0],:X.shape[1]])
+    return out
+
+# Draw a plotnine object, reusing the figures drawn for the last maxsize objects of an output (e.g. when the output
+# is resized, or when coming back to previous parameters : the plot builders return the same object)
+def draw_plot(plot,drawn,maxsize=8):
+    entry = drawn.pop(plot,None)
+    if entry is None:
+        figure = plot.draw()
+        entry = (figure,figure.get_size_inches(),figure.dpi)
+        if len(drawn) >= maxsize:
+            del drawn[next(iter(drawn))]
+    # Most recently used last
+    drawn[plot] = entry
+    # Shiny resizes the figure to the output and multiplies its dpi by the pixel ratio : restore the drawn size and dpi,
+    # so that the figure keeps following the container and its dpi does not grow on each render
+    figure, size, dpi = entry
+    figure.set_size_inches(size)
+    figure.set_dpi(dpi)
+    return figure
+
+# Builtin non-interactive backends : listed by the backend registry since matplotlib 3.9 (rcsetup.non_interactive_bk before)
+try:
+    from matplotlib.backends import BackendFilter, backend_registry
+    _NON_INTERACTIVE_BACKENDS = frozenset(backend_registry.list_builtin(BackendFilter.NON_INTERACTIVE))
+except ImportError:
+    _NON_INTERACTIVE_BACKENDS = frozenset(matplotlib.rcsetup.non_interactive_bk)
+
+# Plots are drawn, and downloads saved, on a single worker thread, off the event loop : plotnine sets its theme through
+# matplotlib's global rcParams, so draws must not overlap. Shiny's render.plot still saves the returned figure to PNG on
+# the event loop, possibly next to a draw on this thread : that save only renders the artists already styled by the draw
+plot_executor = ThreadPoolExecutor(max_workers=1,thread_name_prefix="scientistshiny-plot")
+
+# Run a plot function (draw or save) on the plot thread. Interactive backends keep everything on the main thread.
+async def run_plot(fn,*args):
+    if matplotlib.get_backend().lower() not in _NON_INTERACTIVE_BACKENDS:
+        return fn(*args)
+    return await asyncio.get_running_loop().run_in_executor(plot_executor,fn,*args)
+
+# Draw a plotnine object on the plot thread (the figures already drawn are looked up there too)
+async def draw_plot_async(plot,drawn,maxsize=8):
+    return await run_plot(draw_plot,plot,drawn,maxsize)
+
+# Timings of the outputs, logged at debug level : logging.getLogger("scientistshiny").setLevel(logging.DEBUG)
+logger = logging.getLogger("scientistshiny")
+
+# Accumulate the number of calls and the time (ns) spent in a render function (sync or async) into timings[name].
+# Left undecorated when debug logging is off for the sessions started then.
+def timed(timings,name=None):
+    def decorator(fn):
+        if not logger.isEnabledFor(logging.DEBUG):
+            return fn
+        key = name or fn.__name__
+        def record(start):
+            calls, total = timings.get(key,(0,0))
+            timings[key] = (calls + 1,total + time.perf_counter_ns() - start)
+        if inspect.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def wrapper(*args,**kwargs):
+                start = time.perf_counter_ns()
+                try:
+                    return await fn(*args,**kwargs)
+                finally:
+                    record(start)
+        else:
+            @wraps(fn)
+            def wrapper(*args,**kwargs):
+                start = time.perf_counter_ns()
+                try:
+                    return fn(*args,**kwargs)
+                finally:
+                    record(start)
+        return wrapper
+    return decorator
+
+# Log the timings of a session, slowest outputs first
+def log_timings(timings):
+    for key, (calls, total) in sorted(timings.items(),key=lambda x : x[1][1],reverse=True):
+        logger.debug("%s : %d call(s), %.1f ms",key,calls,total/1e6)
+
+# Vector formats are rendered with cairo when pycairo is installed, raster formats keep Agg
+_VECTOR_BACKEND = "cairo" if importlib.util.find_spec("cairo") is not None else None
+
+# Plotnine object saved in memory in a given format (png, jpg, pdf), reusing the bytes saved for the last maxsize
+# (plot, format) of a session, for repeated downloads. No temporary file is written and read back
+def save_plot(plot,format,saved,maxsize=8):
+    key = (plot,format)
+    data = saved.pop(key,None)
+    if data is None:
+        backend = _VECTOR_BACKEND if format in ("pdf","svg","ps","eps") else None
+        with io.BytesIO() as buf:
+            plot.save(buf,format=format,verbose=False,backend=backend)
+            data = buf.getvalue()
+        if len(saved) >= maxsize:
+            del saved[next(iter(saved))]
+    # Most recently used last
+    saved[key] = data
+    return data
+
+# Bytes of a plotnine object, saved on the plot thread : the download handlers yield them
+async def plot_bytes(plot,format,saved):
+    return await run_plot(save_plot,plot,format,saved)
+
+# Keep a group of color selects disjoint : each select excludes the colors chosen in the others.
+# Selects are only updated when their excluded colors change, and keep their current value.
+def exclusive_colors(input,ids,colors):
+    # Last excluded colors of each select (plain dict : it must not be a reactive dependency of the effect)
+    last_excluded = {}
+    @reactive.Effect
+    def _():
+        selected = {x : input[x]() for x in ids}
+        chosen = frozenset(selected.values())
+        for x in ids:
+            excluded = chosen - {selected[x]}
+            if excluded != last_excluded.get(x):
+                last_excluded[x] = excluded
+                ui.update_select(id=x,choices=[c for c in colors if c not in excluded],selected=selected[x])
+
 # Return DaaFrame as DaaTable
 def DataTable(data,filters=False):
     return render.DataTable(data,filters=filters,selection_mode="rows")
@@ -158,7 +340,7 @@ def graph_modal_show(text=str,name=str,max_axis=3):
                 ui.row(
                     ui.column(3,ui.input_numeric(id=text+"_"+name+"_axis",label="Choix de l'axe :",min=0,max=max_axis-1,value=0)),
                     ui.column(3,ui.input_text(id=text+"_"+name+"_top",label="Top "+name,value=10,placeholder="Entrer un nombre")),
-                    ui.column(3,ui.input_select(id=text+"_"+name+"_color",label="Couleur",choices={x:x for x in mcolors.CSS4_COLORS},selected="steelblue")),
+                    ui.column(3,ui.input_select(id=text+"_"+name+"_color",label="Couleur",choices=CSS4_DICT,selected="steelblue")),
                     ui.column(3,ui.input_slider(id=text+"_"+name+"_bar_width",label="Largeur des barres",min=0.1,max=1,value=0.5,step=0.1))
                 ),
                 class_="d-flex gap-4"
@@ -5,7 +5,6 @@ import numpy as np
 import scipy as sp
 import pandas as pd
 import plotnine as pn
-import matplotlib.colors as mcolors
 from sklearn.cluster import KMeans
 from scientisttools import MCA,fviz_mca_ind,fviz_mca_mod,fviz_mca_var,fviz_eig, fviz_contrib,fviz_cos2,fviz_corrcircle, dimdesc
 from scientistshiny.base import Base
@@ -110,7 +109,7 @@ class MCAshiny(Base):
         resume_choices = {"stats_desc":"Statistiques descriptives","bar_plot":"Diagramme en barres","chi2_test" : "Test de Chi2","others_test":"Autres mesures d'association"}
 
         # Qualitative variables labels
-        var_labels = model.call_["X"].columns.tolist()
+        var_labels = model.call_["X"].columns
         
         # Initialise value choice
         value_choice = {"eigen_res":"Valeurs propres","mod_res":"Résultats des modalités","ind_res":"Résultats sur les individus","var_res":"Résultats sur les variables"}
@@ -122,7 +121,7 @@ class MCAshiny(Base):
         # Check if supplementary qualitatives variables
         if hasattr(model,"quali_sup_"):
             value_choice = {**value_choice,**{"quali_sup_res" : "Résultats des variables qualitatives supplémentaires"}}
-            var_labels = [*var_labels,*model.quali_sup_["eta2"].index.tolist()]
+            var_labels = var_labels.append(model.quali_sup_["eta2"].index)
 
         # Check if supplementary quantitatives variables
         if hasattr(model,"quanti_sup_"):
@@ -152,7 +151,7 @@ class MCAshiny(Base):
                             ui.panel_conditional("input.ind_point_select === 'contrib'",ui.div(lim_contrib("ind_lim_contrib"),align="center")              ),
                             text_color_input(id="ind_text_color",choices=ind_text_color_choices),
                             ui.panel_conditional("input.ind_text_color === 'actif/sup'",
-                                ui.input_select(id="ind_text_actif_color",label="Individus actifs",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"),
+                                ui.input_select(id="ind_text_actif_color",label="Individus actifs",choices=CSS4_DICT,selected="black",multiple=False,width="100%"),
                                 ui.output_ui("ind_text_sup")
                             ),
                             ui.panel_conditional("input.ind_text_color === 'kmeans'",ui.input_numeric(id="ind_text_kmeans_nb_clusters",label="Choix du nombre de clusters",value=2,min=1,max=model.ind_["coord"].shape[0],step=1,width="100%")),
@@ -171,7 +170,7 @@ class MCAshiny(Base):
                             ui.panel_conditional("input.mod_point_select === 'contrib'",ui.div(lim_contrib(id="mod_lim_contrib"),align="center")),
                             text_color_input(id="mod_text_color",choices={"actif/sup":"actifs/supplémentaires","cos2":"Cosinus","contrib":"Contribution","kmeans":"KMeans"}),
                             ui.panel_conditional("input.mod_text_color === 'actif/sup'",
-                                ui.input_select(id="mod_text_actif_color",label="Modalités actives",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"),
+                                ui.input_select(id="mod_text_actif_color",label="Modalités actives",choices=CSS4_DICT,selected="black",multiple=False,width="100%"),
                                 ui.output_ui("mod_text_sup")
                             ),
                             ui.panel_conditional("input.mod_text_color === 'kmeans'",ui.input_numeric(id="mod_text_kmeans_nb_clusters",label="Choix du nombre de clusters",value=2,min=1,max=model.var_["coord"].shape[0],step=1,width="100%")),
@@ -183,7 +182,7 @@ class MCAshiny(Base):
                             point_select_input(id="var_point_select"),
                             ui.panel_conditional("input.var_point_select === 'cos2'",ui.div(lim_cos2(id="var_lim_cos2"),align="center")),
                             ui.panel_conditional("input.var_point_select === 'contrib'",ui.div(lim_contrib(id="var_lim_contrib"),align="center")),
-                            ui.input_select(id="var_text_actif_color",label="Variables actives",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"),
+                            ui.input_select(id="var_text_actif_color",label="Variables actives",choices=CSS4_DICT,selected="black",multiple=False,width="100%"),
                             ui.output_ui("var_text_quali_sup"),
                             ui.output_ui("var_text_quanti_sup"),
                             ui.input_switch(id="var_plot_repel",label="repel",value=True)
@@ -305,16 +304,18 @@ class MCAshiny(Base):
             if hasattr(model,"ind_sup_"):
                 @render.ui
                 def ind_text_sup():
-                    return ui.TagList(ui.input_select(id="ind_text_sup_color",label="Individus supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="blue",multiple=False))
+                    return ui.TagList(ui.input_select(id="ind_text_sup_color",label="Individus supplémentaires",choices=CSS4_DICT,selected="blue",multiple=False))
             
                 # Disable colors
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.ind_text_sup_color()]},selected="black")
+                    excluded = input.ind_text_sup_color()
+                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices=[c for c in CSS4_NAMES if c != excluded],selected="black")
                 
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="ind_text_sup_color",label="Individus supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.ind_text_actif_color()]},selected="blue")
+                    excluded = input.ind_text_actif_color()
+                    ui.update_select(id="ind_text_sup_color",label="Individus supplémentaires",choices=[c for c in CSS4_NAMES if c != excluded],selected="blue")
             
             #---------------------------------------------------------------------------------------------------------------
             if hasattr(model,"quanti_sup_"):
@@ -327,58 +328,67 @@ class MCAshiny(Base):
             if hasattr(model,"quali_sup_"):
                 @render.ui
                 def mod_text_sup():
-                    return ui.TagList(ui.input_select(id="mod_text_sup_color",label="Modalités supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="blue",multiple=False,width="100%"))
+                    return ui.TagList(ui.input_select(id="mod_text_sup_color",label="Modalités supplémentaires",choices=CSS4_DICT,selected="blue",multiple=False,width="100%"))
            
                 # Disabled Variables Categories Text Colors
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="mod_text_actif_color",label="Modalités actives",choices={x : x for x in [i for i in mcolors.CSS4_COLORS if i != input.mod_text_sup_color()]},selected="black")
+                    excluded = input.mod_text_sup_color()
+                    ui.update_select(id="mod_text_actif_color",label="Modalités actives",choices=[c for c in CSS4_NAMES if c != excluded],selected="black")
                 
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="mod_text_sup_color",label="Modalités supplémentaires",choices={x : x for x in [i for i in mcolors.CSS4_COLORS if i != input.mod_text_actif_color()]},selected="blue")
+                    excluded = input.mod_text_actif_color()
+                    ui.update_select(id="mod_text_sup_color",label="Modalités supplémentaires",choices=[c for c in CSS4_NAMES if c != excluded],selected="blue")
             
             #------------------------------------------------------------------------------------------
             if hasattr(model,"quali_sup_"):
                 @render.ui
                 def var_text_quali_sup():
-                    return ui.TagList(ui.input_select(id="var_text_sup_color",label="Variables qualitatives supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="blue",multiple=False,width="100%"))
+                    return ui.TagList(ui.input_select(id="var_text_sup_color",label="Variables qualitatives supplémentaires",choices=CSS4_DICT,selected="blue",multiple=False,width="100%"))
             
             if hasattr(model,"quanti_sup_"):
                 @render.ui
                 def var_text_quanti_sup():
-                    return ui.TagList(ui.input_select(id="var_text_quanti_sup_color",label="Variables quantitatives supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="red",multiple=False,width="100%"))
+                    return ui.TagList(ui.input_select(id="var_text_quanti_sup_color",label="Variables quantitatives supplémentaires",choices=CSS4_DICT,selected="red",multiple=False,width="100%"))
             
             #-------------------------------------------------------------------------------------------------------
             # Disable colors
             if hasattr(model,"quali_sup_") and hasattr(model,"quanti_sup_"):
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="var_text_actif_color",label="Variables actives",choices={x : x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.var_text_sup_color(),input.var_text_quanti_sup_color()]]},selected="black")
+                    excluded = frozenset((input.var_text_sup_color(),input.var_text_quanti_sup_color()))
+                    ui.update_select(id="var_text_actif_color",label="Variables actives",choices=[c for c in CSS4_NAMES if c not in excluded],selected="black")
             
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="var_text_sup_color",label="Variables qualitatives supplémentaires",choices={x : x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.var_text_actif_color(),input.var_text_quanti_sup_color()]]},selected="blue")
+                    excluded = frozenset((input.var_text_actif_color(),input.var_text_quanti_sup_color()))
+                    ui.update_select(id="var_text_sup_color",label="Variables qualitatives supplémentaires",choices=[c for c in CSS4_NAMES if c not in excluded],selected="blue")
 
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="var_text_quanti_sup_color",label="Variables quantitatives supplementaires",choices={x : x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.var_text_actif_color(),input.var_text_sup_color()]]},selected="red")
+                    excluded = frozenset((input.var_text_actif_color(),input.var_text_sup_color()))
+                    ui.update_select(id="var_text_quanti_sup_color",label="Variables quantitatives supplementaires",choices=[c for c in CSS4_NAMES if c not in excluded],selected="red")
             elif hasattr(model,"quali_sup_"):
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="var_text_actif_color",label="Variables actives",choices={x : x for x in [i for i in mcolors.CSS4_COLORS if i != input.var_text_sup_color()]},selected="black")
+                    excluded = input.var_text_sup_color()
+                    ui.update_select(id="var_text_actif_color",label="Variables actives",choices=[c for c in CSS4_NAMES if c != excluded],selected="black")
             
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="var_text_sup_color",label="Variables qualitatives supplémentaires",choices={x : x for x in [i for i in mcolors.CSS4_COLORS if i != input.var_text_actif_color()]},selected="blue")
+                    excluded = input.var_text_actif_color()
+                    ui.update_select(id="var_text_sup_color",label="Variables qualitatives supplémentaires",choices=[c for c in CSS4_NAMES if c != excluded],selected="blue")
             elif hasattr(model,"quanti_sup_"):
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="var_text_actif_color",label="Variables actives",choices={x : x for x in [i for i in mcolors.CSS4_COLORS if i != input.var_text_quanti_sup_color()]},selected="black")
+                    excluded = input.var_text_quanti_sup_color()
+                    ui.update_select(id="var_text_actif_color",label="Variables actives",choices=[c for c in CSS4_NAMES if c != excluded],selected="black")
                 
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="var_text_quanti_sup_color",label="Variables quantitatives supplementaires",choices={x : x for x in [i for i in mcolors.CSS4_COLORS if i != input.var_text_actif_color()]},selected="red")
+                    excluded = input.var_text_actif_color()
+                    ui.update_select(id="var_text_quanti_sup_color",label="Variables quantitatives supplementaires",choices=[c for c in CSS4_NAMES if c != excluded],selected="red")
 
             #-----------------------------------------------------------------------------------------
             ## Individuals MCA
@@ -450,7 +460,7 @@ class MCAshiny(Base):
                                        lim_cos2 = input.ind_lim_cos2(),
                                        title = input.ind_title(),
                                        repel = input.ind_plot_repel())
-                return fig+pn.theme_gray()
+                return fig+PLOT_THEME
 
             # Individuals - MCA
             @render.plot(alt="Individuals - MCA")
@@ -511,7 +521,7 @@ class MCAshiny(Base):
                                        lim_contrib = input.mod_lim_contrib(),
                                        lim_cos2 = input.mod_lim_cos2(), 
                                        repel = input.mod_plot_repel())
-                return fig+pn.theme_gray()
+                return fig+PLOT_THEME
 
             # Variables categories - MCA
             @render.plot(alt="Variables categories - MCA")
@@ -547,7 +557,7 @@ class MCAshiny(Base):
                                    color_quanti_sup = color_quanti_sup,
                                    text_size = input.var_text_size(),
                                    repel = input.var_plot_repel())
-                return fig + pn.theme_gray()
+                return fig + PLOT_THEME
 
             @render.plot(alt="Variables - MCA")
             def fviz_var_plot():
@@ -562,7 +572,7 @@ class MCAshiny(Base):
                     return ui.panel_conditional("input.fviz_choice === 'fviz_quanti_sup'",
                             title_input(id="quanti_sup_title",value="Correlation circle - MCA"),
                             text_size_input(which="quanti_sup"),
-                            ui.input_select(id="quanti_sup_color",label="Variables quantitatives supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="red",multiple=False,width="100%")
+                            ui.input_select(id="quanti_sup_color",label="Variables quantitatives supplémentaires",choices=CSS4_DICT,selected="red",multiple=False,width="100%")
                         )
             
                 @render.ui
@@ -581,7 +591,7 @@ class MCAshiny(Base):
 
                 @reactive.Calc
                 def plot_quanti_sup():
-                    fig =  fviz_corrcircle(self=model,axis=[int(input.axis1()),int(input.axis2())],color=input.quanti_sup_color(),title=input.quanti_sup_title(),text_size=input.quanti_sup_text_size(),ggtheme=pn.theme_gray())
+                    fig =  fviz_corrcircle(self=model,axis=[int(input.axis1()),int(input.axis2())],color=input.quanti_sup_color(),title=input.quanti_sup_title(),text_size=input.quanti_sup_text_size(),ggtheme=PLOT_THEME)
                     return fig 
                 
                 @render.plot(alt="Correlation circle - MCA")
@@ -594,7 +604,7 @@ class MCAshiny(Base):
             # Reactive
             @reactive.Calc
             def plot_eigen():
-                return fviz_eig(self=model,choice=input.fviz_eigen_choice(),add_labels=input.fviz_eigen_label(),ggtheme=pn.theme_gray())
+                return fviz_eig(self=model,choice=input.fviz_eigen_choice(),add_labels=input.fviz_eigen_label(),ggtheme=PLOT_THEME)
 
             @render.plot(alt="Scree Plot - MCA")
             def fviz_eigen(): 
@@ -632,7 +642,7 @@ class MCAshiny(Base):
             
             @reactive.Calc
             def mod_contrib_plot():
-                fig = fviz_contrib(self=model,choice="var",axis=input.mod_contrib_axis(),top_contrib=int(input.mod_contrib_top()),color=input.mod_contrib_color(),bar_width=input.mod_contrib_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_contrib(self=model,choice="var",axis=input.mod_contrib_axis(),top_contrib=int(input.mod_contrib_top()),color=input.mod_contrib_color(),bar_width=input.mod_contrib_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot variables Contributions
@@ -655,7 +665,7 @@ class MCAshiny(Base):
             
             @reactive.Calc
             def mod_cos2_plot():
-                fig = fviz_cos2(self=model,choice = "var",axis=input.mod_cos2_axis(),top_cos2=int(input.mod_cos2_top()),color=input.mod_cos2_color(),bar_width=input.mod_cos2_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_cos2(self=model,choice = "var",axis=input.mod_cos2_axis(),top_cos2=int(input.mod_cos2_top()),color=input.mod_cos2_color(),bar_width=input.mod_cos2_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot variables categories Cos2
@@ -764,7 +774,7 @@ class MCAshiny(Base):
             # Plot Individuals Contributions
             @reactive.Calc
             def ind_contrib_plot():
-                fig = fviz_contrib(self=model,choice="ind",axis=input.ind_contrib_axis(),top_contrib=int(input.ind_contrib_top()),color = input.ind_contrib_color(),bar_width= input.ind_contrib_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_contrib(self=model,choice="ind",axis=input.ind_contrib_axis(),top_contrib=int(input.ind_contrib_top()),color = input.ind_contrib_color(),bar_width= input.ind_contrib_bar_width(),ggtheme=PLOT_THEME)
                 return fig
             
             @render.plot(alt="Individuals Contributions Map - MCA")
@@ -787,7 +797,7 @@ class MCAshiny(Base):
             # Plot variables Cos2
             @reactive.Calc
             def ind_cos2_plot():
-                fig = fviz_cos2(self=model,choice="ind",axis=input.ind_cos2_axis(),top_cos2=int(input.ind_cos2_top()),color=input.ind_cos2_color(),bar_width=input.ind_cos2_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_cos2(self=model,choice="ind",axis=input.ind_cos2_axis(),top_cos2=int(input.ind_cos2_top()),color=input.ind_cos2_color(),bar_width=input.ind_cos2_bar_width(),ggtheme=PLOT_THEME)
                 return fig
             
             @render.plot(alt="Individuals Cosines Map - MCA")
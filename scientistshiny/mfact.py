@@ -2,8 +2,6 @@
 from shiny import Inputs, Outputs, Session, render, ui, reactive
 import shinyswatch
 import numpy as np
-import plotnine as pn
-import matplotlib.colors as mcolors
 from pathlib import Path
 from sklearn.cluster import KMeans
 from scientisttools import fviz_mfa_ind,fviz_mfa_freq,fviz_mfa_group,fviz_mfa_axes,fviz_eig,fviz_contrib,fviz_cos2,dimdesc
@@ -108,7 +106,7 @@ class MFACTshiny(Base):
                             ui.panel_conditional("input.ind_point_select === 'contrib'",ui.div(lim_contrib(id="ind_lim_contrib"),align="center")              ),
                             text_color_input(id="ind_text_color",choices={"actif/sup":"actifs/supplémentaires","cos2":"Cosinus","contrib":"Contribution","kmeans":"KMeans"}),
                             ui.panel_conditional("input.ind_text_color === 'actif/sup'",
-                                ui.input_select(id="ind_text_actif_color",label="Individus actifs",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"),
+                                ui.input_select(id="ind_text_actif_color",label="Individus actifs",choices=CSS4_DICT,selected="black",multiple=False,width="100%"),
                                 ui.output_ui("ind_text_sup")
                             ),
                             ui.panel_conditional("input.ind_text_color === 'kmeans'",ui.input_numeric(id="ind_text_kmeans_nb_clusters",label="Choix du nombre de clusters",value=2,min=1,max=model.ind_["coord"].shape[0],step=1,width="100%")),
@@ -122,7 +120,7 @@ class MFACTshiny(Base):
                             ui.panel_conditional("input.freq_point_select === 'contrib'",ui.div(lim_contrib(id="freq_lim_contrib"),align="center")              ),
                             ui.input_select(id="freq_text_color",label="Colorier les flèches par :",choices={"actif/sup":"actives/supplémentaires","cos2":"Cosinus","contrib":"Contribution","group":"Groupes","kmeans":"KMeans"},selected="group",multiple=False,width="100%"),
                             ui.panel_conditional("input.freq_text_color === 'actif/sup'",
-                                ui.input_select(id="freq_text_actif_color",label="Fréquences actives",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"),
+                                ui.input_select(id="freq_text_actif_color",label="Fréquences actives",choices=CSS4_DICT,selected="black",multiple=False,width="100%"),
                                 ui.output_ui("freq_text_sup")
                             ),
                             ui.panel_conditional("input.freq_text_color === 'kmeans'",ui.input_numeric(id="freq_text_kmeans_nb_clusters",label="Choix du nombre de clusters",value=2,min=1,max=model.freq_["coord"].shape[0],step=1,width="100%")),
@@ -132,7 +130,7 @@ class MFACTshiny(Base):
                             text_size_input(which="group"),
                             ui.input_select(id="group_text_color",label="Colorier les points par :",choices={"actif/sup":"actifs/supplémentaires","cos2":"Cosinus","contrib":"Contribution","kmeans":"KMeans"},selected="actif/sup",multiple=False,width="100%"),
                             ui.panel_conditional("input.group_text_color ==='actif/sup'",
-                                ui.input_select(id="group_text_actif_color",label="Groupes actifs",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"),
+                                ui.input_select(id="group_text_actif_color",label="Groupes actifs",choices=CSS4_DICT,selected="black",multiple=False,width="100%"),
                                 ui.output_ui("group_text_sup")
                             ),
                             ui.panel_conditional("input.group_text_color === 'kmeans'",ui.input_numeric(id="group_text_kmeans_nb_clusters",label="Choix du nombre de clusters",value=2,min=1,max=model.group_["coord"].shape[0],step=1,width="100%")),
@@ -142,7 +140,7 @@ class MFACTshiny(Base):
                             title_input(id="axes_title",value="Graphe des axes partiels - MFACT"),
                             text_size_input(which="axes"),
                             ui.input_select(id="axes_text_color",label="Colorier les points par :",choices={"actif/sup":"actifs/supplémentaires","group":"Groupes"},selected="group",multiple=False,width="100%"),
-                            ui.panel_conditional("input.axes_text_color ==='actif/sup'",ui.input_select(id="axes_text_actif_color",label="Axes actifs/supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"))
+                            ui.panel_conditional("input.axes_text_color ==='actif/sup'",ui.input_select(id="axes_text_actif_color",label="Axes actifs/supplémentaires",choices=CSS4_DICT,selected="black",multiple=False,width="100%"))
                         )
                     ),
                     ui.div(ui.input_action_button(id="exit",label="Quitter l'application",style='padding:5px; background-color: #2e4053;text-align:center;white-space: normal;'),align="center"),
@@ -259,47 +257,53 @@ class MFACTshiny(Base):
             if hasattr(model,"ind_sup_"):
                 @render.ui
                 def ind_text_sup():
-                    return ui.TagList(ui.input_select(id="ind_text_sup_color",label="Individus supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="blue",multiple=False,width="100%"))
+                    return ui.TagList(ui.input_select(id="ind_text_sup_color",label="Individus supplémentaires",choices=CSS4_DICT,selected="blue",multiple=False,width="100%"))
 
             #--------------------------------------------------------------------------------------------------------------
             if hasattr(model,"ind_sup_"):
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.ind_text_sup_color()]},selected="black")
+                    excluded = input.ind_text_sup_color()
+                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices=[c for c in CSS4_NAMES if c != excluded],selected="black")
                 
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="ind_text_sup_color",label="Individus supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.ind_text_actif_color()]},selected="blue")
+                    excluded = input.ind_text_actif_color()
+                    ui.update_select(id="ind_text_sup_color",label="Individus supplémentaires",choices=[c for c in CSS4_NAMES if c != excluded],selected="blue")
             
             #-----------------------------------------------------------------------------------------------
             if hasattr(model,"freq_sup_"):
                 @render.ui
                 def freq_text_sup():
-                        return ui.TagList(ui.input_select(id="freq_text_sup_color",label="Fréquences supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="red",multiple=False,width="100%"))
+                        return ui.TagList(ui.input_select(id="freq_text_sup_color",label="Fréquences supplémentaires",choices=CSS4_DICT,selected="red",multiple=False,width="100%"))
             
                 # Disable colors
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="freq_text_actif_color",label="Fréquences actives",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.freq_text_sup_color()]},selected="black")
+                    excluded = input.freq_text_sup_color()
+                    ui.update_select(id="freq_text_actif_color",label="Fréquences actives",choices=[c for c in CSS4_NAMES if c != excluded],selected="black")
                 
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="freq_text_sup_color",label="Fréquences supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.freq_text_actif_color()]},selected="blue")
+                    excluded = input.freq_text_actif_color()
+                    ui.update_select(id="freq_text_sup_color",label="Fréquences supplémentaires",choices=[c for c in CSS4_NAMES if c != excluded],selected="blue")
 
             #-----------------------------------------------------------------------------------------------
             if model.num_group_sup is not None:
                 @render.ui
                 def group_text_sup():
-                    return ui.TagList(ui.input_select(id="group_text_sup_color",label="Groupes supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="blue",multiple=False,width="100%"))
+                    return ui.TagList(ui.input_select(id="group_text_sup_color",label="Groupes supplémentaires",choices=CSS4_DICT,selected="blue",multiple=False,width="100%"))
                
                 # Disable groups colors
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="group_text_actif_color",label="Groupes actifs",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.group_text_sup_color()]},selected="black")
+                    excluded = input.group_text_sup_color()
+                    ui.update_select(id="group_text_actif_color",label="Groupes actifs",choices=[c for c in CSS4_NAMES if c != excluded],selected="black")
                 
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="group_text_sup_color",label="Groupes supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.group_text_actif_color()]},selected="blue")
+                    excluded = input.group_text_actif_color()
+                    ui.update_select(id="group_text_sup_color",label="Groupes supplémentaires",choices=[c for c in CSS4_NAMES if c != excluded],selected="blue")
 
             #--------------------------------------------------------------------------------
             ## Individuals - MFA
@@ -353,7 +357,7 @@ class MFACTshiny(Base):
                                        lim_cos2 = input.ind_lim_cos2(),
                                        title = input.ind_title(),
                                        repel=input.ind_plot_repel())
-                return fig+pn.theme_gray()
+                return fig+PLOT_THEME
 
             @render.plot(alt="Individuals - MFACT")
             def fviz_ind_plot():
@@ -409,7 +413,7 @@ class MFACTshiny(Base):
                                        text_size=input.freq_text_size(),
                                        lim_contrib = input.freq_lim_contrib(),
                                        lim_cos2 = input.freq_lim_cos2())
-                return fig+pn.theme_gray()
+                return fig+PLOT_THEME
 
             @render.plot(alt="Contingency tables - MFACT")
             def fviz_freq_plot():
@@ -456,7 +460,7 @@ class MFACTshiny(Base):
                                          group_sup=group_sup,
                                          text_size=input.group_text_size(),
                                          repel=input.group_plot_repel())
-                return fig+pn.theme_gray()
+                return fig+PLOT_THEME
             
             @render.plot(alt="Groups Factor Map - MFACT")
             def fviz_group_plot():
@@ -479,7 +483,7 @@ class MFACTshiny(Base):
                                         color=input.axes_text_color(),
                                         title=input.axes_title(),
                                         text_size=input.axes_text_size())
-                return fig+pn.theme_gray()
+                return fig+PLOT_THEME
             
             @render.plot(alt="Axes partiels Factor Map - MFACT")
             def fviz_axes_plot():
@@ -491,7 +495,7 @@ class MFACTshiny(Base):
             # Eigenvalue - Scree plot
             @render.plot(alt="Scree Plot - MFA")
             def fviz_eigen():
-                return fviz_eig(self=model,choice=input.fviz_eigen_choice(),add_labels=input.fviz_eigen_label(),ggtheme=pn.theme_gray()).draw()
+                return fviz_eig(self=model,choice=input.fviz_eigen_choice(),add_labels=input.fviz_eigen_label(),ggtheme=PLOT_THEME).draw()
             
             # Eigen value - DataFrame
             @render.data_frame
@@ -529,7 +533,7 @@ class MFACTshiny(Base):
             
             @reactive.Calc
             def freq_contrib_plot():
-                fig = fviz_contrib(self=model,choice="freq",axis=input.freq_contrib_axis(),top_contrib=int(input.freq_contrib_top()),color=input.freq_contrib_color(),bar_width=input.freq_contrib_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_contrib(self=model,choice="freq",axis=input.freq_contrib_axis(),top_contrib=int(input.freq_contrib_top()),color=input.freq_contrib_color(),bar_width=input.freq_contrib_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot variables Contributions
@@ -552,7 +556,7 @@ class MFACTshiny(Base):
             
             @reactive.Calc
             def freq_cos2_plot():
-                fig = fviz_cos2(self=model,choice="freq",axis=input.freq_cos2_axis(),top_cos2=int(input.freq_cos2_top()),color=input.freq_cos2_color(),bar_width=input.freq_cos2_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_cos2(self=model,choice="freq",axis=input.freq_cos2_axis(),top_cos2=int(input.freq_cos2_top()),color=input.freq_cos2_color(),bar_width=input.freq_cos2_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot variables Cos2
@@ -611,7 +615,7 @@ class MFACTshiny(Base):
             
             @reactive.Calc
             def ind_contrib_plot():
-                fig = fviz_contrib(self=model,choice="ind",axis=input.ind_contrib_axis(),top_contrib=int(input.ind_contrib_top()),color = input.ind_contrib_color(),bar_width= input.ind_contrib_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_contrib(self=model,choice="ind",axis=input.ind_contrib_axis(),top_contrib=int(input.ind_contrib_top()),color = input.ind_contrib_color(),bar_width= input.ind_contrib_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot Individuals Contributions
@@ -634,7 +638,7 @@ class MFACTshiny(Base):
             
             @reactive.Calc
             def ind_cos2_plot():
-                fig = fviz_cos2(self=model,choice="ind",axis=input.ind_cos2_axis(),top_cos2=int(input.ind_cos2_top()),color=input.ind_cos2_color(),bar_width=input.ind_cos2_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_cos2(self=model,choice="ind",axis=input.ind_cos2_axis(),top_cos2=int(input.ind_cos2_top()),color=input.ind_cos2_color(),bar_width=input.ind_cos2_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot variables Cos2
@@ -737,7 +741,7 @@ class MFACTshiny(Base):
             
             @reactive.Calc
             def group_contrib_plot():
-                fig = fviz_contrib(self=model,choice="group",axis=input.group_contrib_axis(),top_contrib=int(input.group_contrib_top()),color = input.group_contrib_color(),bar_width= input.group_contrib_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_contrib(self=model,choice="group",axis=input.group_contrib_axis(),top_contrib=int(input.group_contrib_top()),color = input.group_contrib_color(),bar_width= input.group_contrib_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot Individuals Contributions
@@ -760,7 +764,7 @@ class MFACTshiny(Base):
             
             @reactive.Calc
             def group_cos2_plot():
-                fig = fviz_cos2(self=model,choice="group",axis=input.group_cos2_axis(),top_cos2=int(input.group_cos2_top()),color=input.group_cos2_color(),bar_width=input.group_cos2_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_cos2(self=model,choice="group",axis=input.group_cos2_axis(),top_cos2=int(input.group_cos2_top()),color=input.group_cos2_color(),bar_width=input.group_cos2_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot Group cos2
@@ -834,7 +838,7 @@ class MFACTshiny(Base):
             
             @reactive.Calc
             def axes_contrib_plot():
-                fig = fviz_contrib(self=model,choice="partial_axes",axis=input.axes_contrib_axis(),top_contrib=int(input.axes_contrib_top()),color = input.axes_contrib_color(),bar_width= input.axes_contrib_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_contrib(self=model,choice="partial_axes",axis=input.axes_contrib_axis(),top_contrib=int(input.axes_contrib_top()),color = input.axes_contrib_color(),bar_width= input.axes_contrib_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot Individuals Contributions
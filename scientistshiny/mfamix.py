@@ -5,7 +5,6 @@ import numpy as np
 import pandas as pd
 import scipy as sp
 import plotnine as pn
-import matplotlib.colors as mcolors
 from sklearn.cluster import KMeans
 from scientisttools import fviz_mfa_ind,fviz_mfa_var,fviz_mfa_mod,fviz_mfa_group,fviz_mfa_axes,fviz_eig,fviz_contrib,fviz_cos2,dimdesc
 from scientistshiny.base import Base
@@ -118,7 +117,7 @@ class MFAMIXshiny(Base):
                             ui.panel_conditional("input.ind_point_select === 'contrib'",ui.div(lim_contrib(id="ind_lim_contrib"),align="center")              ),
                             text_color_input(id="ind_text_color",choices=ind_text_color_choices),
                             ui.panel_conditional("input.ind_text_color === 'actif/sup'",
-                                ui.input_select(id="ind_text_actif_color",label="Individus actifs",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"),
+                                ui.input_select(id="ind_text_actif_color",label="Individus actifs",choices=CSS4_DICT,selected="black",multiple=False,width="100%"),
                                 ui.output_ui("ind_text_sup")
                             ),
                             ui.panel_conditional("input.ind_text_color === 'kmeans'",ui.input_numeric(id="ind_text_kmeans_nb_clusters",label="Choix du nombre de clusters",value=2,min=1,max=model.ind_["coord"].shape[0],step=1,width="100%")),
@@ -134,7 +133,7 @@ class MFAMIXshiny(Base):
                             ui.panel_conditional("input.quanti_var_point === 'contrib'",ui.div(lim_contrib(id="quanti_var_lim_contrib"),align="center")),
                             ui.input_select(id="quanti_var_text_color",label="Colorier les flèches par :",choices={"actif/sup":"actives/supplémentaires","cos2":"Cosinus","contrib":"Contribution","group":"Groupes","kmeans":"KMeans"},selected="group",multiple=False,width="100%"),
                             ui.panel_conditional("input.quanti_var_text_color ==='actif/sup'",
-                                ui.input_select(id="quanti_var_text_actif_color",label="Variables quantitatives actives",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"),
+                                ui.input_select(id="quanti_var_text_actif_color",label="Variables quantitatives actives",choices=CSS4_DICT,selected="black",multiple=False,width="100%"),
                                 ui.output_ui("quanti_var_text_sup")
                             ),
                             ui.panel_conditional("input.quanti_var_text_color === 'kmeans'",ui.input_numeric(id="quanti_var_text_kmeans_nb_clusters",label="Choix du nombre de clusters",value=2,min=1,max=model.quanti_var_["coord"].shape[0],step=1,width="100%")),
@@ -147,7 +146,7 @@ class MFAMIXshiny(Base):
                             ui.panel_conditional("input.quali_var_point === 'contrib'",ui.div(lim_contrib(id="quali_var_lim_contrib"),align="center")              ),
                             ui.input_select(id="quali_var_text_color",label="Colorier les points par :",choices={"actif/sup":"actives/supplémentaires","cos2":"Cosinus","contrib":"Contribution","group":"Groupes","kmeans":"KMeans"},selected="group",multiple=False,width="100%"),
                             ui.panel_conditional("input.quali_var_text_color ==='actif/sup'",
-                                ui.input_select(id="quali_var_text_actif_color",label="Modalités actives",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"),
+                                ui.input_select(id="quali_var_text_actif_color",label="Modalités actives",choices=CSS4_DICT,selected="black",multiple=False,width="100%"),
                                 ui.output_ui("quali_var_text_sup")
                             ),
                             ui.panel_conditional("input.quali_var_text_color === 'kmeans'",ui.input_numeric(id="quali_var_text_kmeans_nb_clusters",label="Choix du nombre de clusters",value=2,min=1,max=model.quali_var_["coord"].shape[0],step=1,width="100%")),
@@ -158,7 +157,7 @@ class MFAMIXshiny(Base):
                             text_size_input(which="group"),
                             ui.input_select(id="group_text_color",label="Colorier les points par :",choices={"actif/sup":"actifs/supplémentaires","cos2":"Cosinus","contrib":"Contribution","kmeans":"KMeans"},selected="actif/sup",multiple=False,width="100%"),
                             ui.panel_conditional("input.group_text_color ==='actif/sup'",
-                                ui.input_select(id="group_text_actif_color",label="Groupes actifs",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"),
+                                ui.input_select(id="group_text_actif_color",label="Groupes actifs",choices=CSS4_DICT,selected="black",multiple=False,width="100%"),
                                 ui.output_ui("group_text_sup")
                             ),
                             ui.panel_conditional("input.group_text_color === 'kmeans'",ui.input_numeric(id="group_text_kmeans_nb_clusters",label="Choix du nombre de clusters",value=2,min=1,max=model.group_["coord"].shape[0],step=1,width="100%")),
@@ -168,7 +167,7 @@ class MFAMIXshiny(Base):
                             title_input(id="axes_title",value="Graphe des axes partiels - MFAMIX"),
                             text_size_input(which="axes"),
                             ui.input_select(id="axes_text_color",label="Colorier les points par :",choices={"actif/sup":"actifs/supplémentaires","group":"Groupes"},selected="group",multiple=False,width="100%"),
-                            ui.panel_conditional("input.axes_text_color ==='actif/sup'",ui.input_select(id="axes_text_actif_color",label="Axes actifs/supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"))
+                            ui.panel_conditional("input.axes_text_color ==='actif/sup'",ui.input_select(id="axes_text_actif_color",label="Axes actifs/supplémentaires",choices=CSS4_DICT,selected="black",multiple=False,width="100%"))
                         )
                     ),
                     ui.div(ui.input_action_button(id="exit",label="Quitter l'application",style='padding:5px; background-color: #fcac44;text-align:center;white-space: normal;'),align="center"),
@@ -340,44 +339,51 @@ class MFAMIXshiny(Base):
             if hasattr(model,"ind_sup_"):
                 @render.ui
                 def ind_text_sup():
-                    return ui.TagList(ui.input_select(id="ind_text_sup_color",label="Individus supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="blue",multiple=False,width="100%"))
+                    return ui.TagList(ui.input_select(id="ind_text_sup_color",label="Individus supplémentaires",choices=CSS4_DICT,selected="blue",multiple=False,width="100%"))
             
 
             if hasattr(model,"quali_var_sup_"):
                 @render.ui
                 def ind_text_quali_var_sup():
-                    return ui.TagList(ui.input_select(id="ind_text_quali_var_sup_color",label="Modalités supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="red",multiple=False,width="100%"))
+                    return ui.TagList(ui.input_select(id="ind_text_quali_var_sup_color",label="Modalités supplémentaires",choices=CSS4_DICT,selected="red",multiple=False,width="100%"))
             
             #------------------------------------------------------------------------------------------------------------------
             # Disable individuals colors
             if hasattr(model,"ind_sup_") and hasattr(model,"quali_var_sup_"):
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.ind_text_sup_color(),input.ind_text_quali_var_sup_color()]]},selected="black")
+                    excluded = frozenset((input.ind_text_sup_color(),input.ind_text_quali_var_sup_color()))
+                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices=[c for c in CSS4_NAMES if c not in excluded],selected="black")
                 
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="ind_text_sup_color",label="Individus supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.ind_text_actif_color(),input.ind_text_quali_var_sup_color()]]},selected="blue")
+                    excluded = frozenset((input.ind_text_actif_color(),input.ind_text_quali_var_sup_color()))
+                    ui.update_select(id="ind_text_sup_color",label="Individus supplémentaires",choices=[c for c in CSS4_NAMES if c not in excluded],selected="blue")
                 
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="ind_text_quali_var_sup_color",label="Modalités supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.ind_text_actif_color(),input.ind_text_sup_color()]]},selected="red")
+                    excluded = frozenset((input.ind_text_actif_color(),input.ind_text_sup_color()))
+                    ui.update_select(id="ind_text_quali_var_sup_color",label="Modalités supplémentaires",choices=[c for c in CSS4_NAMES if c not in excluded],selected="red")
             elif hasattr(model,"ind_sup_"):
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.ind_text_sup_color()]},selected="black")
+                    excluded = input.ind_text_sup_color()
+                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices=[c for c in CSS4_NAMES if c != excluded],selected="black")
                 
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="ind_text_sup_color",label="Individus supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.ind_text_actif_color()]},selected="blue")
+                    excluded = input.ind_text_actif_color()
+                    ui.update_select(id="ind_text_sup_color",label="Individus supplémentaires",choices=[c for c in CSS4_NAMES if c != excluded],selected="blue")
             elif hasattr(model,"quali_var_sup_"):
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.ind_text_quali_var_sup_color()]},selected="black")
+                    excluded = input.ind_text_quali_var_sup_color()
+                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices=[c for c in CSS4_NAMES if c != excluded],selected="black")
                 
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="ind_text_quali_var_sup_color",label="Modalités supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.ind_text_actif_color()]},selected="red")
+                    excluded = input.ind_text_actif_color()
+                    ui.update_select(id="ind_text_quali_var_sup_color",label="Modalités supplémentaires",choices=[c for c in CSS4_NAMES if c != excluded],selected="red")
 
             #-------------------------------------------------------------------------------------------------
             if hasattr(model,"quali_var_sup_"):
@@ -393,46 +399,52 @@ class MFAMIXshiny(Base):
             if hasattr(model,"quanti_var_sup_"):
                 @render.ui
                 def quanti_var_text_sup():
-                    return ui.TagList(ui.input_select(id="quanti_var_text_sup_color",label="Variables quantitatives supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="blue",multiple=False,width="100%"))
+                    return ui.TagList(ui.input_select(id="quanti_var_text_sup_color",label="Variables quantitatives supplémentaires",choices=CSS4_DICT,selected="blue",multiple=False,width="100%"))
                 
                 # Disable quantitative variable colors
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="quanti_var_text_actif_color",label="Variables quantitatives actives",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.quanti_var_text_sup_color()]},selected="black")
+                    excluded = input.quanti_var_text_sup_color()
+                    ui.update_select(id="quanti_var_text_actif_color",label="Variables quantitatives actives",choices=[c for c in CSS4_NAMES if c != excluded],selected="black")
                 
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="quanti_var_text_sup_color",label="Variables quantitatives supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.quanti_var_text_actif_color()]},selected="blue")
+                    excluded = input.quanti_var_text_actif_color()
+                    ui.update_select(id="quanti_var_text_sup_color",label="Variables quantitatives supplémentaires",choices=[c for c in CSS4_NAMES if c != excluded],selected="blue")
             
             #-----------------------------------------------------------------------------------------------
             if hasattr(model,"quali_var_sup_"):
                 @render.ui
                 def quali_var_text_sup():
-                    return ui.TagList(ui.input_select(id="quali_var_text_sup_color",label="Modalités supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="blue",multiple=False,width="100%"))
+                    return ui.TagList(ui.input_select(id="quali_var_text_sup_color",label="Modalités supplémentaires",choices=CSS4_DICT,selected="blue",multiple=False,width="100%"))
                    
                 # Disable qualitative variable colors
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="quali_var_text_actif_color",label="Modalités actives",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.quali_var_text_sup_color()]},selected="black")
+                    excluded = input.quali_var_text_sup_color()
+                    ui.update_select(id="quali_var_text_actif_color",label="Modalités actives",choices=[c for c in CSS4_NAMES if c != excluded],selected="black")
                 
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="quali_var_text_sup_color",label="Modalités supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.quali_var_text_actif_color()]},selected="blue")
+                    excluded = input.quali_var_text_actif_color()
+                    ui.update_select(id="quali_var_text_sup_color",label="Modalités supplémentaires",choices=[c for c in CSS4_NAMES if c != excluded],selected="blue")
 
             #-----------------------------------------------------------------------------------------------
             if model.num_group_sup is not None:
                 @render.ui
                 def group_text_sup():
-                        return ui.TagList(ui.input_select(id="group_text_sup_color",label="Groupes supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="blue",multiple=False,width="100%"))
+                        return ui.TagList(ui.input_select(id="group_text_sup_color",label="Groupes supplémentaires",choices=CSS4_DICT,selected="blue",multiple=False,width="100%"))
 
                 # Disable groups colors            
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="group_text_actif_color",label="Groupes actifs",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.group_text_sup_color()]},selected="black")
+                    excluded = input.group_text_sup_color()
+                    ui.update_select(id="group_text_actif_color",label="Groupes actifs",choices=[c for c in CSS4_NAMES if c != excluded],selected="black")
                 
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="group_text_sup_color",label="Groupes supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.group_text_actif_color()]},selected="blue")
+                    excluded = input.group_text_actif_color()
+                    ui.update_select(id="group_text_sup_color",label="Groupes supplémentaires",choices=[c for c in CSS4_NAMES if c != excluded],selected="blue")
 
             #-------------------------------------------------------------------------------------------------------------
             ## Individuals - MFAMIX
@@ -522,7 +534,7 @@ class MFAMIXshiny(Base):
                                        habillage= input.ind_text_var_qual_color(),
                                        add_ellipse=input.ind_text_add_ellipse(),
                                        repel=input.ind_plot_repel())
-                return fig+pn.theme_gray()
+                return fig+PLOT_THEME
 
             # Individual Factor Map - MFA
             @render.plot(alt="Individuals - MFAMIX")
@@ -579,7 +591,7 @@ class MFAMIXshiny(Base):
                                        text_size=input.quanti_var_text_size(),
                                        lim_contrib = input.quanti_var_lim_contrib(),
                                        lim_cos2 = input.quanti_var_lim_cos2())
-                return fig+pn.theme_gray()
+                return fig+PLOT_THEME
 
             # Correlation circle - MFAMIX
             @render.plot(alt="Correlation circle - MFAMIX")
@@ -633,7 +645,7 @@ class MFAMIXshiny(Base):
                                        lim_contrib = input.quali_var_lim_contrib(),
                                        lim_cos2 = input.quali_var_lim_cos2(),
                                        repel=input.quali_var_plot_repel())
-                return fig+pn.theme_gray()
+                return fig+PLOT_THEME
 
             @render.plot(alt="Variables categories - MFAMIX")
             def fviz_quali_var_plot():
@@ -679,7 +691,7 @@ class MFAMIXshiny(Base):
                                          text_size=input.group_text_size(),
                                          repel=input.group_plot_repel()
                         )
-                return fig+pn.theme_gray()
+                return fig+PLOT_THEME
             
             @render.plot(alt="Groups Factor Map - MFAMIX")
             def fviz_group_plot():
@@ -701,7 +713,7 @@ class MFAMIXshiny(Base):
                                         color=input.axes_text_color(),
                                         title=input.axes_title(),
                                         text_size=input.axes_text_size())
-                return fig+pn.theme_gray()
+                return fig+PLOT_THEME
             
             @render.plot(alt="Axes partiels Factor Map - MFAMIX")
             def fviz_axes_plot():
@@ -713,7 +725,7 @@ class MFAMIXshiny(Base):
             # Eigenvalue - Scree plot
             @render.plot(alt="Scree Plot - MFAMIX")
             def fviz_eigen():
-                return fviz_eig(self=model,choice=input.fviz_eigen_choice(),add_labels=input.fviz_eigen_label(),ggtheme=pn.theme_gray()).draw()
+                return fviz_eig(self=model,choice=input.fviz_eigen_choice(),add_labels=input.fviz_eigen_label(),ggtheme=PLOT_THEME).draw()
             
             # Eigen value - DataFrame
             @render.data_frame
@@ -751,7 +763,7 @@ class MFAMIXshiny(Base):
             
             @reactive.Calc
             def quanti_var_contrib_plot():
-                fig = fviz_contrib(self=model,choice="quanti_var",axis=input.quanti_var_contrib_axis(),top_contrib=int(input.quanti_var_contrib_top()),color=input.quanti_var_contrib_color(),bar_width=input.quanti_var_contrib_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_contrib(self=model,choice="quanti_var",axis=input.quanti_var_contrib_axis(),top_contrib=int(input.quanti_var_contrib_top()),color=input.quanti_var_contrib_color(),bar_width=input.quanti_var_contrib_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot Contributions
@@ -774,7 +786,7 @@ class MFAMIXshiny(Base):
             
             @reactive.Calc
             def quanti_var_cos2_plot():
-                fig = fviz_cos2(self=model,choice="quanti_var",axis=input.quanti_var_cos2_axis(),top_cos2=int(input.quanti_var_cos2_top()),color=input.quanti_var_cos2_color(),bar_width=input.quanti_var_cos2_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_cos2(self=model,choice="quanti_var",axis=input.quanti_var_cos2_axis(),top_cos2=int(input.quanti_var_cos2_top()),color=input.quanti_var_cos2_color(),bar_width=input.quanti_var_cos2_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot variables Cos2
@@ -814,7 +826,7 @@ class MFAMIXshiny(Base):
             
             @reactive.Calc
             def quali_var_contrib_plot():
-                fig = fviz_contrib(self=model,choice="quali_var",axis=input.quali_var_contrib_axis(),top_contrib=int(input.quali_var_contrib_top()),color=input.quali_var_contrib_color(),bar_width=input.quali_var_contrib_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_contrib(self=model,choice="quali_var",axis=input.quali_var_contrib_axis(),top_contrib=int(input.quali_var_contrib_top()),color=input.quali_var_contrib_color(),bar_width=input.quali_var_contrib_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot variables Contributions
@@ -837,7 +849,7 @@ class MFAMIXshiny(Base):
             
             @reactive.Calc
             def quali_var_cos2_plot():
-                fig = fviz_cos2(self=model,choice="quali_var",axis=input.quali_var_cos2_axis(),top_cos2=int(input.quali_var_cos2_top()),color=input.quali_var_cos2_color(),bar_width=input.quali_var_cos2_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_cos2(self=model,choice="quali_var",axis=input.quali_var_cos2_axis(),top_cos2=int(input.quali_var_cos2_top()),color=input.quali_var_cos2_color(),bar_width=input.quali_var_cos2_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot variables Cos2
@@ -967,7 +979,7 @@ class MFAMIXshiny(Base):
             
             @reactive.Calc
             def ind_contrib_plot():
-                fig = fviz_contrib(self=model,choice="ind",axis=input.ind_contrib_axis(),top_contrib=int(input.ind_contrib_top()),color = input.ind_contrib_color(),bar_width= input.ind_contrib_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_contrib(self=model,choice="ind",axis=input.ind_contrib_axis(),top_contrib=int(input.ind_contrib_top()),color = input.ind_contrib_color(),bar_width= input.ind_contrib_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot Individuals Contributions
@@ -990,7 +1002,7 @@ class MFAMIXshiny(Base):
             
             @reactive.Calc
             def ind_cos2_plot():
-                fig = fviz_cos2(self=model,choice="ind",axis=input.ind_cos2_axis(),top_cos2=int(input.ind_cos2_top()),color=input.ind_cos2_color(),bar_width=input.ind_cos2_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_cos2(self=model,choice="ind",axis=input.ind_cos2_axis(),top_cos2=int(input.ind_cos2_top()),color=input.ind_cos2_color(),bar_width=input.ind_cos2_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot variables Cos2
@@ -1092,7 +1104,7 @@ class MFAMIXshiny(Base):
             
             @reactive.Calc
             def group_contrib_plot():
-                fig = fviz_contrib(self=model,choice="group",axis=input.group_contrib_axis(),top_contrib=int(input.group_contrib_top()),color = input.group_contrib_color(),bar_width= input.group_contrib_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_contrib(self=model,choice="group",axis=input.group_contrib_axis(),top_contrib=int(input.group_contrib_top()),color = input.group_contrib_color(),bar_width= input.group_contrib_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot Individuals Contributions
@@ -1116,7 +1128,7 @@ class MFAMIXshiny(Base):
             
             @reactive.Calc
             def group_cos2_plot():
-                fig = fviz_cos2(self=model,choice="group",axis=input.group_cos2_axis(),top_cos2=int(input.group_cos2_top()),color=input.group_cos2_color(),bar_width=input.group_cos2_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_cos2(self=model,choice="group",axis=input.group_cos2_axis(),top_cos2=int(input.group_cos2_top()),color=input.group_cos2_color(),bar_width=input.group_cos2_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot Group cos2
@@ -1191,7 +1203,7 @@ class MFAMIXshiny(Base):
             
             @reactive.Calc
             def axes_contrib_plot():
-                fig = fviz_contrib(self=model,choice="partial_axes",axis=input.axes_contrib_axis(),top_contrib=int(input.axes_contrib_top()),color = input.axes_contrib_color(),bar_width= input.axes_contrib_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_contrib(self=model,choice="partial_axes",axis=input.axes_contrib_axis(),top_contrib=int(input.axes_contrib_top()),color = input.axes_contrib_color(),bar_width= input.axes_contrib_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot Individuals Contributions
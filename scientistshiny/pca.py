@@ -4,7 +4,6 @@ import shinyswatch
 import numpy as np
 import pandas as pd
 import plotnine as pn
-import matplotlib.colors as mcolors
 from sklearn.cluster import KMeans
 from scientisttools import PCA,fviz_pca_ind,fviz_pca_var,fviz_eig,fviz_contrib,fviz_cos2,dimdesc
 from scientistshiny.base import Base
@@ -96,7 +95,7 @@ class PCAshiny(Base):
         resume_choices = {"stats_desc":"Statistiques descriptives","hist_plot" : "Histogramme","corr_matrix": "Matrice des corrélations"}
 
         # Quantitatives columns
-        var_labels = model.call_["X"].columns.tolist()
+        var_labels = model.call_["X"].columns
             
         # Initialise value choice
         value_choice = {"eigen_res":"Valeurs propres","var_res":"Résultats des variables","ind_res":"Résultats sur les individus"}
@@ -108,7 +107,7 @@ class PCAshiny(Base):
         # Check if supplementary quantitatives variables
         if hasattr(model, "quanti_sup_"):
             value_choice = {**value_choice, **{"quanti_sup_res" : "Résultats des variables quantitatives supplémentaires"}}
-            var_labels = [*var_labels,*model.quanti_sup_["coord"].index.tolist()]
+            var_labels = var_labels.append(model.quanti_sup_["coord"].index)
         
         # Check if supplementary qualitatives variables
         if hasattr(model, "quali_sup_"):
@@ -137,7 +136,7 @@ class PCAshiny(Base):
                             ui.panel_conditional("input.ind_point_select === 'contrib'",ui.div(lim_contrib(id="ind_lim_contrib"),align="center")              ),
                             text_color_input(id="ind_text_color",choices=ind_text_color_choices),
                             ui.panel_conditional("input.ind_text_color ==='actif/sup'",
-                                ui.input_select(id="ind_text_actif_color",label="Individus actifs",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"),
+                                ui.input_select(id="ind_text_actif_color",label="Individus actifs",choices=CSS4_DICT,selected="black",multiple=False,width="100%"),
                                 ui.output_ui("ind_text_sup"),
                                 ui.output_ui("ind_text_quali_sup")
                             ),
@@ -154,7 +153,7 @@ class PCAshiny(Base):
                             ui.panel_conditional("input.Var_point === 'contrib'",ui.div(lim_contrib(id="var_lim_contrib"),align="center")              ),
                             ui.input_select(id="var_text_color",label="Colorier les flèches par :",choices={"actif/sup":"actives/supplémentaires","cos2":"Cosinus","contrib":"Contribution","kmeans" : "KMeans"},selected="actif/sup",multiple=False,width="100%"),
                             ui.panel_conditional("input.var_text_color === 'actif/sup'",
-                                ui.input_select(id="var_text_actif_color",label="Variables actives",choices={x:x for x in mcolors.CSS4_COLORS},selected="black",multiple=False,width="100%"),
+                                ui.input_select(id="var_text_actif_color",label="Variables actives",choices=CSS4_DICT,selected="black",multiple=False,width="100%"),
                                 ui.output_ui("var_text_sup")
                             ),
                             ui.panel_conditional("input.var_text_color === 'kmeans'",ui.input_numeric(id="var_text_kmeans_nb_clusters",label="Choix du nombre de clusters",value=2,min=1,max=model.var_["coord"].shape[0],step=1,width="100%")),
@@ -260,45 +259,52 @@ class PCAshiny(Base):
             if hasattr(model,"ind_sup_"):
                 @render.ui
                 def ind_text_sup():
-                    return ui.TagList(ui.input_select(id="ind_text_sup_color",label="Individus supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="blue",multiple=False,width="100%"))
+                    return ui.TagList(ui.input_select(id="ind_text_sup_color",label="Individus supplémentaires",choices=CSS4_DICT,selected="blue",multiple=False,width="100%"))
             
             #---------------------------------------------------------------------------------------------------
             # Add supplementary categories colors choice
             if hasattr(model,"quali_sup_"):
                 @render.ui
                 def ind_text_quali_sup():
-                    return ui.TagList(ui.input_select(id="ind_text_quali_sup_color",label="Modalités supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="red",multiple=False,width="100%"))
+                    return ui.TagList(ui.input_select(id="ind_text_quali_sup_color",label="Modalités supplémentaires",choices=CSS4_DICT,selected="red",multiple=False,width="100%"))
 
             #--------------------------------------------------------------------------------------------------------------
             # Disable individuals colors
             if hasattr(model,"ind_sup_") and hasattr(model,"quali_sup_"):
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.ind_text_sup_color(),input.ind_text_quali_sup_color()]]},selected="black")
+                    excluded = frozenset((input.ind_text_sup_color(),input.ind_text_quali_sup_color()))
+                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices=[c for c in CSS4_NAMES if c not in excluded],selected="black")
                 
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="ind_text_sup_color",label="Individus supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.ind_text_actif_color(),input.ind_text_quali_sup_color()]]},selected="blue")
+                    excluded = frozenset((input.ind_text_actif_color(),input.ind_text_quali_sup_color()))
+                    ui.update_select(id="ind_text_sup_color",label="Individus supplémentaires",choices=[c for c in CSS4_NAMES if c not in excluded],selected="blue")
                 
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="ind_text_quali_sup_color",label="Modalités supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i not in [input.ind_text_actif_color(),input.ind_text_sup_color()]]},selected="red")
+                    excluded = frozenset((input.ind_text_actif_color(),input.ind_text_sup_color()))
+                    ui.update_select(id="ind_text_quali_sup_color",label="Modalités supplémentaires",choices=[c for c in CSS4_NAMES if c not in excluded],selected="red")
             elif hasattr(model,"ind_sup_"):
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.ind_text_sup_color()]},selected="black")
+                    excluded = input.ind_text_sup_color()
+                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices=[c for c in CSS4_NAMES if c != excluded],selected="black")
                 
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="ind_text_sup_color",label="Individus supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.ind_text_actif_color()]},selected="blue")
+                    excluded = input.ind_text_actif_color()
+                    ui.update_select(id="ind_text_sup_color",label="Individus supplémentaires",choices=[c for c in CSS4_NAMES if c != excluded],selected="blue")
             elif hasattr(model,"quali_sup_"):
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.ind_text_quali_sup_color()]},selected="black")
+                    excluded = input.ind_text_quali_sup_color()
+                    ui.update_select(id="ind_text_actif_color",label="Individus actifs",choices=[c for c in CSS4_NAMES if c != excluded],selected="black")
                 
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="ind_text_quali_sup_color",label="Modalités supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.ind_text_actif_color()]},selected="red")
+                    excluded = input.ind_text_actif_color()
+                    ui.update_select(id="ind_text_quali_sup_color",label="Modalités supplémentaires",choices=[c for c in CSS4_NAMES if c != excluded],selected="red")
 
             #-------------------------------------------------------------------------------------------------
             if hasattr(model,"quali_sup_"):
@@ -315,16 +321,18 @@ class PCAshiny(Base):
             if hasattr(model, "quanti_sup_"):
                 @render.ui
                 def var_text_sup():
-                        return ui.TagList(ui.input_select(id="var_text_sup_color",label="Variables supplémentaires",choices={x:x for x in mcolors.CSS4_COLORS},selected="blue",multiple=False,width="100%"))
+                        return ui.TagList(ui.input_select(id="var_text_sup_color",label="Variables supplémentaires",choices=CSS4_DICT,selected="blue",multiple=False,width="100%"))
                 
                 # Disable quantitative variable colors
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="var_text_actif_color",label="Variables quantitatives actives",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.var_text_sup_color()]},selected="black")
+                    excluded = input.var_text_sup_color()
+                    ui.update_select(id="var_text_actif_color",label="Variables quantitatives actives",choices=[c for c in CSS4_NAMES if c != excluded],selected="black")
                 
                 @reactive.Effect
                 def _():
-                    ui.update_select(id="var_text_sup_color",label="Variables quantitatives supplémentaires",choices={x:x for x in [i for i in mcolors.CSS4_COLORS if i != input.var_text_actif_color()]},selected="blue")
+                    excluded = input.var_text_actif_color()
+                    ui.update_select(id="var_text_sup_color",label="Variables quantitatives supplémentaires",choices=[c for c in CSS4_NAMES if c != excluded],selected="blue")
                     
             #--------------------------------------------------------------------------------
             ## Individuals - PCA
@@ -415,7 +423,7 @@ class PCAshiny(Base):
                                        habillage= input.ind_text_var_qual_color(),
                                        add_ellipses=input.ind_text_add_ellipse(),
                                        repel=input.ind_plot_repel())
-                return fig+pn.theme_gray()
+                return fig+PLOT_THEME
 
             # Individual - PCA
             @render.plot(alt="Individuals - PCA")
@@ -471,7 +479,7 @@ class PCAshiny(Base):
                                        text_size=input.var_text_size(),
                                        lim_contrib = input.var_lim_contrib(),
                                        lim_cos2 = input.var_lim_cos2())
-                return fig+pn.theme_gray()
+                return fig+PLOT_THEME
 
             # Variables Factor Map - PCA
             @render.plot(alt="Correlation circle - PCA")
@@ -484,7 +492,7 @@ class PCAshiny(Base):
             # Reactive Scree plot
             @reactive.Calc
             def plot_eigen():
-                return fviz_eig(self=model,choice=input.fviz_eigen_choice(),add_labels=input.fviz_eigen_label(),ggtheme=pn.theme_gray())
+                return fviz_eig(self=model,choice=input.fviz_eigen_choice(),add_labels=input.fviz_eigen_label(),ggtheme=PLOT_THEME)
 
             # Render Scree plot
             @render.plot(alt="Scree Plot - PCA")
@@ -523,7 +531,7 @@ class PCAshiny(Base):
             
             @reactive.Calc
             def var_contrib_plot():
-                fig = fviz_contrib(self=model,choice="var",axis=input.var_contrib_axis(),top_contrib=int(input.var_contrib_top()),color=input.var_contrib_color(),bar_width=input.var_contrib_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_contrib(self=model,choice="var",axis=input.var_contrib_axis(),top_contrib=int(input.var_contrib_top()),color=input.var_contrib_color(),bar_width=input.var_contrib_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot variables Contributions
@@ -546,7 +554,7 @@ class PCAshiny(Base):
             
             @reactive.Calc
             def var_cos2_plot():
-                fig = fviz_cos2(self=model,choice="var",axis=input.var_cos2_axis(),top_cos2=int(input.var_cos2_top()),color=input.var_cos2_color(),bar_width=input.var_cos2_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_cos2(self=model,choice="var",axis=input.var_cos2_axis(),top_cos2=int(input.var_cos2_top()),color=input.var_cos2_color(),bar_width=input.var_cos2_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot variables Cos2
@@ -647,7 +655,7 @@ class PCAshiny(Base):
             
             @reactive.Calc
             def ind_contrib_plot():
-                fig = fviz_contrib(self=model,choice="ind",axis=input.ind_contrib_axis(),top_contrib=int(input.ind_contrib_top()),color = input.ind_contrib_color(),bar_width= input.ind_contrib_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_contrib(self=model,choice="ind",axis=input.ind_contrib_axis(),top_contrib=int(input.ind_contrib_top()),color = input.ind_contrib_color(),bar_width= input.ind_contrib_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot Individuals Contributions
@@ -670,7 +678,7 @@ class PCAshiny(Base):
             
             @reactive.Calc
             def ind_cos2_plot():
-                fig = fviz_cos2(self=model,choice="ind",axis=input.ind_cos2_axis(),top_cos2=int(input.ind_cos2_top()),color=input.ind_cos2_color(),bar_width=input.ind_cos2_bar_width(),ggtheme=pn.theme_gray())
+                fig = fviz_cos2(self=model,choice="ind",axis=input.ind_cos2_axis(),top_cos2=int(input.ind_cos2_top()),color=input.ind_cos2_color(),bar_width=input.ind_cos2_bar_width(),ggtheme=PLOT_THEME)
                 return fig
 
             # Plot variables Cos2
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+pytest.importorskip("shiny")
+scientisttools = pytest.importorskip("scientisttools")
+
+import numpy as np
+import pandas as pd
+from scientistshiny.famd import FAMDshiny, _IndState, _build_ind_fig, _thin_individuals
+
+MAX_POINTS = 10
+
+@pytest.fixture(scope="module")
+def res_famd():
+    autos = scientisttools.load_autos()
+    return scientisttools.FAMD(ind_sup=list(range(35,40)),quanti_sup=[10,11],quali_sup=14,parallelize=False).fit(autos)
+
+def ind_state(lim_contrib=None,lim_cos2=None):
+    return _IndState(0,1,"actif/sup","black","green","blue","red",None,None,None,None,8,lim_contrib,lim_cos2,"Individuals - FAMD",False)
+
+def test_thin_individuals_keeps_max_points(res_famd):
+    thinned = _thin_individuals(res_famd,0,1,MAX_POINTS)
+    active = res_famd.ind_["coord"].index
+    kept = thinned.ind_["coord"].index
+    assert len(kept) == MAX_POINTS
+    # Kept in the order of the model
+    positions = active.get_indexer(kept)
+    assert (positions >= 0).all() and (np.diff(positions) > 0).all()
+    # The individuals results, the data and the weights are restricted alike, the model is left untouched
+    assert thinned.call_["X"].equals(res_famd.call_["X"].iloc[positions])
+    assert thinned.ind_["dist"].equals(res_famd.ind_["dist"].iloc[positions])
+    for full, results in [(res_famd.ind_,thinned.ind_),(res_famd.call_,thinned.call_)]:
+        for k, v in full.items():
+            if isinstance(v,(pd.DataFrame,pd.Series)) and v.index.equals(active):
+                assert results[k].equals(v.iloc[positions]), k
+            elif isinstance(v,np.ndarray) and v.ndim > 0 and v.shape[0] == len(active):
+                assert np.array_equal(results[k],v[positions]), k
+    # The supplementary individuals are kept in the whole data
+    ind_sup = res_famd.ind_sup_["coord"].index
+    assert thinned.call_["Xtot"].index.equals(res_famd.call_["Xtot"].index[res_famd.call_["Xtot"].index.isin(kept.append(ind_sup))])
+    assert res_famd.ind_["coord"].shape[0] > MAX_POINTS
+    # The best represented individual on the plane is kept
+    assert res_famd.ind_["cos2"].iloc[:,[0,1]].sum(axis=1).idxmax() in kept
+    # Same axes, same subsample
+    assert _thin_individuals(res_famd,0,1,MAX_POINTS).ind_["coord"].index.equals(kept)
+
+def test_thin_individuals_small_model(res_famd):
+    assert _thin_individuals(res_famd,0,1,res_famd.ind_["coord"].shape[0]) is res_famd
+
+def test_ind_fig_max_points_with_lim_contrib(res_famd):
+    thinned = _thin_individuals(res_famd,0,1,MAX_POINTS)
+    lim_contrib = 5
+    fig = _build_ind_fig(thinned,ind_state(lim_contrib=lim_contrib)).draw()
+    drawn = {t.get_text() for ax in fig.axes for t in ax.texts}
+    # Active individuals drawn : the kept ones over the contributions limit on the plane, none of the others
+    contrib = thinned.ind_["contrib"].iloc[:,[0,1]].sum(axis=1)
+    expected = set(contrib.index[contrib > lim_contrib])
+    assert expected
+    assert drawn.intersection(res_famd.ind_["coord"].index) == expected
+
+@pytest.mark.parametrize("max_points",[0,-1,2.5,"10",True])
+def test_famdshiny_rejects_invalid_max_points(res_famd,max_points):
+    with pytest.raises(ValueError,match="max_points"):
+        FAMDshiny(model=res_famd,max_points=max_points)
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+pytest.importorskip("shiny")
+pn = pytest.importorskip("plotnine")
+pd = pytest.importorskip("pandas")
+
+from shiny.render._try_render_plot import PlotSizeInfo, try_render_matplotlib
+from scientistshiny.function import draw_plot
+
+def test_draw_plot_keeps_dpi_on_hidpi():
+    plot = pn.ggplot(pd.DataFrame({"x" : [0,1,2],"y" : [1,0,2]}),pn.aes("x","y")) + pn.geom_point()
+    drawn = {}
+    # Output of 400 x 300 px on a display with a pixel ratio of 2, as render.plot does it
+    size_info = PlotSizeInfo((lambda : 400,lambda : 300),(None,None),pixelratio=2)
+    figure = draw_plot(plot,drawn)
+    dpi, size = figure.dpi, tuple(figure.get_size_inches())
+    for _ in range(3):
+        figure = draw_plot(plot,drawn)
+        # Same figure, drawn once
+        assert len(drawn) == 1 and drawn[plot][0] is figure
+        assert figure.dpi == dpi
+        assert tuple(figure.get_size_inches()) == size
+        ok, _ = try_render_matplotlib(figure,plot_size_info=size_info,allow_global=False,alt=None)
+        assert ok